@@ -0,0 +1,68 @@
+"""Graph breaks and latency of converted models compiled with torch.compile.
+
+Models are converted with convert(model) and convert(model, compile_friendly=True) and compiled with
+the default (inductor) backend. Graph breaks are counted by torch._dynamo.explain.
+
+Usage:
+
+    python -m benchmarks.compile_benchmark
+"""
+from typing import Callable
+
+import torch
+from torch.utils import benchmark
+
+from benchmarks.models import make_multihead_like
+from benchmarks.models import make_resnet_like
+from onnx2torch.converter import convert
+
+
+def _timeit(function: Callable, label: str, sub_label: str, description: str) -> benchmark.Measurement:
+    timer = benchmark.Timer(
+        stmt='function()',
+        globals={'function': function},
+        label=label,
+        sub_label=sub_label,
+        description=description,
+    )
+    return timer.blocked_autorange(min_run_time=1.0)
+
+
+def main() -> None:
+    models = {
+        'resnet_like (1x3x224x224)': (make_resnet_like(image_size=224), [1, 3, 224, 224]),
+        'multihead_like (128x256)': (make_multihead_like(), [128, 256]),
+    }
+
+    results = []
+    print(f'{"model":<30}{"graph breaks":>16}{"compile friendly":>18}')
+    for name, (onnx_model, input_shape) in models.items():
+        x = torch.randn(input_shape)
+        eager_model = convert(onnx_model).eval()
+        compile_friendly_model = convert(onnx_model, compile_friendly=True).eval()
+
+        graph_breaks = []
+        for model in (eager_model, compile_friendly_model):
+            torch._dynamo.reset()  # pylint: disable=protected-access
+            graph_breaks.append(torch._dynamo.explain(model)(x).graph_break_count)  # pylint: disable=protected-access
+
+        print(f'{name:<30}{graph_breaks[0]:>16}{graph_breaks[1]:>18}')
+
+        torch._dynamo.reset()  # pylint: disable=protected-access
+        with torch.no_grad():
+            for description, model in (
+                ('eager', eager_model),
+                ('compile', torch.compile(eager_model)),
+                ('compile, compile friendly', torch.compile(compile_friendly_model)),
+            ):
+                # The first calls compile the model
+                for _ in range(3):
+                    model(x)
+
+                results.append(_timeit(lambda m=model: m(x), 'Converted model latency', name, description))
+
+    benchmark.Compare(results).print()
+
+
+if __name__ == '__main__':
+    main()
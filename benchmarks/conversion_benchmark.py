@@ -0,0 +1,211 @@
+"""Conversion time and memory on synthetic model families of several sizes.
+
+Every model is saved to a file and processed in a new single-threaded process by stages:
+- load: onnx.load of the model file;
+- convert: onnx2torch.converter.convert;
+- forward: the first inference of the converted model.
+
+For every stage the suite reports wall time (minimum over runs), peak RSS growth during the stage
+(Linux: VmHWM is reset before every stage through /proc/self/clear_refs) and peak of memory traced
+by tracemalloc (Python and numpy allocations, torch allocations are not traced). tracemalloc slows down
+the stages, so it is measured in a separate process.
+
+Results are written as JSON. With --baseline the results are compared with stored ones and the suite
+exits with status 1 if any metric is worse than the baseline by more than the tolerance.
+
+Usage:
+
+    python -m benchmarks.conversion_benchmark --output results.json
+    python -m benchmarks.conversion_benchmark --output new.json --baseline results.json --tolerance 0.2
+    python -m benchmarks.conversion_benchmark --models resnet_like
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import onnx
+import torch
+import torch.multiprocessing as multiprocessing
+
+from benchmarks.memory import reset_peak_rss
+from benchmarks.memory import rss_mib
+from benchmarks.models import make_detection_head_like
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from onnx2torch.converter import convert
+
+MODELS: Dict[str, Callable[[], onnx.ModelProto]] = {
+    'resnet_like_s': lambda: make_resnet_like(),
+    'resnet_like_m': lambda: make_resnet_like(image_size=224, stage_channels=(64, 128, 256, 512)),
+    'resnet_like_l': lambda: make_resnet_like(image_size=224, stage_channels=(64, 128, 256, 512), blocks_per_stage=4),
+    'transformer_like_s': lambda: make_transformer_like(hidden_size=128, ffn_size=512, num_layers=2),
+    'transformer_like_m': lambda: make_transformer_like(),
+    'transformer_like_l': lambda: make_transformer_like(hidden_size=512, ffn_size=2048, num_layers=8),
+    'detection_head_like_s': lambda: make_detection_head_like(),
+    'detection_head_like_m': lambda: make_detection_head_like(image_size=256, channels=128, num_levels=4),
+    'detection_head_like_l': lambda: make_detection_head_like(
+        image_size=512,
+        channels=256,
+        num_levels=5,
+        tower_depth=4,
+    ),
+}
+STAGES = ('load', 'convert', 'forward')
+
+# Differences below these values are measurement noise, they are not reported as regressions
+_ABSOLUTE_THRESHOLDS = {
+    'time_ms': 1.0,
+    'peak_rss_mib': 2.0,
+    'tracemalloc_peak_mib': 0.5,
+}
+
+
+def _run_stages(model_path: str) -> Dict[str, Callable[[], Any]]:
+    state: Dict[str, Any] = {}
+
+    def load():
+        state['onnx_model'] = onnx.load(model_path)
+
+    def convert_model():
+        state['model'] = convert(state['onnx_model'])
+
+    def forward():
+        inputs = [
+            torch.rand([dim.dim_value for dim in graph_input.type.tensor_type.shape.dim])
+            for graph_input in state['onnx_model'].graph.input
+        ]
+        with torch.no_grad():
+            state['model'](*inputs)
+
+    return {'load': load, 'convert': convert_model, 'forward': forward}
+
+
+def _worker(model_path: str, num_runs: int, trace: bool, results) -> None:
+    torch.set_num_threads(1)
+    metrics: Dict[str, Dict[str, float]] = {stage: {} for stage in STAGES}
+    for run in range(num_runs):
+        for stage, function in _run_stages(model_path).items():
+            if trace:
+                tracemalloc.start()
+                function()
+                metrics[stage]['tracemalloc_peak_mib'] = tracemalloc.get_traced_memory()[1] / 2**20
+                tracemalloc.stop()
+                continue
+
+            rss = rss_mib('VmRSS')
+            reset_peak_rss()
+            start = time.perf_counter()
+            function()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            metrics[stage]['time_ms'] = min(metrics[stage].get('time_ms', elapsed_ms), elapsed_ms)
+            peak_rss = rss_mib('VmHWM')
+            if run == 0 and rss is not None and peak_rss is not None:
+                # Later runs reuse memory freed by the allocator, so only the first run is meaningful
+                metrics[stage]['peak_rss_mib'] = peak_rss - rss
+
+    results.put(metrics)
+
+
+def _measure(model_path: str, num_runs: int, trace: bool) -> Dict[str, Dict[str, float]]:
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_worker, args=(model_path, num_runs, trace, results))
+    process.start()
+    metrics = results.get()
+    process.join()
+    return metrics
+
+
+def run_benchmark(model_names: List[str], num_runs: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {
+        'torch': torch.__version__,
+        'onnx': onnx.__version__,
+        'models': {},
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in model_names:
+            onnx_model = MODELS[name]()
+            model_path = str(Path(tmp_dir) / f'{name}.onnx')
+            onnx.save(onnx_model, model_path)
+
+            stages = _measure(model_path, num_runs=num_runs, trace=False)
+            for stage, metrics in _measure(model_path, num_runs=1, trace=True).items():
+                stages[stage].update(metrics)
+
+            results['models'][name] = {
+                'num_nodes': len(onnx_model.graph.node),
+                'num_initializers': len(onnx_model.graph.initializer),
+                'stages': stages,
+            }
+            print_results({name: results['models'][name]})
+
+    return results
+
+
+def print_results(models: Dict[str, Any]) -> None:
+    for name, model in models.items():
+        print(f'{name} ({model["num_nodes"]} nodes, {model["num_initializers"]} initializers)')
+        for stage, metrics in model['stages'].items():
+            values = ', '.join(f'{key} {value:.2f}' for key, value in metrics.items())
+            print(f'    {stage:<10}{values}')
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Returns descriptions of metrics which are worse than baseline by more than tolerance (relative)."""
+    regressions = []
+    for name, model in results['models'].items():
+        baseline_model = baseline['models'].get(name)
+        if baseline_model is None:
+            continue
+
+        for stage, metrics in model['stages'].items():
+            for key, value in metrics.items():
+                baseline_value = baseline_model['stages'].get(stage, {}).get(key)
+                if baseline_value is None:
+                    continue
+
+                if value > baseline_value * (1 + tolerance) and value - baseline_value > _ABSOLUTE_THRESHOLDS[key]:
+                    regressions.append(f'{name} {stage} {key}: {baseline_value:.2f} -> {value:.2f}')
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', nargs='*', default=None, help='Model names or their prefixes, all by default')
+    parser.add_argument('--runs', type=int, default=3, help='Number of runs, time is the minimum over runs')
+    parser.add_argument('--output', type=Path, default=None, help='Path of JSON file with results')
+    parser.add_argument('--baseline', type=Path, default=None, help='Path of JSON file with baseline results')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='Relative tolerance of the comparison')
+    args = parser.parse_args()
+
+    model_names = [
+        name for name in MODELS
+        if args.models is None or any(name.startswith(prefix) for prefix in args.models)
+    ]
+    results = run_benchmark(model_names, num_runs=args.runs)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.baseline is not None:
+        regressions = compare(results, json.loads(args.baseline.read_text()), tolerance=args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+
+        if regressions:
+            sys.exit(1)
+
+        print('No regressions')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Import time of onnx2torch and time of the first conversion.
+
+Each measurement runs in a new interpreter. Converter modules are imported on first use,
+so the first conversion includes imports of converters used by the model.
+
+Usage:
+
+    python -m benchmarks.import_benchmark
+"""
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import onnx
+
+from benchmarks.models import make_resnet_like
+
+_NUM_RUNS = 5
+
+_IMPORT_SCRIPT = '''
+import sys
+import time
+import torch
+import onnx
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, len(sys.modules), 'torchvision' in sys.modules)
+'''
+
+_STATEMENTS = {
+    'import onnx2torch.converter': 'from onnx2torch.converter import convert',
+    'import all converters': (
+        'from onnx2torch.converter import convert\n'
+        'from onnx2torch.node_converters import import_converter_modules\n'
+        'import_converter_modules()'
+    ),
+}
+
+_CONVERT_SCRIPT = '''
+import time
+import onnx
+from onnx2torch.converter import convert
+model = onnx.load({model_path!r})
+start = time.perf_counter()
+convert(model)
+first_time = time.perf_counter() - start
+start = time.perf_counter()
+convert(model)
+print(first_time, time.perf_counter() - start)
+'''
+
+
+def _run(script: str) -> list:
+    # Minimum over runs for every value
+    results = []
+    for _ in range(_NUM_RUNS):
+        result = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True)
+        results.append([eval(value) for value in result.stdout.split()])  # pylint: disable=eval-used
+
+    return [min(values) for values in zip(*results)]
+
+
+def main() -> None:
+    print('import time after import of torch and onnx')
+    print(f'{"":<28}{"time, ms":>12}{"modules":>12}{"torchvision":>14}')
+    for name, statement in _STATEMENTS.items():
+        import_time, num_modules, torchvision_imported = _run(_IMPORT_SCRIPT.format(statement=statement))
+        print(f'{name:<28}{import_time * 1000:>12.1f}{num_modules:>12}{str(torchvision_imported):>14}')
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = str(Path(tmp_dir) / 'model.onnx')
+        onnx.save(make_resnet_like(), model_path)
+        first_time, second_time = _run(_CONVERT_SCRIPT.format(model_path=model_path))
+        print(f'resnet_like convert: first {first_time * 1000:.1f} ms, second {second_time * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Activation memory of converted models with and without in-place execution plan.
+
+Peak activation memory and number of allocated activation storages are counted by running
+the GraphModule node by node: a storage is allocated when a node output has storage not seen before,
+and it is released after the last use of all values referencing it. Inputs and weights are not counted.
+
+Usage:
+
+    python -m benchmarks.inplace_benchmark
+"""
+from typing import Any
+from typing import Dict
+from typing import NamedTuple
+from typing import Set
+
+import torch
+from torch import fx
+from torch.utils._pytree import tree_flatten
+
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from onnx2torch.converter import convert
+from onnx2torch.passes import plan_inplace
+
+
+class ActivationMemoryStats(NamedTuple):
+    peak_bytes: int
+    num_allocations: int
+
+
+class _ActivationMemoryInterpreter(fx.Interpreter):
+
+    def __init__(self, graph_module: fx.GraphModule):
+        super().__init__(graph_module)
+        position = {node: i for i, node in enumerate(graph_module.graph.nodes)}
+        self._release_after: Dict[fx.Node, list] = {}
+        for node in position:
+            last_user = max(node.users, key=position.get, default=node)
+            self._release_after.setdefault(last_user, []).append(node)
+
+        self._external: Set[int] = set()
+        self._node_storages: Dict[fx.Node, Set[int]] = {}
+        self._storage_refs: Dict[int, int] = {}
+        self._storage_bytes: Dict[int, int] = {}
+        self.live_bytes = 0
+        self.peak_bytes = 0
+        self.num_allocations = 0
+
+    @staticmethod
+    def _storages(value: Any) -> Dict[int, int]:
+        storages = {}
+        for tensor in tree_flatten(value)[0]:
+            if isinstance(tensor, torch.Tensor):
+                storage = tensor.untyped_storage()
+                storages[storage.data_ptr()] = storage.nbytes()
+
+        return storages
+
+    def run_node(self, n: fx.Node) -> Any:
+        result = super().run_node(n)
+        storages = self._storages(result)
+
+        if n.op in ('placeholder', 'get_attr'):
+            self._external.update(storages)
+            return result
+
+        storages = {ptr: nbytes for ptr, nbytes in storages.items() if ptr not in self._external}
+        for ptr, nbytes in storages.items():
+            if ptr not in self._storage_refs:
+                self._storage_refs[ptr] = 0
+                self._storage_bytes[ptr] = nbytes
+                self.live_bytes += nbytes
+                self.num_allocations += 1
+
+            self._storage_refs[ptr] += 1
+
+        self._node_storages[n] = set(storages)
+        self.peak_bytes = max(self.peak_bytes, self.live_bytes)
+
+        for dead_node in self._release_after.get(n, []):
+            for ptr in self._node_storages.pop(dead_node, ()):
+                self._storage_refs[ptr] -= 1
+                if self._storage_refs[ptr] == 0:
+                    del self._storage_refs[ptr]
+                    self.live_bytes -= self._storage_bytes.pop(ptr)
+
+        return result
+
+
+def measure_activation_memory(graph_module: fx.GraphModule, *args: torch.Tensor) -> ActivationMemoryStats:
+    interpreter = _ActivationMemoryInterpreter(graph_module)
+    with torch.no_grad():
+        interpreter.run(*args)
+
+    return ActivationMemoryStats(peak_bytes=interpreter.peak_bytes, num_allocations=interpreter.num_allocations)
+
+
+def main() -> None:
+    models = {
+        'resnet_like (1x3x224x224)': (make_resnet_like(image_size=224), [1, 3, 224, 224]),
+        'resnet_like (8x3x112x112)': (make_resnet_like(batch_size=8, image_size=112), [8, 3, 112, 112]),
+        'transformer_like (512x512)': (make_transformer_like(num_tokens=512, hidden_size=512, ffn_size=2048), [512, 512]),
+    }
+
+    print(f'{"model":<30}{"peak, MiB":>22}{"allocations":>22}{"in-place nodes":>16}')
+    for name, (onnx_model, input_shape) in models.items():
+        x = torch.randn(input_shape)
+        torch_model = convert(onnx_model)
+        before = measure_activation_memory(torch_model, x)
+        inplace_nodes = plan_inplace(torch_model)
+        after = measure_activation_memory(torch_model, x)
+
+        peak = f'{before.peak_bytes / 2**20:.1f} -> {after.peak_bytes / 2**20:.1f}'
+        allocations = f'{before.num_allocations} -> {after.num_allocations}'
+        print(f'{name:<30}{peak:>22}{allocations:>22}{len(inplace_nodes):>16}')
+
+
+if __name__ == '__main__':
+    main()
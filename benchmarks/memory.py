@@ -0,0 +1,24 @@
+"""Peak RSS of the current process (Linux, /proc/self), values are None on other platforms."""
+from typing import Optional
+
+
+def rss_mib(field: str = 'VmRSS') -> Optional[float]:
+    """Memory field of /proc/self/status in MiB: VmRSS is current RSS, VmHWM is peak RSS."""
+    try:
+        with open('/proc/self/status', 'r') as file:
+            for line in file:
+                if line.startswith(f'{field}:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    return None
+
+
+def reset_peak_rss() -> None:
+    # Writing 5 to clear_refs resets VmHWM (peak RSS) of the process to its current RSS
+    try:
+        with open('/proc/self/clear_refs', 'w') as file:
+            file.write('5')
+    except OSError:
+        pass
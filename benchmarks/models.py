@@ -0,0 +1,257 @@
+"""Synthetic ONNX models for benchmarks.
+
+Models are built with onnx.helper from operations supported by onnx2torch, weights are random.
+"""
+from typing import Dict
+from typing import List
+from typing import Sequence
+
+import numpy as np
+import onnx
+from onnx import TensorProto
+from onnx import helper
+from onnx import numpy_helper
+from onnx.onnx_ml_pb2 import ModelProto
+
+
+class _ModelBuilder:
+
+    def __init__(self, seed: int = 0):
+        self._nodes: List[onnx.NodeProto] = []
+        self._initializers: List[onnx.TensorProto] = []
+        self._counters: Dict[str, int] = {}
+        self._random = np.random.default_rng(seed)
+
+    def _unique_name(self, prefix: str) -> str:
+        counter = self._counters.setdefault(prefix, 0)
+        self._counters[prefix] += 1
+        return f'{prefix}_{counter}'
+
+    def initializer(self, array: np.ndarray, prefix: str = 'weight') -> str:
+        name = self._unique_name(prefix)
+        self._initializers.append(numpy_helper.from_array(array, name=name))
+        return name
+
+    def random_initializer(self, shape: Sequence[int], scale: float = 0.1, prefix: str = 'weight') -> str:
+        array = self._random.uniform(low=-scale, high=scale, size=shape).astype(np.float32)
+        return self.initializer(array, prefix=prefix)
+
+    def node(self, op_type: str, inputs: Sequence[str], num_outputs: int = 1, **attributes) -> List[str]:
+        outputs = [self._unique_name(op_type.lower()) for _ in range(num_outputs)]
+        self._nodes.append(helper.make_node(op_type, inputs=list(inputs), outputs=outputs, **attributes))
+        return outputs
+
+    def build(self, inputs: Dict[str, Sequence[int]], outputs: Sequence[str], opset_version: int = 13) -> ModelProto:
+        graph = helper.make_graph(
+            nodes=self._nodes,
+            name='benchmark_graph',
+            inputs=[helper.make_tensor_value_info(name, TensorProto.FLOAT, shape) for name, shape in inputs.items()],
+            outputs=[helper.make_tensor_value_info(name, TensorProto.FLOAT, None) for name in outputs],
+            initializer=self._initializers,
+        )
+        model = helper.make_model(graph, opset_imports=[helper.make_operatorsetid('', opset_version)])
+        return onnx.shape_inference.infer_shapes(model)
+
+
+def _conv_bn(builder: _ModelBuilder, x: str, in_channels: int, out_channels: int, kernel: int, stride: int) -> str:
+    pad = kernel // 2
+    weight = builder.random_initializer([out_channels, in_channels, kernel, kernel])
+    (x,) = builder.node('Conv', [x, weight], kernel_shape=[kernel, kernel], strides=[stride, stride], pads=[pad] * 4)
+
+    scale = builder.initializer(np.ones(out_channels, dtype=np.float32))
+    bias = builder.initializer(np.zeros(out_channels, dtype=np.float32))
+    mean = builder.random_initializer([out_channels])
+    var = builder.initializer(np.ones(out_channels, dtype=np.float32))
+    (x,) = builder.node('BatchNormalization', [x, scale, bias, mean, var])
+    return x
+
+
+def make_resnet_like(
+        batch_size: int = 1,
+        image_size: int = 64,
+        stage_channels: Sequence[int] = (16, 32, 64),
+        blocks_per_stage: int = 2,
+        num_classes: int = 10,
+) -> ModelProto:
+    """ResNet-like CNN: Conv-BN-Relu basic blocks with residual Add, global pooling and Gemm classifier."""
+    builder = _ModelBuilder()
+    x = _conv_bn(builder, 'input', 3, stage_channels[0], kernel=3, stride=1)
+    (x,) = builder.node('Relu', [x])
+
+    in_channels = stage_channels[0]
+    for stage, channels in enumerate(stage_channels):
+        for block in range(blocks_per_stage):
+            stride = 2 if stage > 0 and block == 0 else 1
+            y = _conv_bn(builder, x, in_channels, channels, kernel=3, stride=stride)
+            (y,) = builder.node('Relu', [y])
+            y = _conv_bn(builder, y, channels, channels, kernel=3, stride=1)
+
+            shortcut = x
+            if stride != 1 or in_channels != channels:
+                shortcut = _conv_bn(builder, x, in_channels, channels, kernel=1, stride=stride)
+
+            (x,) = builder.node('Add', [y, shortcut])
+            (x,) = builder.node('Relu', [x])
+            in_channels = channels
+
+    (x,) = builder.node('GlobalAveragePool', [x])
+    (x,) = builder.node('Flatten', [x], axis=1)
+    weight = builder.random_initializer([num_classes, in_channels])
+    bias = builder.random_initializer([num_classes])
+    (x,) = builder.node('Gemm', [x, weight, bias], transB=1)
+
+    return builder.build(inputs={'input': [batch_size, 3, image_size, image_size]}, outputs=[x])
+
+
+def _linear(builder: _ModelBuilder, x: str, in_features: int, out_features: int) -> str:
+    weight = builder.random_initializer([out_features, in_features])
+    bias = builder.random_initializer([out_features])
+    (x,) = builder.node('Gemm', [x, weight, bias], transB=1)
+    return x
+
+
+def _norm(builder: _ModelBuilder, x: str, hidden_size: int) -> str:
+    (mean,) = builder.node('ReduceMean', [x], axes=[-1])
+    (x,) = builder.node('Sub', [x, mean])
+    (x,) = builder.node('Mul', [x, builder.initializer(np.ones(hidden_size, dtype=np.float32))])
+    (x,) = builder.node('Add', [x, builder.initializer(np.zeros(hidden_size, dtype=np.float32))])
+    return x
+
+
+def make_transformer_like(
+        num_tokens: int = 128,
+        hidden_size: int = 256,
+        ffn_size: int = 1024,
+        num_layers: int = 4,
+) -> ModelProto:
+    """Transformer-style encoder on [tokens, hidden] activations.
+
+    Every layer has a gated token mixer (Gemm, Sigmoid gate, Mul), a Relu feed-forward block, residual Add
+    and mean-centering normalization. Attention is approximated by Gemm blocks and Softmax gating, as batched
+    MatMul is not converted by onnx2torch.
+    """
+    builder = _ModelBuilder()
+    x = 'input'
+    for _ in range(num_layers):
+        y = _norm(builder, x, hidden_size)
+        value = _linear(builder, y, hidden_size, hidden_size)
+        (gate,) = builder.node('Sigmoid', [_linear(builder, y, hidden_size, hidden_size)])
+        (scores,) = builder.node('Softmax', [_linear(builder, y, hidden_size, hidden_size)], axis=-1)
+        (y,) = builder.node('Mul', [value, gate])
+        (y,) = builder.node('Mul', [y, scores])
+        (x,) = builder.node('Add', [x, _linear(builder, y, hidden_size, hidden_size)])
+
+        y = _norm(builder, x, hidden_size)
+        (y,) = builder.node('Relu', [_linear(builder, y, hidden_size, ffn_size)])
+        (x,) = builder.node('Add', [x, _linear(builder, y, ffn_size, hidden_size)])
+
+    return builder.build(inputs={'input': [num_tokens, hidden_size]}, outputs=[x])
+
+
+def make_multihead_like(
+        num_tokens: int = 128,
+        hidden_size: int = 256,
+        num_heads: int = 8,
+        num_layers: int = 4,
+) -> ModelProto:
+    """Transformer-style encoder with shape computations of exported PyTorch models.
+
+    Every layer splits activations into heads by Reshape with shape computed from Shape, Gather and Concat,
+    applies Softmax per head and merges heads back by Reshape to the shape of the layer input.
+    """
+    builder = _ModelBuilder()
+    index = builder.initializer(np.array(0, dtype=np.int64), prefix='index')
+    axes = builder.initializer(np.array([0], dtype=np.int64), prefix='axes')
+    heads = builder.initializer(np.array([num_heads, -1], dtype=np.int64), prefix='heads')
+
+    x = 'input'
+    for _ in range(num_layers):
+        (shape,) = builder.node('Shape', [x])
+        (tokens,) = builder.node('Gather', [shape, index], axis=0)
+        (tokens,) = builder.node('Unsqueeze', [tokens, axes])
+        (heads_shape,) = builder.node('Concat', [tokens, heads], axis=0)
+
+        (y,) = builder.node('Reshape', [_linear(builder, x, hidden_size, hidden_size), heads_shape])
+        (y,) = builder.node('Softmax', [y], axis=-1)
+        (y,) = builder.node('Reshape', [y, shape])
+        (x,) = builder.node('Add', [x, _linear(builder, y, hidden_size, hidden_size)])
+
+    return builder.build(inputs={'input': [num_tokens, hidden_size]}, outputs=[x])
+
+
+def make_inception_like(
+        batch_size: int = 1,
+        image_size: int = 64,
+        channels: int = 32,
+        num_blocks: int = 3,
+        num_branches: int = 4,
+) -> ModelProto:
+    """Inception-like CNN: blocks of parallel Conv-BN-Relu branches of growing depth joined by Concat.
+
+    Branch layers are emitted breadth-first (first layer of every branch, then second layer, ...),
+    which keeps wide activations of all branches alive at once unless nodes are reordered.
+    """
+    builder = _ModelBuilder()
+    x = _conv_bn(builder, 'input', 3, channels, kernel=3, stride=1)
+    (x,) = builder.node('Relu', [x])
+
+    branch_channels = channels // num_branches
+    for _ in range(num_blocks):
+        # Every branch starts with wide 1x1 expansion which is reduced by following convs
+        branches = []
+        for _ in range(num_branches):
+            (y,) = builder.node('Relu', [_conv_bn(builder, x, channels, channels * 4, kernel=1, stride=1)])
+            branches.append(y)
+
+        for level in range(num_branches):
+            for branch in range(level, num_branches):
+                in_channels = channels * 4 if level == 0 else branch_channels
+                y = _conv_bn(builder, branches[branch], in_channels, branch_channels, kernel=3, stride=1)
+                (branches[branch],) = builder.node('Relu', [y])
+
+        (x,) = builder.node('Concat', branches, axis=1)
+
+    (x,) = builder.node('GlobalAveragePool', [x])
+    return builder.build(inputs={'input': [batch_size, 3, image_size, image_size]}, outputs=[x])
+
+
+def make_detection_head_like(
+        batch_size: int = 1,
+        image_size: int = 128,
+        channels: int = 64,
+        num_levels: int = 3,
+        tower_depth: int = 2,
+        num_anchors: int = 3,
+        num_classes: int = 20,
+) -> ModelProto:
+    """RetinaNet-like detector: strided Conv backbone levels with classification and box heads on every level.
+
+    Head outputs of every level are transposed to NHWC, reshaped to [batch, anchors, values] and concatenated
+    over levels, classification scores go through Sigmoid. Outputs are scores and boxes.
+    """
+    builder = _ModelBuilder()
+    x = _conv_bn(builder, 'input', 3, channels, kernel=3, stride=2)
+    (x,) = builder.node('Relu', [x])
+
+    scores, boxes = [], []
+    for _ in range(num_levels):
+        x = _conv_bn(builder, x, channels, channels, kernel=3, stride=2)
+        (x,) = builder.node('Relu', [x])
+
+        for outputs, num_values in ((scores, num_classes), (boxes, 4)):
+            y = x
+            for _ in range(tower_depth):
+                (y,) = builder.node('Relu', [_conv_bn(builder, y, channels, channels, kernel=3, stride=1)])
+
+            weight = builder.random_initializer([num_anchors * num_values, channels, 3, 3])
+            bias = builder.random_initializer([num_anchors * num_values])
+            (y,) = builder.node('Conv', [y, weight, bias], kernel_shape=[3, 3], pads=[1, 1, 1, 1])
+            (y,) = builder.node('Transpose', [y], perm=[0, 2, 3, 1])
+            shape = builder.initializer(np.array([batch_size, -1, num_values], dtype=np.int64), prefix='shape')
+            (y,) = builder.node('Reshape', [y, shape])
+            outputs.append(y)
+
+    (scores,) = builder.node('Concat', scores, axis=1)
+    (scores,) = builder.node('Sigmoid', [scores])
+    (boxes,) = builder.node('Concat', boxes, axis=1)
+    return builder.build(inputs={'input': [batch_size, 3, image_size, image_size]}, outputs=[scores, boxes])
@@ -0,0 +1,85 @@
+"""Microbenchmarks for Gather fast paths.
+
+Each specialized module is compared with generic OnnxGather (advanced indexing) on the same data.
+
+Usage:
+
+    python -m benchmarks.node_converters.gather_benchmark
+"""
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+import torch
+from torch.utils import benchmark
+
+from onnx2torch.node_converters.gather import OnnxGather
+from onnx2torch.node_converters.gather import OnnxGatherEmbedding
+from onnx2torch.node_converters.gather import OnnxGatherNarrow
+from onnx2torch.node_converters.gather import OnnxGatherSelect
+
+
+def _timeit(function: Callable, label: str, sub_label: str, description: str) -> benchmark.Measurement:
+    timer = benchmark.Timer(
+        stmt='function()',
+        globals={'function': function},
+        label=label,
+        sub_label=sub_label,
+        description=description,
+    )
+    return timer.blocked_autorange(min_run_time=0.5)
+
+
+def _select_cases() -> List[Tuple[str, Callable, Callable]]:
+    cases = []
+    for shape in ((4,), (8, 1024, 64), (64, 512, 512)):
+        x = torch.randn(shape)
+        index = torch.tensor(1)
+        generic, fast = OnnxGather(axis=0), OnnxGatherSelect(axis=0, index=1)
+        cases.append((str(shape), lambda g=generic, x=x, i=index: g(x, i), lambda f=fast, x=x: f(x)))
+
+    return cases
+
+
+def _narrow_cases() -> List[Tuple[str, Callable, Callable]]:
+    cases = []
+    for shape in ((8, 1024, 64), (64, 512, 512)):
+        x = torch.randn(shape)
+        length = shape[1] // 2
+        indices = torch.arange(1, 1 + length)
+        generic, fast = OnnxGather(axis=1), OnnxGatherNarrow(axis=1, start=1, length=length)
+        cases.append((str(shape), lambda g=generic, x=x, i=indices: g(x, i), lambda f=fast, x=x: f(x)))
+
+    return cases
+
+
+def _embedding_cases() -> List[Tuple[str, Callable, Callable]]:
+    cases = []
+    for num_embeddings, embedding_dim, batch_shape in ((30522, 768, (8, 128)), (50000, 1024, (32, 512))):
+        table = torch.randn(num_embeddings, embedding_dim)
+        indices = torch.randint(0, num_embeddings, batch_shape)
+        generic, fast = OnnxGather(axis=0), OnnxGatherEmbedding()
+        sub_label = f'{num_embeddings}x{embedding_dim}, {batch_shape}'
+        cases.append((sub_label, lambda g=generic, t=table, i=indices: g(t, i), lambda f=fast, t=table, i=indices: f(t, i)))
+
+    return cases
+
+
+def main() -> None:
+    torch.set_grad_enabled(False)
+
+    results = []
+    for label, cases in (
+            ('Gather scalar index (select)', _select_cases()),
+            ('Gather contiguous indices (narrow)', _narrow_cases()),
+            ('Gather constant table (embedding)', _embedding_cases()),
+    ):
+        for sub_label, generic, fast in cases:
+            results.append(_timeit(generic, label, sub_label, 'OnnxGather'))
+            results.append(_timeit(fast, label, sub_label, 'specialized'))
+
+    benchmark.Compare(results).print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Overhead of NodeProfiler in comparison with plain calls of converted models.
+
+Converted models (attach_onnx_mapping=True) run single-threaded under torch.no_grad, mean time of calls of
+the model and of the profiler are reported with the overhead per fx node. The profiler table of the last model
+is printed as an example of the report.
+
+Usage:
+
+    python -m benchmarks.profiler_benchmark
+"""
+import time
+from typing import Any
+from typing import Callable
+
+import torch
+
+from benchmarks.models import make_detection_head_like
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from onnx2torch.converter import convert
+from onnx2torch.profiler import NodeProfiler
+
+_NUM_WARMUP_RUNS = 5
+_NUM_RUNS = 50
+
+
+def _mean_time_ms(function: Callable[[], Any]) -> float:
+    for _ in range(_NUM_WARMUP_RUNS):
+        function()
+
+    start = time.perf_counter()
+    for _ in range(_NUM_RUNS):
+        function()
+
+    return (time.perf_counter() - start) / _NUM_RUNS * 1000
+
+
+def main() -> None:
+    torch.set_num_threads(1)
+    models = {
+        'resnet_like': (make_resnet_like(), [1, 3, 64, 64]),
+        'transformer_like': (make_transformer_like(), [128, 256]),
+        'detection_head_like': (make_detection_head_like(), [1, 3, 128, 128]),
+    }
+    print(f'{"time, ms":<24}{"nodes":>8}{"model":>12}{"profiler":>12}{"overhead, %":>14}{"per node, us":>14}')
+    with torch.no_grad():
+        for name, (onnx_model, input_shape) in models.items():
+            model = convert(onnx_model, attach_onnx_mapping=True)
+            profiler = NodeProfiler(model)
+            x = torch.rand(input_shape)
+            profiler(x)
+            num_nodes = len(profiler.profiles())
+
+            model_time = _mean_time_ms(lambda: model(x))  # pylint: disable=cell-var-from-loop
+            profiler_time = _mean_time_ms(lambda: profiler(x))  # pylint: disable=cell-var-from-loop
+            overhead = profiler_time - model_time
+            print(
+                f'{name:<24}{num_nodes:>8}{model_time:>12.2f}{profiler_time:>12.2f}'
+                f'{overhead / model_time * 100:>14.1f}{overhead / num_nodes * 1000:>14.1f}'
+            )
+
+    print()
+    print(profiler.table(limit=10))
+
+
+if __name__ == '__main__':
+    main()
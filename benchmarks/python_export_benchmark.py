@@ -0,0 +1,85 @@
+"""Startup time of a model converted from onnx and a model exported by export_python.
+
+Each way of loading runs in a new interpreter, the time includes imports:
+- convert: import onnx2torch, onnx.load and convert;
+- export_python: import of the generated module (torch only) and load_model.
+
+Usage:
+
+    python -m benchmarks.python_export_benchmark
+"""
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import onnx
+
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from onnx2torch.converter import convert
+from onnx2torch.python_export import export_python
+
+_NUM_RUNS = 5
+
+_IMPORT_TORCH_SCRIPT = '''
+import time
+start = time.perf_counter()
+import torch
+print(time.perf_counter() - start)
+'''
+
+_CONVERT_SCRIPT = '''
+import time
+start = time.perf_counter()
+import torch
+from onnx2torch.converter import convert
+model = convert({model_path!r})
+print(time.perf_counter() - start)
+'''
+
+_LOAD_SCRIPT = '''
+import sys
+import time
+start = time.perf_counter()
+import torch
+sys.path.insert(0, {directory!r})
+from model import load_model
+model = load_model()
+print(time.perf_counter() - start)
+'''
+
+
+def _startup_time(script: str) -> float:
+    times = []
+    for _ in range(_NUM_RUNS):
+        result = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True)
+        times.append(float(result.stdout.split()[-1]))
+
+    return min(times)
+
+
+def main() -> None:
+    models = {
+        'resnet_like': make_resnet_like(stage_channels=(64, 128, 256, 512)),
+        'transformer_like': make_transformer_like(),
+    }
+
+    # Import of torch is common for both ways of loading
+    torch_import_time = _startup_time(_IMPORT_TORCH_SCRIPT)
+    print(f'import torch: {torch_import_time * 1000:.0f} ms')
+    print(f'{"model":<20}{"convert, ms":>16}{"export_python, ms":>20}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, onnx_model in models.items():
+            model_path = str(Path(tmp_dir) / f'{name}.onnx')
+            onnx.save(onnx_model, model_path)
+            directory = Path(tmp_dir) / name
+            export_python(convert(model_path), directory)
+
+            convert_time = _startup_time(_CONVERT_SCRIPT.format(model_path=model_path))
+            load_time = _startup_time(_LOAD_SCRIPT.format(directory=str(directory)))
+            print(f'{name:<20}{convert_time * 1000:>16.0f}{load_time * 1000:>20.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""Inference latency, throughput and memory of converted models and onnxruntime on CPU.
+
+An onnx model file (--model, its first input dimension is the batch) or synthetic model families run
+in onnxruntime (CPUExecutionProvider) and as converted torch model (under torch.no_grad)
+for every batch size and number of threads. Every run is a new process, so peak memory of one runtime
+does not include the other one.
+
+Reported values:
+- p50 and p99 latency of repeated runs after warmup;
+- throughput, samples per second (batch size / mean latency);
+- peak memory, growth of peak RSS from the process start to the end of the runs (model, runtime buffers
+  and activations, Linux only).
+
+Usage:
+
+    python -m benchmarks.runtime_benchmark
+    python -m benchmarks.runtime_benchmark --model path/to/model.onnx --batch-sizes 1 8 --threads 1 4
+    python -m benchmarks.runtime_benchmark --models resnet_like --output results.json
+"""
+import argparse
+import json
+import queue
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import numpy as np
+import onnx
+import torch
+import torch.multiprocessing as multiprocessing
+
+from benchmarks.memory import reset_peak_rss
+from benchmarks.memory import rss_mib
+from benchmarks.models import make_detection_head_like
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from tests.utils.common import calc_ort_outputs
+from tests.utils.common import calc_torch_outputs
+
+# Model families by batch size, transformer batch is a number of sequences of 128 tokens
+MODELS: Dict[str, Callable[[int], onnx.ModelProto]] = {
+    'resnet_like': lambda batch_size: make_resnet_like(batch_size=batch_size, image_size=224),
+    'transformer_like': lambda batch_size: make_transformer_like(num_tokens=128 * batch_size),
+    'detection_head_like': lambda batch_size: make_detection_head_like(batch_size=batch_size),
+}
+RUNTIMES = ('onnxruntime', 'torch')
+
+
+def _with_batch_size(model: onnx.ModelProto, batch_size: int) -> onnx.ModelProto:
+    model = onnx.ModelProto.FromString(model.SerializeToString())
+    for value_info in model.graph.input:
+        value_info.type.tensor_type.shape.dim[0].dim_value = batch_size
+
+    for value_info in model.graph.output:
+        # Output shapes are inferred by runtimes
+        value_info.type.tensor_type.ClearField('shape')
+
+    del model.graph.value_info[:]
+    return model
+
+
+def _make_inputs(model: onnx.ModelProto) -> Dict[str, np.ndarray]:
+    random = np.random.default_rng(0)
+    inputs = {}
+    initializers = {initializer.name for initializer in model.graph.initializer}
+    for value_info in model.graph.input:
+        if value_info.name in initializers:
+            continue
+
+        tensor_type = value_info.type.tensor_type
+        shape = [dim.dim_value for dim in tensor_type.shape.dim]
+        dtype = onnx.helper.tensor_dtype_to_np_dtype(tensor_type.elem_type)
+        inputs[value_info.name] = random.uniform(size=shape).astype(dtype)
+
+    return inputs
+
+
+def _worker(runtime: str, model_path: str, num_threads: int, warmup: int, repeats: int, results) -> None:
+    model = onnx.load(model_path)
+    inputs = _make_inputs(model)
+    torch.set_num_threads(num_threads)
+
+    start_rss = rss_mib('VmRSS')
+    reset_peak_rss()
+    latencies: List[float] = []
+    if runtime == 'onnxruntime':
+        calc_ort_outputs(model, inputs, num_threads=num_threads, warmup=warmup, repeats=repeats, latencies=latencies)
+    else:
+        with torch.no_grad():
+            calc_torch_outputs(model, inputs, warmup=warmup, repeats=repeats, latencies=latencies)
+
+    peak_rss = rss_mib('VmHWM')
+    results.put({
+        'latencies': latencies,
+        'peak_memory_mib': None if start_rss is None or peak_rss is None else peak_rss - start_rss,
+    })
+
+
+def _measure(runtime: str, model_path: str, batch_size: int, num_threads: int, warmup: int, repeats: int) -> dict:
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_worker, args=(runtime, model_path, num_threads, warmup, repeats, results))
+    process.start()
+    # The queue is read before join, otherwise the worker blocks on flushing large results
+    while True:
+        try:
+            result = results.get(timeout=1.0)
+            break
+        except queue.Empty:
+            if not process.is_alive():
+                raise RuntimeError(f'{runtime} worker failed with exit code {process.exitcode}') from None
+
+    process.join()
+
+    latencies_ms = np.array(result['latencies']) * 1000
+    return {
+        'runtime': runtime,
+        'batch_size': batch_size,
+        'num_threads': num_threads,
+        'p50_ms': float(np.percentile(latencies_ms, 50)),
+        'p99_ms': float(np.percentile(latencies_ms, 99)),
+        'throughput': float(batch_size * 1000 / latencies_ms.mean()),
+        'peak_memory_mib': result['peak_memory_mib'],
+    }
+
+
+def _print_result(name: str, result: Dict[str, Any]) -> None:
+    memory = result['peak_memory_mib']
+    print(
+        f'{name:<22}{result["runtime"]:<14}{result["batch_size"]:>6}{result["num_threads"]:>9}'
+        f'{result["p50_ms"]:>11.2f}{result["p99_ms"]:>11.2f}{result["throughput"]:>13.1f}'
+        f'{"-" if memory is None else f"{memory:.1f}":>13}'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model', type=Path, default=None, help='Onnx model, synthetic models by default')
+    parser.add_argument('--models', nargs='*', default=list(MODELS), help='Synthetic model families')
+    parser.add_argument('--batch-sizes', nargs='*', type=int, default=[1, 8])
+    parser.add_argument('--threads', nargs='*', type=int, default=[1, 4])
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--output', type=Path, default=None, help='Path of JSON file with results')
+    args = parser.parse_args()
+
+    if args.model is not None:
+        onnx_model = onnx.load(args.model)
+        models = {args.model.stem: lambda batch_size: _with_batch_size(onnx_model, batch_size)}
+    else:
+        models = {name: MODELS[name] for name in args.models}
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    print(
+        f'{"model":<22}{"runtime":<14}{"batch":>6}{"threads":>9}{"p50, ms":>11}{"p99, ms":>11}'
+        f'{"samples/s":>13}{"memory, MiB":>13}'
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, make_model in models.items():
+            results[name] = []
+            for batch_size in args.batch_sizes:
+                model_path = str(Path(tmp_dir) / f'{name}_{batch_size}.onnx')
+                onnx.save(make_model(batch_size), model_path)
+                for num_threads in args.threads:
+                    for runtime in RUNTIMES:
+                        result = _measure(runtime, model_path, batch_size, num_threads, args.warmup, args.repeats)
+                        _print_result(name, result)
+                        results[name].append(result)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
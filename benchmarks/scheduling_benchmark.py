@@ -0,0 +1,28 @@
+"""Estimated peak activation memory of converted models before and after memory-aware scheduling.
+
+Usage:
+
+    python -m benchmarks.scheduling_benchmark
+"""
+from benchmarks.models import make_inception_like
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from onnx2torch.converter import convert
+from onnx2torch.passes import schedule_for_memory
+
+
+def main() -> None:
+    models = {
+        'inception_like (1x3x224x224)': make_inception_like(image_size=224),
+        'resnet_like (1x3x224x224)': make_resnet_like(image_size=224),
+        'transformer_like (512x512)': make_transformer_like(num_tokens=512, hidden_size=512, ffn_size=2048),
+    }
+
+    print(f'{"model":<32}{"original peak, MiB":>20}{"scheduled peak, MiB":>22}')
+    for name, onnx_model in models.items():
+        result = schedule_for_memory(convert(onnx_model), onnx_model)
+        print(f'{name:<32}{result.original_peak_bytes / 2**20:>20.1f}{result.peak_bytes / 2**20:>22.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Latency of converted models in eager mode (GraphModule) and compiled with TorchScript.
+
+Models are converted with convert(model) and convert(model, scriptable=True), the scripted model
+is additionally frozen (torch.jit.freeze) and optimized for inference, which folds weights and constants.
+
+Usage:
+
+    python -m benchmarks.scripting_benchmark
+"""
+from typing import Callable
+
+import torch
+from torch.utils import benchmark
+
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from onnx2torch.converter import convert
+
+
+def _timeit(function: Callable, label: str, sub_label: str, description: str) -> benchmark.Measurement:
+    timer = benchmark.Timer(
+        stmt='function()',
+        globals={'function': function},
+        label=label,
+        sub_label=sub_label,
+        description=description,
+    )
+    return timer.blocked_autorange(min_run_time=1.0)
+
+
+def main() -> None:
+    models = {
+        'resnet_like (1x3x224x224)': (make_resnet_like(image_size=224), [1, 3, 224, 224]),
+        'transformer_like (128x256)': (make_transformer_like(), [128, 256]),
+    }
+
+    results = []
+    for name, (onnx_model, input_shape) in models.items():
+        x = torch.randn(input_shape)
+        eager_model = convert(onnx_model).eval()
+        scripted_model = convert(onnx_model, scriptable=True).eval()
+        frozen_model = torch.jit.optimize_for_inference(torch.jit.freeze(scripted_model))
+
+        with torch.no_grad():
+            for description, model in (
+                ('eager', eager_model),
+                ('script', scripted_model),
+                ('script, frozen', frozen_model),
+            ):
+                # Warm up profiling executor of scripted models
+                for _ in range(3):
+                    model(x)
+
+                results.append(_timeit(lambda m=model: m(x), 'Converted model latency', name, description))
+
+    benchmark.Compare(results).print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Memory of inference worker processes with private and shared weights.
+
+Workers run inference of the same model with weights of four kinds:
+- private: every worker converts onnx model itself;
+- shared memory: the parent converts the model, calls share_weights and passes the model to workers;
+- file-backed: the parent saves the model with save_shared_weights, workers call load_shared_model;
+- file-backed, attach: workers convert onnx model and attach weights file with attach_shared_weights.
+
+Memory is reported as the sum of PSS (proportional set size, shared pages are divided between processes)
+of all workers alive at the same time minus PSS of the same number of idle workers, so it is comparable
+with the memory of a single model replica. Linux only (/proc/self/smaps_rollup).
+
+Usage:
+
+    python -m benchmarks.shared_weights_benchmark
+"""
+import tempfile
+from pathlib import Path
+from typing import Optional
+from typing import Union
+
+import onnx
+import torch
+import torch.multiprocessing as multiprocessing
+from torch import nn
+
+from benchmarks.models import make_resnet_like
+from onnx2torch.converter import convert
+from onnx2torch.shared_weights import SharedWeights
+from onnx2torch.shared_weights import attach_shared_weights
+from onnx2torch.shared_weights import load_shared_model
+from onnx2torch.shared_weights import save_shared_weights
+from onnx2torch.shared_weights import share_weights
+
+_NUM_WORKERS = 4
+_STAGE_CHANNELS = (64, 128, 256, 512)
+
+
+def _pss_bytes() -> int:
+    with open('/proc/self/smaps_rollup', 'r') as file:
+        for line in file:
+            if line.startswith('Pss:'):
+                return int(line.split()[1]) * 1024
+
+    raise RuntimeError('Pss is not found in /proc/self/smaps_rollup')
+
+
+def _worker(
+        model: Union[None, str, nn.Module, SharedWeights],
+        shared_weights: Optional[SharedWeights],
+        barrier,
+        results,
+) -> None:
+    torch.set_num_threads(1)
+    if isinstance(model, SharedWeights):
+        model = load_shared_model(model)
+    elif isinstance(model, str):
+        model = convert(model)
+        if shared_weights is not None:
+            attach_shared_weights(model, shared_weights)
+
+    if model is not None:
+        with torch.no_grad():
+            model(torch.rand(1, 3, 64, 64))
+
+    # All workers are alive when memory is measured, so shared pages are divided between them
+    barrier.wait()
+    results.put(_pss_bytes())
+    barrier.wait()
+
+
+def _run_workers(model: Union[None, str, nn.Module, SharedWeights], shared_weights: Optional[SharedWeights] = None) -> int:
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(_NUM_WORKERS)
+    results = context.Queue()
+    workers = [
+        context.Process(target=_worker, args=(model, shared_weights, barrier, results))
+        for _ in range(_NUM_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+
+    total_pss = sum(results.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+
+    return total_pss
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = str(Path(tmp_dir) / 'model.onnx')
+        onnx.save(make_resnet_like(stage_channels=_STAGE_CHANNELS), model_path)
+
+        shared_model = share_weights(convert(model_path))
+        weights_bytes = sum(tensor.numel() * tensor.element_size() for tensor in shared_model.state_dict().values())
+        shared_weights = save_shared_weights(convert(model_path), Path(tmp_dir) / 'weights.bin')
+
+        idle_pss = _run_workers(None)
+        print(f'weights: {weights_bytes / 2**20:.1f} MiB, workers: {_NUM_WORKERS}')
+        print(f'{"weights":<24}{"total PSS, MiB":>16}')
+        for name, model, worker_weights in (
+            ('private', model_path, None),
+            ('shared memory', shared_model, None),
+            ('file-backed', shared_weights, None),
+            ('file-backed, attach', model_path, shared_weights),
+        ):
+            total_pss = _run_workers(model, worker_weights) - idle_pss
+            print(f'{name:<24}{total_pss / 2**20:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Save, load and device transfer time of converted models with and without weight arena.
+
+Models are converted with convert(model) and convert(model, weight_arena=True):
+- separate tensors are saved with torch.save(state_dict) and loaded with torch.load and load_state_dict;
+- packed weights are saved with save_packed_weights and loaded with load_packed_weights (read and mmap).
+Device transfer (nn.Module.to and move_packed_weights) is measured if CUDA is available.
+
+Usage:
+
+    python -m benchmarks.weight_arena_benchmark
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import onnx
+import torch
+
+from benchmarks.models import make_resnet_like
+from benchmarks.models import make_transformer_like
+from onnx2torch.converter import convert
+from onnx2torch.weight_arena import load_packed_weights
+from onnx2torch.weight_arena import move_packed_weights
+from onnx2torch.weight_arena import save_packed_weights
+
+_NUM_RUNS = 5
+
+
+def _time_ms(function: Callable[[], None]) -> float:
+    times = []
+    for _ in range(_NUM_RUNS):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000
+
+
+def _to_cuda(function: Callable[[], None]) -> Callable[[], None]:
+    def synchronized() -> None:
+        function()
+        torch.cuda.synchronize()
+
+    return synchronized
+
+
+def _benchmark(name: str, onnx_model: onnx.ModelProto, tmp_dir: Path) -> None:
+    model = convert(onnx_model)
+    packed_model = convert(onnx_model, weight_arena=True)
+    num_tensors = len(model.state_dict())
+    state_dict_path, packed_path = tmp_dir / f'{name}.pt', tmp_dir / f'{name}.bin'
+
+    results = {
+        'save': (
+            _time_ms(lambda: torch.save(model.state_dict(), state_dict_path)),
+            _time_ms(lambda: save_packed_weights(packed_model, packed_path)),
+        ),
+        'load': (
+            _time_ms(lambda: model.load_state_dict(torch.load(state_dict_path))),
+            _time_ms(lambda: load_packed_weights(packed_model, packed_path)),
+        ),
+        'load, mmap': (
+            _time_ms(lambda: model.load_state_dict(torch.load(state_dict_path, mmap=True))),
+            _time_ms(lambda: load_packed_weights(packed_model, packed_path, mmap=True)),
+        ),
+    }
+    if torch.cuda.is_available():
+        results['to cuda'] = (
+            _time_ms(_to_cuda(lambda: model.cpu().to('cuda'))),
+            _time_ms(_to_cuda(lambda: move_packed_weights(move_packed_weights(packed_model, 'cpu'), 'cuda'))),
+        )
+
+    print(f'{name}: {num_tensors} tensors, {packed_path.stat().st_size / 2**20:.1f} MiB')
+    for operation, (separate_time, packed_time) in results.items():
+        print(f'    {operation:<16}{separate_time:>16.2f}{packed_time:>16.2f}')
+
+
+def main() -> None:
+    models = {
+        'resnet_like': make_resnet_like(stage_channels=(64, 128, 256, 512)),
+        'transformer_like': make_transformer_like(),
+    }
+    print(f'{"time, ms":<20}{"separate":>16}{"packed":>16}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, onnx_model in models.items():
+            _benchmark(name, onnx_model, Path(tmp_dir))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 from typing import Dict
 from typing import List
 from typing import NamedTuple
+from typing import Optional
 from typing import Tuple
 from typing import Union
 from warnings import catch_warnings
@@ -26,6 +27,37 @@ class OperationConverterResult(NamedTuple):
     onnx_mapping: OnnxMapping
 
 
+class OnnxListInputModule(nn.Module):
+    """Base class for modules of onnx operations with variable number of inputs.
+
+    Converter passes all inputs to forward as one list, TorchScript does not support forward with *args.
+    """
+
+
+def tensor_to_list(value: torch.Tensor) -> List[int]:
+    """Read integer tensor (shape, axes, repeats, ...) on host.
+
+    Shapes computed with Python ints (see onnx2torch.passes.compute_shapes_in_python) are lists already,
+    they are returned as is, so torch.compile traces the module without graph break.
+    """
+    if not torch.jit.is_scripting():
+        if isinstance(value, list):
+            return value
+
+    return torch.jit.annotate(List[int], value.tolist())
+
+
+def tensor_to_int(value: torch.Tensor) -> int:
+    """Read integer scalar or the first element of one-element integer tensor on host, see tensor_to_list."""
+    if not torch.jit.is_scripting():
+        if isinstance(value, int):
+            return value
+        if isinstance(value, list):
+            return value[0]
+
+    return int(value.reshape(-1)[0].item())
+
+
 def onnx_mapping_from_node(node: OnnxNode) -> OnnxMapping:
     return OnnxMapping(
         inputs=node.input_values,
@@ -40,6 +72,14 @@ def get_shape_from_value_info(value_info: ValueInfoProto) -> List[int]:
     ]
 
 
+def get_value_rank(name: str, graph: OnnxGraph) -> Optional[int]:
+    value_info = graph.value_info.get(name, None)
+    if value_info is None or not value_info.type.tensor_type.HasField('shape'):
+        return None
+
+    return len(value_info.type.tensor_type.shape.dim)
+
+
 def get_const_value(name: str, graph: OnnxGraph) -> Union[torch.Tensor, float, int, str, List]:
     if name in graph.initializers:
         return graph.initializers[name].to_torch()
@@ -1,5 +1,8 @@
+import operator
 from collections import OrderedDict
 from pathlib import Path
+from typing import Collection
+from typing import Optional
 from typing import Union
 
 import onnx
@@ -9,9 +12,13 @@ from onnx.shape_inference import infer_shapes
 from torch import fx
 from torch import nn
 
+from onnx2torch.common import OnnxListInputModule
 from onnx2torch.node_converters import get_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_graph import ValueType
+from onnx2torch.passes.precision import DEFAULT_FP32_OPERATIONS
+from onnx2torch.passes.precision import PRECISION_DTYPES
+from onnx2torch.passes.precision import convert_precision
 
 
 def _remove_initializers_from_input(model: ModelProto) -> ModelProto:
@@ -34,11 +41,21 @@ class InitializersContainer(nn.Module):
     def add_initializer(self, name: str, initializer: torch.Tensor) -> None:
         self.register_buffer(name, initializer)
 
+    @torch.jit.unused
     def forward(self, *args, **kwargs):  # pylint: disable=no-self-use
         raise RuntimeError('Got unexpected "forward" on constant container')
 
 
-def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mapping: bool = False):
+def convert(
+        onnx_model_or_path: Union[str, Path, ModelProto],
+        attach_onnx_mapping: bool = False,
+        precision: Optional[str] = None,
+        fp32_operations: Collection[str] = DEFAULT_FP32_OPERATIONS,
+        channels_last: bool = False,
+        scriptable: bool = False,
+        compile_friendly: bool = False,
+        weight_arena: bool = False,
+):
     """Convert model from onnx to PyTorch.
 
     This function build torch.fx GraphModule from onnx ModelProto using operations from the converter registry.
@@ -56,11 +73,29 @@ def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mappin
         Onnx ModelProto or model path to convert.
     attach_onnx_mapping:
         Whether to attach info about mapping to original onnx tensors names.
+    precision:
+        Reduced precision for weights and activations, 'bf16' or 'fp16'. Model inputs and outputs stay fp32.
+        If None, model runs in precision of onnx model.
+    fp32_operations:
+        Onnx operation types which run in fp32 in reduced precision mode.
+    channels_last:
+        Whether to run convolutional part of the model in channels_last memory format.
+        Model inputs and outputs keep contiguous (NCHW) format.
+    scriptable:
+        Whether to compile converted model with torch.jit.script. All converted modules are scriptable,
+        so the model can be saved with torch.jit.save and run without Python interpreter.
+    compile_friendly:
+        Whether to compute shapes (Shape and integer operations on its output) with Python ints,
+        so torch.compile traces the model without graph breaks on reading shapes on host.
+        Can not be used with scriptable.
+    weight_arena:
+        Whether to pack parameters and initializers into one contiguous storage per dtype, every weight is a view
+        into it. Packed weights are saved, loaded and moved to device at once, see onnx2torch.weight_arena.
 
     Returns
     -------
     :
-        PyTorch GraphModule
+        PyTorch GraphModule or ScriptModule if scriptable is True
     """
 
     if isinstance(onnx_model_or_path, ModelProto):
@@ -68,6 +103,12 @@ def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mappin
     else:
         onnx_model = onnx.load(onnx_model_or_path)
 
+    if scriptable and compile_friendly:
+        raise ValueError('Shapes computed with Python ints are not scriptable, use scriptable or compile_friendly')
+
+    if precision is not None and precision not in PRECISION_DTYPES:
+        raise ValueError(f'Got unexpected precision "{precision}", expected one of {tuple(PRECISION_DTYPES)}')
+
     if onnx_model.ir_version < 3:
         raise NotImplementedError(
             'Onnx IR is too old (minimal supported version is 3).'
@@ -87,6 +128,7 @@ def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mappin
     torch_modules = nn.Module()
     torch_modules.add_module('initializers', torch_initializers)
     torch_nodes = {}
+    fp32_nodes = []
 
     # create input nodes
     for name in onnx_graph.input_values:
@@ -107,6 +149,8 @@ def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mappin
             setattr(torch_module, 'onnx_mapping', onnx_mapping)
 
         torch_modules.add_module(name, torch_module)
+        if onnx_node.operation_type in fp32_operations:
+            fp32_nodes.append(name)
 
         args = []
         for value_name in onnx_mapping.inputs:
@@ -122,9 +166,8 @@ def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mappin
                 if len(onnx_node.output_values) > 1:
                     index = onnx_node.output_values.index(value_name)
                     torch_input_node = torch_graph.call_function(
-                        lambda x, index: x[index],
-                        args=tuple([torch_input_node, ]),
-                        kwargs={'index': index},
+                        operator.getitem,
+                        args=(torch_input_node, index),
                     )
                     torch_nodes[name + '_split_output'] = torch_input_node
                 args.append(torch_input_node)
@@ -138,6 +181,9 @@ def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mappin
             else:
                 RuntimeError(f'Got unexpected input value type ({value_type})')
 
+        if isinstance(torch_module, OnnxListInputModule):
+            args = [args]
+
         torch_nodes[name] = torch_graph.call_module(module_name=name, args=tuple(args))
 
     # Create output nodes
@@ -158,5 +204,23 @@ def convert(onnx_model_or_path: Union[str, Path, ModelProto], attach_onnx_mappin
 
     torch_graph.lint()
     torch_model = fx.GraphModule(root=torch_modules, graph=torch_graph)
+    if precision is not None:
+        convert_precision(torch_model, dtype=PRECISION_DTYPES[precision], fp32_nodes=fp32_nodes)
+
+    # Passes import converter modules they rewrite, they are imported on use to keep converters imported on demand
+    if channels_last:
+        from onnx2torch.passes.memory_format import convert_to_channels_last  # pylint: disable=import-outside-toplevel
+        convert_to_channels_last(torch_model)
+
+    if compile_friendly:
+        from onnx2torch.passes.shape_values import compute_shapes_in_python  # pylint: disable=import-outside-toplevel
+        compute_shapes_in_python(torch_model)
+
+    if weight_arena:
+        from onnx2torch.weight_arena import pack_weights  # pylint: disable=import-outside-toplevel
+        pack_weights(torch_model)
+
+    if scriptable:
+        return torch.jit.script(torch_model)
 
     return torch_model
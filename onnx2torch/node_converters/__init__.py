@@ -1,34 +1,21 @@
-from onnx2torch.node_converters.activations import *
-from onnx2torch.node_converters.batch_norm import *
-from onnx2torch.node_converters.binary_math_operations import *
-from onnx2torch.node_converters.cast import *
-from onnx2torch.node_converters.clip import *
-from onnx2torch.node_converters.comparisons import *
-from onnx2torch.node_converters.concat import *
-from onnx2torch.node_converters.constant import *
-from onnx2torch.node_converters.constant_of_shape import *
-from onnx2torch.node_converters.conv import *
-from onnx2torch.node_converters.expand import *
-from onnx2torch.node_converters.flatten import *
-from onnx2torch.node_converters.gather import *
-from onnx2torch.node_converters.gemm import *
-from onnx2torch.node_converters.global_average_pool import *
-from onnx2torch.node_converters.identity import *
-from onnx2torch.node_converters.max_pool import *
-from onnx2torch.node_converters.nms import *
-from onnx2torch.node_converters.range import *
-from onnx2torch.node_converters.reduce_max import *
-from onnx2torch.node_converters.reshape import *
-from onnx2torch.node_converters.scatter_nd import *
-from onnx2torch.node_converters.shape import *
-from onnx2torch.node_converters.slice import *
-from onnx2torch.node_converters.squeeze import *
-from onnx2torch.node_converters.tile import *
-from onnx2torch.node_converters.topk import *
-from onnx2torch.node_converters.transpose import *
-from onnx2torch.node_converters.unsqueeze import *
-from onnx2torch.node_converters.where import *
+from types import ModuleType
+from typing import Any
 
+from onnx2torch.node_converters.converter_index import import_converter_modules
 from onnx2torch.node_converters.registry import OperationDescription
 from onnx2torch.node_converters.registry import TConverter
 from onnx2torch.node_converters.registry import get_converter
+
+
+def __getattr__(name: str) -> Any:
+    # Converter modules are imported by get_converter on first use (see converter_index),
+    # their public names are still available as package attributes, e.g. onnx2torch.node_converters.OnnxShape
+    import_converter_modules()
+    if name in globals():
+        return globals()[name]
+
+    for module in list(globals().values()):
+        if isinstance(module, ModuleType) and name in getattr(module, '__all__', ()):
+            return getattr(module, name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
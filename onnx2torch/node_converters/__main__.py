@@ -0,0 +1,31 @@
+"""Update the index of converter modules (onnx2torch/node_converters/converter_index.py).
+
+Usage:
+
+    python -m onnx2torch.node_converters
+"""
+from pathlib import Path
+
+from onnx2torch.node_converters import converter_index
+from onnx2torch.node_converters.converter_index import import_converter_modules
+from onnx2torch.node_converters.registry import _CONVERTER_REGISTRY
+
+
+def main() -> None:
+    import_converter_modules()
+    lines = [
+        f'    ({description.domain!r}, {description.operation_type!r}, {description.version}): '
+        f'{converter.__module__.rpartition(".")[2]!r},'
+        for description, converter in sorted(_CONVERTER_REGISTRY.items())
+        if converter.__module__.startswith(f'{__package__}.')
+    ]
+
+    path = Path(converter_index.__file__)
+    source = path.read_text()
+    begin = source.index('\n', source.index('CONVERTER_MODULES: ')) + 1
+    end = source.index('}\n', begin)
+    path.write_text(source[:begin] + '\n'.join(lines) + '\n' + source[end:])
+
+
+if __name__ == '__main__':
+    main()
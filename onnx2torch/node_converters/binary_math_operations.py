@@ -1,37 +1,156 @@
 __all__ = [
     'OnnxBinaryMathOperation',
+    'OnnxScalarMathOperation',
+    'OnnxVariadicMathOperation',
 ]
 
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import torch
 from torch import nn
 
+from onnx2torch.common import OnnxListInputModule
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
+from onnx2torch.common import get_const_value
+from onnx2torch.common import get_value_rank
 from onnx2torch.common import onnx_mapping_from_node
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
-_TORCH_FUNCTION_FROM_ONNX_TYPE = {
-    'Add': torch.add,
-    'Sub': torch.sub,
-    'Mul': torch.mul,
-    'Div': torch.div,
+_COMMUTATIVE_OPERATIONS = ('Add', 'Mul')
+_INPLACE_OPERATIONS = ('Add', 'Sub', 'Mul', 'Div')
+
+_SCALAR_REDUCE_FROM_ONNX_TYPE = {
+    'Max': max,
+    'Min': min,
+    'Sum': sum,
+    'Mean': sum,
 }
 
+# Operations are dispatched by name instead of stored functions, so modules are scriptable
+
+
+def _math_operation(operation_type: str, first: torch.Tensor, second: torch.Tensor) -> torch.Tensor:
+    if operation_type == 'Add':
+        return torch.add(first, second)
+    if operation_type == 'Sub':
+        return torch.sub(first, second)
+    if operation_type == 'Mul':
+        return torch.mul(first, second)
+    if operation_type == 'Div':
+        return torch.div(first, second)
+    if operation_type == 'Pow':
+        # Onnx Pow output has type of the base
+        return torch.pow(first, second).to(first.dtype)
+    if operation_type == 'Mod':
+        return torch.remainder(first, second)
+    if operation_type == 'Fmod':
+        return torch.fmod(first, second)
+
+    raise ValueError('Unexpected operation type ' + operation_type)
+
+
+def _scalar_math_operation(operation_type: str, first: torch.Tensor, second: Union[float, int]) -> torch.Tensor:
+    if operation_type == 'Add':
+        return torch.add(first, second)
+    if operation_type == 'Sub':
+        return torch.sub(first, second)
+    if operation_type == 'Mul':
+        return torch.mul(first, second)
+    if operation_type == 'Div':
+        return torch.div(first, second)
+    if operation_type == 'Pow':
+        return torch.pow(first, second).to(first.dtype)
+    if operation_type == 'Mod':
+        return torch.remainder(first, second)
+    if operation_type == 'Fmod':
+        return torch.fmod(first, second)
+    if operation_type == 'Max':
+        return torch.clamp(first, min=second)
+    if operation_type == 'Min':
+        return torch.clamp(first, max=second)
+
+    raise ValueError('Unexpected operation type ' + operation_type)
+
+
+def _inplace_math_operation(operation_type: str, first: torch.Tensor, second: torch.Tensor) -> torch.Tensor:
+    # Result is written to the first operand only if it has output shape and dtype, otherwise new tensor is created
+    can_write = not (torch.is_grad_enabled() and first.requires_grad)
+    can_write = can_write and torch.result_type(first, second) == first.dtype
+    # div_ is true division, its result cannot be written to an integer tensor
+    can_write = can_write and (operation_type != 'Div' or first.is_floating_point())
+    can_write = can_write and torch.broadcast_shapes(first.shape, second.shape) == first.shape
+    if not can_write:
+        return _math_operation(operation_type, first, second)
+
+    if operation_type == 'Add':
+        return first.add_(second)
+    if operation_type == 'Sub':
+        return first.sub_(second)
+    if operation_type == 'Mul':
+        return first.mul_(second)
+
+    return first.div_(second)
+
+
+def _inplace_scalar_math_operation(operation_type: str, first: torch.Tensor, second: Union[float, int]) -> torch.Tensor:
+    can_write = not (torch.is_grad_enabled() and first.requires_grad)
+    can_write = can_write and torch.result_type(first, second) == first.dtype
+    can_write = can_write and (operation_type != 'Div' or first.is_floating_point())
+    if not can_write:
+        return _scalar_math_operation(operation_type, first, second)
+
+    if operation_type == 'Add':
+        return first.add_(second)
+    if operation_type == 'Sub':
+        return first.sub_(second)
+    if operation_type == 'Mul':
+        return first.mul_(second)
+
+    return first.div_(second)
+
+
+def _get_operation_type(operation_type: str, fmod: int) -> str:
+    if operation_type == 'Mod' and fmod == 1:
+        return 'Fmod'
+
+    return operation_type
+
 
 class OnnxBinaryMathOperation(nn.Module):
-    def __init__(self, operation_type: str, broadcast: Optional[int] = None,  axis: Optional[int] = None):
+    broadcast: Optional[int]
+    axis: Optional[int]
+    broadcast_dims: Optional[Tuple[int, int]]
+
+    def __init__(
+            self,
+            operation_type: str,
+            broadcast: Optional[int] = None,
+            axis: Optional[int] = None,
+            fmod: int = 0,
+            broadcast_dims: Optional[Tuple[int, int]] = None,
+            inplace: bool = False,
+    ):
         super().__init__()
 
         self.broadcast = broadcast
         self.axis = axis
-        self.math_op_function = _TORCH_FUNCTION_FROM_ONNX_TYPE[operation_type]
+        self.operation_type = _get_operation_type(operation_type, fmod)
+        self.supports_inplace = self.operation_type in _INPLACE_OPERATIONS
+        # Numbers of unit dims added before and after second operand for legacy broadcast, precomputed
+        # when ranks are known
+        self.broadcast_dims = broadcast_dims
+        # Write result into the first operand, see onnx2torch.passes.plan_inplace
+        self.inplace = inplace
 
-    def _old_style_broadcast(self, first: torch.Tensor, second: torch.Tensor) -> torch.Tensor:
+    def _old_style_broadcast(self, first: torch.Tensor, second: torch.Tensor, axis: int) -> torch.Tensor:
         rank = len(first.shape)
-        axis = self.axis + rank if self.axis < 0 else self.axis
+        axis = axis + rank if axis < 0 else axis
 
         second_shape = [1]*axis + list(second.shape)
         second_shape = second_shape + [1]*(rank - len(second_shape))
@@ -39,10 +158,108 @@ class OnnxBinaryMathOperation(nn.Module):
         return second.view(second_shape)
 
     def forward(self, first: torch.Tensor, second: torch.Tensor) -> torch.Tensor:
-        if self.broadcast == 1 and self.axis is not None:
-            second = self._old_style_broadcast(first, second)
+        broadcast_dims = self.broadcast_dims
+        broadcast = self.broadcast
+        axis = self.axis
+        if broadcast_dims is not None:
+            leading_dims, trailing_dims = broadcast_dims
+            second = second.view([1]*leading_dims + list(second.shape) + [1]*trailing_dims)
+        elif broadcast is not None and broadcast == 1 and axis is not None:
+            second = self._old_style_broadcast(first, second, axis)
+
+        if self.inplace:
+            return _inplace_math_operation(self.operation_type, first, second)
+
+        return _math_operation(self.operation_type, first, second)
+
+
+class OnnxScalarMathOperation(nn.Module):
+    """Binary operation with constant scalar operand, computed with Python scalar instead of tensor."""
+
+    def __init__(self, operation_type: str, value: Union[float, int], fmod: int = 0, inplace: bool = False):
+        super().__init__()
+        self.operation_type = _get_operation_type(operation_type, fmod)
+        self.supports_inplace = self.operation_type in _INPLACE_OPERATIONS
+        self.value = value
+        self.inplace = inplace
+
+    def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:
+        if self.inplace:
+            return _inplace_scalar_math_operation(self.operation_type, input_tensor, self.value)
+
+        return _scalar_math_operation(self.operation_type, input_tensor, self.value)
+
+
+class OnnxVariadicMathOperation(OnnxListInputModule):
+    """Elementwise Max, Min, Sum and Mean of inputs with multidirectional broadcasting."""
+
+    value: Optional[Union[float, int]]
+
+    def __init__(self, operation_type: str, num_inputs: int, value: Optional[Union[float, int]] = None):
+        super().__init__()
+        self.operation_type = operation_type
+        self.num_inputs = num_inputs
+        self.value = value
+
+    def _reduce(self, first: torch.Tensor, second: torch.Tensor) -> torch.Tensor:
+        if self.operation_type == 'Max':
+            return torch.maximum(first, second)
+        if self.operation_type == 'Min':
+            return torch.minimum(first, second)
+
+        return torch.add(first, second)
+
+    def forward(self, input_tensors: List[torch.Tensor]) -> torch.Tensor:
+        output = input_tensors[0]
+        for input_tensor in input_tensors[1:]:
+            output = self._reduce(output, input_tensor)
+
+        value = self.value
+        if value is not None:
+            scalar_operation_type = self.operation_type if self.operation_type in ('Max', 'Min') else 'Add'
+            output = _scalar_math_operation(scalar_operation_type, output, value)
+
+        if self.operation_type == 'Mean':
+            output = output / self.num_inputs
+
+        return output
+
+
+def _is_single_element_constant(value_name: str, graph: OnnxGraph) -> bool:
+    try:
+        return torch.as_tensor(get_const_value(value_name, graph)).numel() == 1
+    except KeyError:
+        return False
+
+
+def _get_scalar_constant(value_name: str, max_rank: Optional[int], graph: OnnxGraph) -> Optional[torch.Tensor]:
+    try:
+        value = torch.as_tensor(get_const_value(value_name, graph))
+    except KeyError:
+        return None
+
+    if value.numel() != 1:
+        return None
+
+    # Scalar must not change output shape by broadcasting
+    if value.dim() > 0 and (max_rank is None or value.dim() > max_rank):
+        return None
+
+    return value
+
+
+def _get_broadcast_dims(node: OnnxNode, graph: OnnxGraph) -> Optional[Tuple[int, int]]:
+    axis = node.attributes.get('axis', None)
+    if node.attributes.get('broadcast', None) != 1 or axis is None:
+        return None
 
-        return self.math_op_function(first, second)
+    first_rank = get_value_rank(node.input_values[0], graph)
+    second_rank = get_value_rank(node.input_values[1], graph)
+    if first_rank is None or second_rank is None:
+        return None
+
+    axis = axis + first_rank if axis < 0 else axis
+    return axis, first_rank - axis - second_rank
 
 
 @add_converter(operation_type='Add', version=1)
@@ -65,12 +282,102 @@ class OnnxBinaryMathOperation(nn.Module):
 @add_converter(operation_type='Div', version=7)
 @add_converter(operation_type='Div', version=13)
 @add_converter(operation_type='Div', version=14)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+@add_converter(operation_type='Pow', version=1)
+@add_converter(operation_type='Pow', version=7)
+@add_converter(operation_type='Pow', version=12)
+@add_converter(operation_type='Pow', version=13)
+@add_converter(operation_type='Pow', version=15)
+@add_converter(operation_type='Mod', version=10)
+@add_converter(operation_type='Mod', version=13)
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
+    operation_type = node.operation_type
+    fmod = node.attributes.get('fmod', 0)
+    first_name, second_name = node.input_values
+    candidates = [(first_name, second_name)]
+    if operation_type in _COMMUTATIVE_OPERATIONS:
+        candidates.append((second_name, first_name))
+
+    for input_name, constant_name in candidates:
+        value = _get_scalar_constant(constant_name, get_value_rank(input_name, graph), graph)
+        if value is None:
+            continue
+
+        scalar_operation_type, scalar = operation_type, value.item()
+        if operation_type == 'Div' and value.is_floating_point():
+            scalar_operation_type, scalar = 'Mul', torch.reciprocal(value.double()).item()
+
+        return OperationConverterResult(
+            torch_module=OnnxScalarMathOperation(
+                operation_type=scalar_operation_type,
+                value=scalar,
+                fmod=fmod,
+            ),
+            onnx_mapping=OnnxMapping(
+                inputs=(input_name,),
+                outputs=node.output_values,
+            ),
+        )
+
     return OperationConverterResult(
         torch_module=OnnxBinaryMathOperation(
-            operation_type=node.operation_type,
+            operation_type=operation_type,
             broadcast=node.attributes.get('broadcast', None),
             axis=node.attributes.get('axis', None),
+            fmod=fmod,
+            broadcast_dims=_get_broadcast_dims(node, graph),
         ),
         onnx_mapping=onnx_mapping_from_node(node=node),
     )
+
+
+@add_converter(operation_type='Max', version=1)
+@add_converter(operation_type='Max', version=6)
+@add_converter(operation_type='Max', version=8)
+@add_converter(operation_type='Max', version=12)
+@add_converter(operation_type='Max', version=13)
+@add_converter(operation_type='Min', version=1)
+@add_converter(operation_type='Min', version=6)
+@add_converter(operation_type='Min', version=8)
+@add_converter(operation_type='Min', version=12)
+@add_converter(operation_type='Min', version=13)
+@add_converter(operation_type='Sum', version=1)
+@add_converter(operation_type='Sum', version=6)
+@add_converter(operation_type='Sum', version=8)
+@add_converter(operation_type='Sum', version=13)
+@add_converter(operation_type='Mean', version=1)
+@add_converter(operation_type='Mean', version=6)
+@add_converter(operation_type='Mean', version=8)
+@add_converter(operation_type='Mean', version=13)
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
+    # Output rank is defined by inputs which are not folded, a folded constant must not raise it
+    input_ranks = [
+        get_value_rank(input_name, graph)
+        for input_name in node.input_values
+        if not _is_single_element_constant(input_name, graph)
+    ]
+    max_rank = None if None in input_ranks or not input_ranks else max(input_ranks)
+
+    input_values, scalars = [], []
+    for input_name in node.input_values:
+        value = _get_scalar_constant(input_name, max_rank, graph)
+        if value is None:
+            input_values.append(input_name)
+        else:
+            scalars.append(value.item())
+
+    # At least one tensor is needed to keep output shape and dtype
+    if not input_values:
+        input_values, scalars = list(node.input_values), []
+
+    value = _SCALAR_REDUCE_FROM_ONNX_TYPE[node.operation_type](scalars) if scalars else None
+    return OperationConverterResult(
+        torch_module=OnnxVariadicMathOperation(
+            operation_type=node.operation_type,
+            num_inputs=len(node.input_values),
+            value=value,
+        ),
+        onnx_mapping=OnnxMapping(
+            inputs=tuple(input_values),
+            outputs=node.output_values,
+        ),
+    )
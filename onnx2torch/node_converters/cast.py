@@ -19,6 +19,7 @@ TENSOR_TYPE_TO_TORCH_TYPE = {
     int(TensorProto.INT64): torch.int64,
     int(TensorProto.BOOL): torch.bool,
     int(TensorProto.FLOAT16): torch.float16,
+    int(TensorProto.BFLOAT16): torch.bfloat16,
     int(TensorProto.DOUBLE): torch.float64,
     int(TensorProto.COMPLEX64): torch.complex64,
     int(TensorProto.COMPLEX128): torch.complex128,
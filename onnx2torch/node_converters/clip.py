@@ -15,17 +15,25 @@ from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxClip(nn.Module):
+    min_val: Optional[torch.Tensor]
+    max_val: Optional[torch.Tensor]
 
     def __init__(
             self,
             min_val: Optional[torch.Tensor] = None,
             max_val: Optional[torch.Tensor] = None,
+            inplace: bool = False,
     ):
         super().__init__()
         self.min_val = min_val
         self.max_val = max_val
+        # Write result into the input, see onnx2torch.passes.plan_inplace
+        self.inplace = inplace
 
     def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:
+        if self.inplace and not (torch.is_grad_enabled() and input_tensor.requires_grad):
+            return torch.clamp_(input_tensor, self.min_val, self.max_val)
+
         return torch.clamp(input_tensor, self.min_val, self.max_val)
 
 
@@ -9,23 +9,29 @@ from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
-_TORCH_FUNCTION_FROM_ONNX_TYPE = {
-    'Equal': torch.eq,
-    'Less': torch.less,
-    'LessOrEqual': torch.less_equal,
-    'Greater': torch.greater,
-    'GreaterOrEqual': torch.greater_equal,
-}
+_COMPARE_OPERATIONS = ('Equal', 'Less', 'LessOrEqual', 'Greater', 'GreaterOrEqual')
 
 
 class OnnxCompare(nn.Module):
 
     def __init__(self, operation_type: str):
         super().__init__()
-        self.compare_function = _TORCH_FUNCTION_FROM_ONNX_TYPE[operation_type]
+        if operation_type not in _COMPARE_OPERATIONS:
+            raise NotImplementedError(f'"{operation_type}" comparison is not implemented')
+
+        self.operation_type = operation_type
 
     def forward(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
-        return self.compare_function(a, b)
+        if self.operation_type == 'Equal':
+            return torch.eq(a, b)
+        if self.operation_type == 'Less':
+            return torch.less(a, b)
+        if self.operation_type == 'LessOrEqual':
+            return torch.less_equal(a, b)
+        if self.operation_type == 'Greater':
+            return torch.greater(a, b)
+
+        return torch.greater_equal(a, b)
 
 
 @add_converter(operation_type='Equal', version=7)
@@ -1,8 +1,10 @@
 __all__ = ['OnnxConcat']
 
+from typing import List
+
 import torch
-from torch import nn
 
+from onnx2torch.common import OnnxListInputModule
 from onnx2torch.common import OperationConverterResult
 from onnx2torch.common import onnx_mapping_from_node
 from onnx2torch.node_converters.registry import add_converter
@@ -10,13 +12,13 @@ from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
 
-class OnnxConcat(nn.Module):
+class OnnxConcat(OnnxListInputModule):
 
     def __init__(self, axis: int):
         super().__init__()
         self.axis = axis
 
-    def forward(self, *input_tensors) -> torch.Tensor:
+    def forward(self, input_tensors: List[torch.Tensor]) -> torch.Tensor:
         return torch.cat(input_tensors, self.axis)
 
 
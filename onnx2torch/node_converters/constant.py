@@ -1,4 +1,7 @@
-__all__ = ['OnnxConstant']
+__all__ = [
+    'OnnxConstant',
+    'OnnxTensorConstant',
+]
 
 from typing import Any
 
@@ -36,6 +39,16 @@ class OnnxConstant(nn.Module):
         return self.value
 
 
+class OnnxTensorConstant(OnnxConstant):
+    """Tensor constant, its output is typed as Tensor for TorchScript (lists of tensors cannot hold Any)."""
+
+    def __init__(self, value: torch.Tensor):
+        super().__init__(value=value)
+
+    def forward(self) -> torch.Tensor:
+        return self.value
+
+
 def _prepare_output_value(value: Any, attr_name: str) -> Any:
     if attr_name in _CONSTANT_PARSING_MAPPING:
         return _CONSTANT_PARSING_MAPPING[attr_name](value)
@@ -51,7 +64,8 @@ def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint:
     attr_name, value = list(node.attributes.items())[0]
     prepared_value = _prepare_output_value(value, attr_name)
 
-    torch_module = OnnxConstant(
+    constant_class = OnnxTensorConstant if isinstance(prepared_value, torch.Tensor) else OnnxConstant
+    torch_module = constant_class(
         value=prepared_value,
     )
 
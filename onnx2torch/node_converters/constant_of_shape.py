@@ -1,20 +1,25 @@
 __all__ = ['OnnxConstantOfShape']
 
+from typing import List
 from typing import Optional
+from typing import Sequence
 
 import torch
 from torch import nn
 
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
-from onnx2torch.common import onnx_mapping_from_node
+from onnx2torch.common import get_const_value
+from onnx2torch.common import tensor_to_list
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxConstantOfShape(nn.Module):
+    shape: Optional[List[int]]
 
-    def __init__(self, value: Optional[torch.Tensor] = None):
+    def __init__(self, value: Optional[torch.Tensor] = None, shape: Optional[Sequence[int]] = None):
         super().__init__()
 
         if value is None:
@@ -23,19 +28,30 @@ class OnnxConstantOfShape(nn.Module):
         if value.numel() != 1:
             raise ValueError('parameter "value" must be scalar')
 
-        self.value = value
+        # Buffer follows module device and dtype, fill value is read once to avoid device sync in forward
+        self.register_buffer('value', value.reshape(1))
+        self.fill_value = value.item()
+        self.shape = list(shape) if shape is not None else None
+
+    def forward(self, shape: Optional[torch.Tensor] = None) -> torch.Tensor:
+        size = self.shape
+        if shape is not None:
+            # Dynamic shape must be known on host, this is free if shape is computed by OnnxShape on cpu
+            size = tensor_to_list(shape)
+
+        if size is None:
+            raise ValueError('Shape is not specified for ConstantOfShape')
 
-    def forward(self, shape: torch.Tensor) -> torch.Tensor:
         return torch.full(
-            size=torch.Size(shape),
-            fill_value=self.value.item(),
+            size=size,
+            fill_value=self.fill_value,
             dtype=self.value.dtype,
-            device=shape.device,
+            device=self.value.device,
         )
 
 
 @add_converter(operation_type='ConstantOfShape', version=9)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
     node_attributes = node.attributes
 
     if 'value' in node_attributes:
@@ -43,7 +59,22 @@ def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint:
     else:
         value = None
 
+    shape_value_name = node.input_values[0]
+    try:
+        shape = torch.as_tensor(get_const_value(shape_value_name, graph)).tolist()
+    except KeyError:
+        return OperationConverterResult(
+            torch_module=OnnxConstantOfShape(value=value),
+            onnx_mapping=OnnxMapping(
+                inputs=(shape_value_name,),
+                outputs=node.output_values,
+            ),
+        )
+
     return OperationConverterResult(
-        torch_module=OnnxConstantOfShape(value=value),
-        onnx_mapping=onnx_mapping_from_node(node=node),
+        torch_module=OnnxConstantOfShape(value=value, shape=shape),
+        onnx_mapping=OnnxMapping(
+            inputs=(),
+            outputs=node.output_values,
+        ),
     )
@@ -0,0 +1,206 @@
+"""Index of converter modules, get_converter imports a module only when a model uses one of its operations.
+
+The index has to be updated when a converter is added, run:
+
+    python -m onnx2torch.node_converters
+"""
+__all__ = [
+    'CONVERTER_MODULES',
+    'import_converter_modules',
+]
+
+import importlib
+import pkgutil
+from pathlib import Path
+from typing import Dict
+from typing import Tuple
+
+# (domain, operation type, version) -> name of module in onnx2torch.node_converters
+CONVERTER_MODULES: Dict[Tuple[str, str, int], str] = {
+    ('', 'Add', 1): 'binary_math_operations',
+    ('', 'Add', 6): 'binary_math_operations',
+    ('', 'Add', 7): 'binary_math_operations',
+    ('', 'Add', 13): 'binary_math_operations',
+    ('', 'Add', 14): 'binary_math_operations',
+    ('', 'BatchNormalization', 9): 'batch_norm',
+    ('', 'BatchNormalization', 14): 'batch_norm',
+    ('', 'BatchNormalization', 15): 'batch_norm',
+    ('', 'Cast', 9): 'cast',
+    ('', 'Cast', 13): 'cast',
+    ('', 'Clip', 6): 'clip',
+    ('', 'Clip', 11): 'clip',
+    ('', 'Clip', 12): 'clip',
+    ('', 'Clip', 13): 'clip',
+    ('', 'Concat', 4): 'concat',
+    ('', 'Concat', 11): 'concat',
+    ('', 'Concat', 13): 'concat',
+    ('', 'Constant', 9): 'constant',
+    ('', 'Constant', 11): 'constant',
+    ('', 'Constant', 12): 'constant',
+    ('', 'Constant', 13): 'constant',
+    ('', 'ConstantOfShape', 9): 'constant_of_shape',
+    ('', 'Conv', 1): 'conv',
+    ('', 'Conv', 11): 'conv',
+    ('', 'Div', 1): 'binary_math_operations',
+    ('', 'Div', 6): 'binary_math_operations',
+    ('', 'Div', 7): 'binary_math_operations',
+    ('', 'Div', 13): 'binary_math_operations',
+    ('', 'Div', 14): 'binary_math_operations',
+    ('', 'Equal', 7): 'comparisons',
+    ('', 'Equal', 11): 'comparisons',
+    ('', 'Equal', 13): 'comparisons',
+    ('', 'Exp', 6): 'activations',
+    ('', 'Exp', 13): 'activations',
+    ('', 'Expand', 8): 'expand',
+    ('', 'Expand', 13): 'expand',
+    ('', 'Flatten', 9): 'flatten',
+    ('', 'Flatten', 11): 'flatten',
+    ('', 'Flatten', 13): 'flatten',
+    ('', 'Gather', 1): 'gather',
+    ('', 'Gather', 11): 'gather',
+    ('', 'Gather', 13): 'gather',
+    ('', 'Gemm', 7): 'gemm',
+    ('', 'Gemm', 9): 'gemm',
+    ('', 'Gemm', 11): 'gemm',
+    ('', 'Gemm', 13): 'gemm',
+    ('', 'GlobalAveragePool', 1): 'global_average_pool',
+    ('', 'Greater', 7): 'comparisons',
+    ('', 'Greater', 9): 'comparisons',
+    ('', 'Greater', 13): 'comparisons',
+    ('', 'GreaterOrEqual', 12): 'comparisons',
+    ('', 'Identity', 1): 'identity',
+    ('', 'Identity', 13): 'identity',
+    ('', 'Identity', 14): 'identity',
+    ('', 'Identity', 16): 'identity',
+    ('', 'Less', 7): 'comparisons',
+    ('', 'Less', 9): 'comparisons',
+    ('', 'Less', 13): 'comparisons',
+    ('', 'LessOrEqual', 12): 'comparisons',
+    ('', 'Max', 1): 'binary_math_operations',
+    ('', 'Max', 6): 'binary_math_operations',
+    ('', 'Max', 8): 'binary_math_operations',
+    ('', 'Max', 12): 'binary_math_operations',
+    ('', 'Max', 13): 'binary_math_operations',
+    ('', 'MaxPool', 8): 'max_pool',
+    ('', 'MaxPool', 10): 'max_pool',
+    ('', 'MaxPool', 11): 'max_pool',
+    ('', 'MaxPool', 12): 'max_pool',
+    ('', 'Mean', 1): 'binary_math_operations',
+    ('', 'Mean', 6): 'binary_math_operations',
+    ('', 'Mean', 8): 'binary_math_operations',
+    ('', 'Mean', 13): 'binary_math_operations',
+    ('', 'Min', 1): 'binary_math_operations',
+    ('', 'Min', 6): 'binary_math_operations',
+    ('', 'Min', 8): 'binary_math_operations',
+    ('', 'Min', 12): 'binary_math_operations',
+    ('', 'Min', 13): 'binary_math_operations',
+    ('', 'Mod', 10): 'binary_math_operations',
+    ('', 'Mod', 13): 'binary_math_operations',
+    ('', 'Mul', 1): 'binary_math_operations',
+    ('', 'Mul', 6): 'binary_math_operations',
+    ('', 'Mul', 7): 'binary_math_operations',
+    ('', 'Mul', 13): 'binary_math_operations',
+    ('', 'Mul', 14): 'binary_math_operations',
+    ('', 'NonMaxSuppression', 10): 'nms',
+    ('', 'NonMaxSuppression', 11): 'nms',
+    ('', 'Pow', 1): 'binary_math_operations',
+    ('', 'Pow', 7): 'binary_math_operations',
+    ('', 'Pow', 12): 'binary_math_operations',
+    ('', 'Pow', 13): 'binary_math_operations',
+    ('', 'Pow', 15): 'binary_math_operations',
+    ('', 'Range', 11): 'range',
+    ('', 'ReduceL1', 1): 'reduce',
+    ('', 'ReduceL1', 11): 'reduce',
+    ('', 'ReduceL1', 13): 'reduce',
+    ('', 'ReduceL1', 18): 'reduce',
+    ('', 'ReduceL2', 1): 'reduce',
+    ('', 'ReduceL2', 11): 'reduce',
+    ('', 'ReduceL2', 13): 'reduce',
+    ('', 'ReduceL2', 18): 'reduce',
+    ('', 'ReduceLogSumExp', 1): 'reduce',
+    ('', 'ReduceLogSumExp', 11): 'reduce',
+    ('', 'ReduceLogSumExp', 13): 'reduce',
+    ('', 'ReduceLogSumExp', 18): 'reduce',
+    ('', 'ReduceMax', 1): 'reduce',
+    ('', 'ReduceMax', 11): 'reduce',
+    ('', 'ReduceMax', 12): 'reduce',
+    ('', 'ReduceMax', 13): 'reduce',
+    ('', 'ReduceMax', 18): 'reduce',
+    ('', 'ReduceMean', 1): 'reduce',
+    ('', 'ReduceMean', 11): 'reduce',
+    ('', 'ReduceMean', 13): 'reduce',
+    ('', 'ReduceMean', 18): 'reduce',
+    ('', 'ReduceMin', 1): 'reduce',
+    ('', 'ReduceMin', 11): 'reduce',
+    ('', 'ReduceMin', 12): 'reduce',
+    ('', 'ReduceMin', 13): 'reduce',
+    ('', 'ReduceMin', 18): 'reduce',
+    ('', 'ReduceProd', 1): 'reduce',
+    ('', 'ReduceProd', 11): 'reduce',
+    ('', 'ReduceProd', 13): 'reduce',
+    ('', 'ReduceProd', 18): 'reduce',
+    ('', 'ReduceSum', 1): 'reduce',
+    ('', 'ReduceSum', 11): 'reduce',
+    ('', 'ReduceSum', 13): 'reduce',
+    ('', 'ReduceSumSquare', 1): 'reduce',
+    ('', 'ReduceSumSquare', 11): 'reduce',
+    ('', 'ReduceSumSquare', 13): 'reduce',
+    ('', 'ReduceSumSquare', 18): 'reduce',
+    ('', 'Relu', 6): 'activations',
+    ('', 'Relu', 13): 'activations',
+    ('', 'Relu', 14): 'activations',
+    ('', 'Reshape', 5): 'reshape',
+    ('', 'Reshape', 13): 'reshape',
+    ('', 'Reshape', 14): 'reshape',
+    ('', 'ScatterND', 11): 'scatter_nd',
+    ('', 'ScatterND', 13): 'scatter_nd',
+    ('', 'ScatterND', 16): 'scatter_nd',
+    ('', 'Shape', 1): 'shape',
+    ('', 'Shape', 13): 'shape',
+    ('', 'Shape', 15): 'shape',
+    ('', 'Sigmoid', 1): 'activations',
+    ('', 'Sigmoid', 6): 'activations',
+    ('', 'Sigmoid', 13): 'activations',
+    ('', 'Slice', 9): 'slice',
+    ('', 'Slice', 10): 'slice',
+    ('', 'Slice', 11): 'slice',
+    ('', 'Slice', 13): 'slice',
+    ('', 'Softmax', 1): 'activations',
+    ('', 'Softmax', 11): 'activations',
+    ('', 'Softmax', 13): 'activations',
+    ('', 'Squeeze', 1): 'squeeze',
+    ('', 'Squeeze', 11): 'squeeze',
+    ('', 'Squeeze', 13): 'squeeze',
+    ('', 'Sub', 1): 'binary_math_operations',
+    ('', 'Sub', 6): 'binary_math_operations',
+    ('', 'Sub', 7): 'binary_math_operations',
+    ('', 'Sub', 13): 'binary_math_operations',
+    ('', 'Sub', 14): 'binary_math_operations',
+    ('', 'Sum', 1): 'binary_math_operations',
+    ('', 'Sum', 6): 'binary_math_operations',
+    ('', 'Sum', 8): 'binary_math_operations',
+    ('', 'Sum', 13): 'binary_math_operations',
+    ('', 'Tile', 6): 'tile',
+    ('', 'Tile', 13): 'tile',
+    ('', 'TopK', 1): 'topk',
+    ('', 'TopK', 10): 'topk',
+    ('', 'TopK', 11): 'topk',
+    ('', 'Transpose', 1): 'transpose',
+    ('', 'Transpose', 13): 'transpose',
+    ('', 'Unsqueeze', 1): 'unsqueeze',
+    ('', 'Unsqueeze', 11): 'unsqueeze',
+    ('', 'Unsqueeze', 13): 'unsqueeze',
+    ('', 'Where', 9): 'where',
+    ('', 'Where', 16): 'where',
+}
+
+# average_pool is not enabled: its converter is not tested
+_NOT_CONVERTER_MODULES = ('__main__', 'average_pool', 'converter_index', 'registry')
+
+
+def import_converter_modules() -> None:
+    """Import all modules of onnx2torch.node_converters, including the ones missing in the index."""
+    for module_info in pkgutil.iter_modules([str(Path(__file__).parent)]):
+        if module_info.name not in _NOT_CONVERTER_MODULES:
+            importlib.import_module(f'onnx2torch.node_converters.{module_info.name}')
+
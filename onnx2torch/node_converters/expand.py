@@ -1,12 +1,18 @@
 __all__ = ['OnnxExpand']
 
+from typing import List
+from typing import Optional
+from typing import Sequence
+
 import torch
 import torch._C as torch_C
 from torch import nn
 
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
-from onnx2torch.common import onnx_mapping_from_node
+from onnx2torch.common import get_const_value
 from onnx2torch.common import skip_torch_tracing
+from onnx2torch.common import tensor_to_list
 from onnx2torch.custom_export_to_onnx import CustomExportToOnnx
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
@@ -14,18 +20,41 @@ from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxExpand(nn.Module):
+    """ONNX Expand implemented as a broadcast view.
 
-    @staticmethod
-    def _do_forward(input_tensor: torch.Tensor, shape: torch.Tensor) -> torch.Tensor:
-        return input_tensor * torch.ones(torch.Size(shape), dtype=input_tensor.dtype, device=input_tensor.device)
+    The output shares memory with the input (zero strides along broadcast dims). Consumers which need
+    contiguous memory (torch.reshape, convolutions, etc.) materialize it on their own.
+    """
+
+    shape: Optional[List[int]]
+
+    def __init__(self, shape: Optional[Sequence[int]] = None):
+        super().__init__()
+        self.shape = list(shape) if shape is not None else None
+
+    def _do_forward(self, input_tensor: torch.Tensor, shape: Optional[torch.Tensor] = None) -> torch.Tensor:
+        size = self.shape
+        if shape is not None:
+            size = tensor_to_list(shape)
 
-    def forward(self, *args) -> torch.Tensor:
-        if torch.onnx.is_in_onnx_export():
-            with skip_torch_tracing():
-                output = self._do_forward(*args)
-                return _ExpandExportToOnnx.set_output_and_apply(output, *args)
+        if size is None:
+            raise ValueError('Shape is not specified for Expand')
 
-        return self._do_forward(*args)
+        # ONNX Expand uses bidirectional broadcasting, torch.expand is unidirectional
+        output_shape = torch.broadcast_shapes(input_tensor.shape, size)
+        return input_tensor.expand(output_shape)
+
+    def forward(self, input_tensor: torch.Tensor, shape: Optional[torch.Tensor] = None) -> torch.Tensor:
+        if not torch.jit.is_scripting():
+            if torch.onnx.is_in_onnx_export():
+                with skip_torch_tracing():
+                    output = self._do_forward(input_tensor, shape)
+                    if shape is None:
+                        shape = torch.tensor(self.shape, dtype=torch.int64)
+
+                    return _ExpandExportToOnnx.set_output_and_apply(output, input_tensor, shape)
+
+        return self._do_forward(input_tensor, shape)
 
 
 class _ExpandExportToOnnx(CustomExportToOnnx):
@@ -37,8 +66,24 @@ class _ExpandExportToOnnx(CustomExportToOnnx):
 
 @add_converter(operation_type='Expand', version=8)
 @add_converter(operation_type='Expand', version=13)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
+    input_value_name, shape_value_name = node.input_values
+
+    try:
+        shape = torch.as_tensor(get_const_value(shape_value_name, graph)).tolist()
+    except KeyError:
+        return OperationConverterResult(
+            torch_module=OnnxExpand(),
+            onnx_mapping=OnnxMapping(
+                inputs=(input_value_name, shape_value_name),
+                outputs=node.output_values,
+            ),
+        )
+
     return OperationConverterResult(
-        torch_module=OnnxExpand(),
-        onnx_mapping=onnx_mapping_from_node(node=node),
+        torch_module=OnnxExpand(shape=shape),
+        onnx_mapping=OnnxMapping(
+            inputs=(input_value_name,),
+            outputs=node.output_values,
+        ),
     )
@@ -1,50 +1,163 @@
-__all__ = ['OnnxGather']
+__all__ = [
+    'OnnxGather',
+    'OnnxGatherSelect',
+    'OnnxGatherNarrow',
+    'OnnxGatherEmbedding',
+]
 
+from typing import List
 from typing import Optional
 from typing import Tuple
 
 import torch
+import torch.nn.functional as F
+from onnx import TensorProto
 from torch import nn
 
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
+from onnx2torch.common import get_const_value
+from onnx2torch.common import get_shape_from_value_info
 from onnx2torch.common import onnx_mapping_from_node
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
+_FLOATING_POINT_TYPES = (TensorProto.FLOAT16, TensorProto.BFLOAT16, TensorProto.FLOAT, TensorProto.DOUBLE)
+
 
 class OnnxGather(nn.Module):
     """ONNX gather implementation (or numpy.take implementation)"""
 
-    def __init__(self, axis: Optional[int] = 0):
+    def __init__(self, axis: int = 0):
+        super().__init__()
+        self.axis = axis
+
+    def forward(self, input_tensor: torch.Tensor, indices: torch.Tensor) -> torch.Tensor:
+        # pytorch Gather differs from onnx Gather, onnx gather work like numpy.take:
+        # output shape is input_shape[:axis] + indices_shape + input_shape[axis + 1:]
+        axis = input_tensor.dim() + self.axis if self.axis < 0 else self.axis
+        axis_size = input_tensor.shape[axis]
+
+        flat_indices = indices.reshape(-1)
+        flat_indices = torch.where(flat_indices < 0, flat_indices + axis_size, flat_indices)
+        output = torch.index_select(input_tensor, axis, flat_indices)
+
+        input_shape = input_tensor.shape
+        output_shape = list(input_shape[:axis]) + list(indices.shape) + list(input_shape[axis + 1:])
+        return output.reshape(output_shape)
+
+
+class OnnxGatherSelect(nn.Module):
+    """Gather with constant scalar index, zero-copy view of the input."""
+
+    def __init__(self, axis: int, index: int):
         super().__init__()
         self.axis = axis
+        self.index = index
+
+    def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:
+        return input_tensor.select(self.axis, self.index)
+
+
+class OnnxGatherNarrow(nn.Module):
+    """Gather with constant contiguous 1D indices, zero-copy view of the input."""
+
+    def __init__(self, axis: int, start: int, length: int):
+        super().__init__()
+        self.axis = axis
+        self.start = start
+        self.length = length
+
+    def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:
+        return input_tensor.narrow(self.axis, self.start, self.length)
+
 
-    @staticmethod
-    def slice_from_axis(input_data: torch.Tensor, axis: int, indices: torch.Tensor) -> Tuple[slice, ...]:
-        axis = input_data.dim() + axis if axis < 0 else axis
-        skip_axis = [slice(None)] * axis
-        skip_axis.append(indices)
-        return tuple(skip_axis)
+class OnnxGatherEmbedding(nn.Module):
+    """Gather from constant table along axis 0, computed as embedding lookup."""
 
-    def forward(self, input_tensor: torch.Tensor, indices: Optional[torch.Tensor]) -> torch.Tensor:
-        # pytorch Gather differs from onnx Gather, onnx gather work like numpy.take
-        # But torch.take does not support different axis. So we make it by yourself
-        # numpy.take is input_data[:,:,indices] where we pass NONE slices AXIS time
-        slice_for_take = self.slice_from_axis(input_tensor, self.axis, indices)
-        return input_tensor[slice_for_take]
+    def forward(self, table: torch.Tensor, indices: torch.Tensor) -> torch.Tensor:
+        num_embeddings = table.shape[0]
+        # Onnx allows negative indices, F.embedding does not
+        indices = torch.where(indices < 0, indices + num_embeddings, indices)
+
+        output = F.embedding(indices, table.reshape(num_embeddings, -1))
+
+        return output.reshape(indices.shape + table.shape[1:])
+
+
+def _get_contiguous_range(indices: List[int], axis_size: Optional[int]) -> Optional[Tuple[int, int]]:
+    if axis_size is not None:
+        indices = [index + axis_size if index < 0 else index for index in indices]
+
+    if not indices or any(index < 0 for index in indices):
+        return None
+
+    start = indices[0]
+    if indices != list(range(start, start + len(indices))):
+        return None
+
+    return start, len(indices)
+
+
+def _get_axis_size(value_name: str, axis: int, graph: OnnxGraph) -> Optional[int]:
+    value_info = graph.value_info.get(value_name, None)
+    if value_info is None or not value_info.type.tensor_type.HasField('shape'):
+        return None
+
+    shape = get_shape_from_value_info(value_info)
+    if not -len(shape) <= axis < len(shape) or shape[axis] <= 0:
+        return None
+
+    return shape[axis]
 
 
 @add_converter(operation_type='Gather', version=1)
 @add_converter(operation_type='Gather', version=11)
 @add_converter(operation_type='Gather', version=13)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:   # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
     axis = node.attributes.get('axis', 0)
-    torch_module = OnnxGather(
-        axis=axis,
-    )
+    input_value_name, indices_value_name = node.input_values
+
+    if axis == 0 and input_value_name in graph.initializers:
+        # Table stays a shared initializer, so tied embeddings are stored once
+        table = graph.initializers[input_value_name]
+        if table.proto.data_type in _FLOATING_POINT_TYPES and len(table.proto.dims) >= 1:
+            return OperationConverterResult(
+                torch_module=OnnxGatherEmbedding(),
+                onnx_mapping=OnnxMapping(
+                    inputs=(input_value_name, indices_value_name),
+                    outputs=node.output_values,
+                ),
+            )
+
+    try:
+        indices = torch.as_tensor(get_const_value(indices_value_name, graph))
+    except KeyError:
+        indices = None
+
+    torch_module = None
+    if indices is not None and indices.dim() == 0:
+        torch_module = OnnxGatherSelect(axis=axis, index=indices.item())
+    elif indices is not None and indices.dim() == 1:
+        contiguous_range = _get_contiguous_range(
+            indices=indices.tolist(),
+            axis_size=_get_axis_size(input_value_name, axis, graph),
+        )
+        if contiguous_range is not None:
+            start, length = contiguous_range
+            torch_module = OnnxGatherNarrow(axis=axis, start=start, length=length)
+
+    if torch_module is not None:
+        return OperationConverterResult(
+            torch_module=torch_module,
+            onnx_mapping=OnnxMapping(
+                inputs=(input_value_name,),
+                outputs=node.output_values,
+            ),
+        )
 
     return OperationConverterResult(
-        torch_module=torch_module,
+        torch_module=OnnxGather(axis=axis),
         onnx_mapping=onnx_mapping_from_node(node=node),
     )
@@ -1,4 +1,9 @@
-__all__ = ['OnnxGeneralLinear']
+__all__ = [
+    'OnnxGeneralLinear',
+    'OnnxGemm',
+]
+
+from typing import Optional
 
 import torch
 import torch.nn.functional as F
@@ -52,33 +57,86 @@ class OnnxGeneralLinear(nn.Linear):
             return OnnxGeneralLinear(in_features, out_features, bias, trans_a)
 
 
+class OnnxGemm(nn.Module):
+    """ONNX GEMM with dynamic operands, computed by one fused addmm call.
+
+    Transposes are strided views, alpha and beta are applied inside the matmul kernel.
+    """
+
+    def __init__(self, alpha: float = 1.0, beta: float = 1.0, trans_a: int = 0, trans_b: int = 0):
+        super().__init__()
+        self.alpha = alpha
+        self.beta = beta
+        self.trans_a = trans_a
+        self.trans_b = trans_b
+
+    def forward(
+            self,
+            input_a: torch.Tensor,
+            input_b: torch.Tensor,
+            input_c: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        input_a = input_a.t() if self.trans_a != 0 else input_a
+        input_b = input_b.t() if self.trans_b != 0 else input_b
+
+        if input_c is None:
+            output = torch.mm(input_a, input_b)
+            return output.mul_(self.alpha) if self.alpha != 1.0 else output
+
+        return torch.addmm(input_c, input_a, input_b, beta=self.beta, alpha=self.alpha)
+
+
+def _get_linear_bias(node: OnnxNode, graph: OnnxGraph, out_features: int) -> Optional[torch.Tensor]:
+    bias_value_name = node.input_values[2]
+    bias = graph.initializers[bias_value_name].to_torch()
+
+    # nn.Linear bias has shape (N,), C of shape (1, N) and scalar C are reshaped to it
+    if bias.numel() == 1:
+        return bias.reshape(1).expand(out_features).clone()
+
+    if bias.shape[-1] == out_features and bias.numel() == out_features:
+        return bias.reshape(out_features)
+
+    return None
+
+
+@add_converter(operation_type='Gemm', version=7)
 @add_converter(operation_type='Gemm', version=9)
 @add_converter(operation_type='Gemm', version=11)
 @add_converter(operation_type='Gemm', version=13)
 def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
-    weights_value_name = node.input_values[1]
-    weights = graph.initializers[weights_value_name]
-    weights = weights.to_torch()
-
-    # An empty string may be used in the place of an actual argument's name to indicate a missing argument.
-    # See ONNX documentation
-    if len(node.input_values) == 3 and node.input_values[2] != '':
-        bias_value_name = node.input_values[2]
-        bias = graph.initializers[bias_value_name]
-        bias = bias.to_torch()
-    else:
-        bias = None
-
     node_attributes = node.attributes
     alpha = node_attributes.get('alpha', 1.0)
     beta = node_attributes.get('beta', 1.0)
     trans_a = node_attributes.get('transA', 0)
     trans_b = node_attributes.get('transB', 0)
 
-    if trans_b == 0:
-        in_features, out_features = weights.shape[0], weights.shape[1]
-    else:
-        in_features, out_features = weights.shape[1], weights.shape[0]
+    # An empty string may be used in the place of an actual argument's name to indicate a missing argument.
+    # See ONNX documentation
+    has_bias = len(node.input_values) == 3 and node.input_values[2] != ''
+
+    weights_value_name = node.input_values[1]
+    is_linear = weights_value_name in graph.initializers
+    is_linear &= not has_bias or node.input_values[2] in graph.initializers
+    if is_linear:
+        weights = graph.initializers[weights_value_name].to_torch()
+        if trans_b == 0:
+            in_features, out_features = weights.shape[0], weights.shape[1]
+        else:
+            in_features, out_features = weights.shape[1], weights.shape[0]
+
+        bias = _get_linear_bias(node, graph, out_features) if has_bias else None
+        is_linear = not has_bias or bias is not None
+
+    if not is_linear:
+        inputs = node.input_values if has_bias else node.input_values[:2]
+        return OperationConverterResult(
+            torch_module=OnnxGemm(alpha=alpha, beta=beta, trans_a=trans_a, trans_b=trans_b),
+            onnx_mapping=OnnxMapping(
+                inputs=tuple(inputs),
+                outputs=node.output_values,
+            ),
+        )
 
     torch_module = OnnxGeneralLinear.maybe_create_simple_linear(
         in_features=in_features,
@@ -29,40 +29,52 @@ class OnnxNonMaxSuppression(nn.Module):
         if max_output_boxes_per_class is None:
             return torch.empty([0, 3], dtype=torch.int64, device=boxes.device)
 
-        max_output_boxes_per_class = max_output_boxes_per_class.item()
-        iou_threshold = 0.0 if iou_threshold is None else iou_threshold.item()
-        score_threshold = 0.0 if score_threshold is None else score_threshold.item()
+        max_boxes = int(max_output_boxes_per_class.item())
+        iou = 0.0 if iou_threshold is None else float(iou_threshold.item())
+        min_score = 0.0 if score_threshold is None else float(score_threshold.item())
 
-        out = []
+        out = [torch.empty([0, 3], dtype=torch.int64, device=boxes.device)]
         # boxes - [bs, num_boxes, 4], scores - [bs, n_classes, num_boxes]
-        for batch_index, (batch_boxes, batch_scores) in enumerate(zip(boxes, scores)):
+        for batch_index in range(boxes.shape[0]):
+            batch_boxes = boxes[batch_index]
             # bbox - [num_boxes, 4], score - [n_classes, num_boxes]
-            for class_index, class_scores in enumerate(batch_scores):
-                confidence_mask = class_scores > score_threshold
-                confidence_indexes = confidence_mask.nonzero(as_tuple=False).squeeze(1)
+            for class_index in range(scores.shape[1]):
+                class_scores = scores[batch_index, class_index]
+                confidence_indexes = torch.nonzero(class_scores > min_score).squeeze(1)
                 nms_indexes = torchvision.ops.nms(
                     batch_boxes[confidence_indexes],
                     class_scores[confidence_indexes],
-                    iou_threshold,
+                    iou,
                 )
-                num_boxes = min(max_output_boxes_per_class, nms_indexes.size(0))
-                nms_indexes = nms_indexes[:num_boxes]
-                indexes = confidence_indexes[nms_indexes]
+                indexes = confidence_indexes[nms_indexes[:max_boxes]]
 
-                out.extend(
-                    [batch_index, class_index, box_index]
-                    for box_index in indexes
-                )
+                class_out = torch.empty([indexes.shape[0], 3], dtype=torch.int64, device=boxes.device)
+                class_out[:, 0] = batch_index
+                class_out[:, 1] = class_index
+                class_out[:, 2] = indexes
+                out.append(class_out)
+
+        return torch.cat(out)
 
-        return torch.tensor(out, dtype=torch.int64, device=boxes.device)
+    def forward(
+            self,
+            boxes: torch.Tensor,
+            scores: torch.Tensor,
+            max_output_boxes_per_class: Optional[torch.Tensor] = None,
+            iou_threshold: Optional[torch.Tensor] = None,
+            score_threshold: Optional[torch.Tensor] = None,
+    ) -> torch.Tensor:
+        if not torch.jit.is_scripting():
+            if torch.onnx.is_in_onnx_export():
+                args = [boxes, scores, max_output_boxes_per_class, iou_threshold, score_threshold]
+                while args[-1] is None:
+                    args.pop()
 
-    def forward(self, *args) -> torch.Tensor:
-        if torch.onnx.is_in_onnx_export():
-            with skip_torch_tracing():
-                output = self._do_forward(*args)
-                return _NmsExportToOnnx.set_output_and_apply(output, *args)
+                with skip_torch_tracing():
+                    output = self._do_forward(*args)
+                    return _NmsExportToOnnx.set_output_and_apply(output, *args)
 
-        return self._do_forward(*args)
+        return self._do_forward(boxes, scores, max_output_boxes_per_class, iou_threshold, score_threshold)
 
 
 class _NmsExportToOnnx(CustomExportToOnnx):
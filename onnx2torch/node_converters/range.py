@@ -1,12 +1,13 @@
 __all__ = ['OnnxRange']
 
-from typing import Union
-
 import torch
 from torch import nn
 
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
+from onnx2torch.common import get_const_value
 from onnx2torch.common import onnx_mapping_from_node
+from onnx2torch.node_converters.constant import OnnxTensorConstant
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
@@ -18,30 +19,41 @@ class OnnxRange(nn.Module):
         super().__init__()
         self.register_buffer('dummy_buffer', torch.Tensor(), persistent=False)
 
-    @staticmethod
-    def _get_scalar(value) -> Union[float, int]:
-        if isinstance(value, torch.Tensor):
-            return value.item()
-
-        return value
+    def forward(self, start: torch.Tensor, limit: torch.Tensor, delta: torch.Tensor) -> torch.Tensor:
+        # Output length depends on input values, so they have to be on host.
+        # It is free when inputs are produced by shape operations on cpu.
+        if not torch.jit.is_scripting():
+            # Integer inputs computed with Python ints, see onnx2torch.passes.compute_shapes_in_python
+            if isinstance(start, int):
+                return torch.arange(start, limit, delta, dtype=torch.int64, device=self.dummy_buffer.device)
 
-    def forward(
-            self,
-            start: Union[torch.Tensor, float, int],
-            limit: Union[torch.Tensor, float, int],
-            delta: Union[torch.Tensor, float, int],
-    ) -> torch.Tensor:
         return torch.arange(
-            start=self._get_scalar(start),
-            end=self._get_scalar(limit),
-            step=self._get_scalar(delta),
+            start=start.item(),
+            end=limit.item(),
+            step=delta.item(),
+            dtype=start.dtype,
             device=self.dummy_buffer.device,
         )
 
 
 @add_converter(operation_type='Range', version=11)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
+    try:
+        start, limit, delta = (
+            torch.as_tensor(get_const_value(value_name, graph))
+            for value_name in node.input_values
+        )
+    except KeyError:
+        return OperationConverterResult(
+            torch_module=OnnxRange(),
+            onnx_mapping=onnx_mapping_from_node(node),
+        )
+
+    # All inputs are constant, so output is precomputed and stored as buffer
     return OperationConverterResult(
-        torch_module=OnnxRange(),
-        onnx_mapping=onnx_mapping_from_node(node),
+        torch_module=OnnxTensorConstant(value=OnnxRange()(start, limit, delta)),
+        onnx_mapping=OnnxMapping(
+            inputs=(),
+            outputs=node.output_values,
+        ),
     )
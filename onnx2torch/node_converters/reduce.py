@@ -0,0 +1,242 @@
+__all__ = ['OnnxReduce']
+
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import torch
+import torch._C as torch_C
+from torch import nn
+
+from onnx2torch.common import OnnxMapping
+from onnx2torch.common import OperationConverterResult
+from onnx2torch.common import get_const_value
+from onnx2torch.common import skip_torch_tracing
+from onnx2torch.common import tensor_to_list
+from onnx2torch.custom_export_to_onnx import CustomExportToOnnx
+from onnx2torch.node_converters.registry import add_converter
+from onnx2torch.onnx_graph import OnnxGraph
+from onnx2torch.onnx_node import OnnxNode
+
+
+def _reduce_prod(input_tensor: torch.Tensor, dims: List[int], keepdim: bool) -> torch.Tensor:
+    # torch.prod reduces only one dim at a time
+    if len(dims) == input_tensor.dim() and not keepdim:
+        return torch.prod(input_tensor)
+
+    # Negative axes are normalized, otherwise mixed-sign axes are reduced in a wrong order
+    dims = [dim % input_tensor.dim() for dim in dims]
+    for dim in sorted(dims)[::-1]:
+        input_tensor = torch.prod(input_tensor, dim=dim, keepdim=keepdim)
+
+    return input_tensor
+
+
+def _reduce(operation_type: str, x: torch.Tensor, dims: List[int], keepdim: bool) -> torch.Tensor:
+    # Operations are dispatched by name instead of stored functions, so the module is scriptable
+    if operation_type == 'ReduceL1':
+        return torch.sum(torch.abs(x), dim=dims, keepdim=keepdim)
+    if operation_type == 'ReduceL2':
+        return torch.sqrt(torch.sum(torch.square(x), dim=dims, keepdim=keepdim))
+    if operation_type == 'ReduceLogSumExp':
+        return torch.logsumexp(x, dim=dims, keepdim=keepdim)
+    if operation_type == 'ReduceMax':
+        return torch.amax(x, dim=dims, keepdim=keepdim)
+    if operation_type == 'ReduceMean':
+        return torch.mean(x, dim=dims, keepdim=keepdim)
+    if operation_type == 'ReduceMin':
+        return torch.amin(x, dim=dims, keepdim=keepdim)
+    if operation_type == 'ReduceProd':
+        return _reduce_prod(x, dims, keepdim)
+    if operation_type == 'ReduceSum':
+        return torch.sum(x, dim=dims, keepdim=keepdim)
+    if operation_type == 'ReduceSumSquare':
+        return torch.sum(torch.square(x), dim=dims, keepdim=keepdim)
+
+    raise ValueError('Unexpected operation type ' + operation_type)
+
+
+_REDUCE_OPERATIONS = (
+    'ReduceL1',
+    'ReduceL2',
+    'ReduceLogSumExp',
+    'ReduceMax',
+    'ReduceMean',
+    'ReduceMin',
+    'ReduceProd',
+    'ReduceSum',
+    'ReduceSumSquare',
+)
+
+# torch.amax/amin can not be exported to onnx by older torch versions
+_CUSTOM_EXPORT_OPERATIONS = ('ReduceMax', 'ReduceMin')
+
+# Opset version since which axes are passed as input instead of attribute
+_AXES_AS_INPUT_SINCE_VERSION = {
+    'ReduceSum': 13,
+}
+_DEFAULT_AXES_AS_INPUT_SINCE_VERSION = 18
+
+
+class OnnxReduce(nn.Module):
+    """Stateless implementation of ONNX Reduce* operations.
+
+    Axes are normalized at module creation and all of them are reduced by one torch call
+    (except ReduceProd, torch.prod supports only one dim).
+    """
+
+    axes: Optional[List[int]]
+
+    def __init__(
+            self,
+            operation_type: str,
+            axes: Optional[Sequence[int]] = None,
+            keepdims: int = 1,
+            noop_with_empty_axes: int = 0,
+    ):
+        super().__init__()
+        if operation_type not in _REDUCE_OPERATIONS:
+            raise NotImplementedError(f'"{operation_type}" reduction is not implemented')
+
+        self.operation_type = operation_type
+        self.axes = sorted(axes) if axes is not None else None
+        self.keepdims = keepdims == 1
+        self.noop_with_empty_axes = noop_with_empty_axes == 1
+
+    def _do_forward(self, input_tensor: torch.Tensor, axes: Optional[torch.Tensor] = None) -> torch.Tensor:
+        dims = self.axes
+        if axes is not None:
+            dims = tensor_to_list(axes)
+
+        if dims is None or len(dims) == 0:
+            if self.noop_with_empty_axes:
+                return input_tensor
+
+            dims = list(range(input_tensor.dim()))
+
+        return _reduce(self.operation_type, input_tensor, dims, self.keepdims)
+
+    def forward(self, input_tensor: torch.Tensor, axes: Optional[torch.Tensor] = None) -> torch.Tensor:
+        if not torch.jit.is_scripting():
+            if self.operation_type in _CUSTOM_EXPORT_OPERATIONS and torch.onnx.is_in_onnx_export():
+                with skip_torch_tracing():
+                    output = self._do_forward(input_tensor, axes)
+                    return _ReduceExportToOnnx.set_output_and_apply(
+                        output,
+                        input_tensor,
+                        self.axes if axes is None else axes,
+                        self.operation_type,
+                        int(self.keepdims),
+                        int(self.noop_with_empty_axes),
+                    )
+
+        return self._do_forward(input_tensor, axes)
+
+
+def _export_onnx_opset_version() -> int:
+    # torch.onnx is imported by torch on first access, it is used only during export
+    symbolic_helper = torch.onnx.symbolic_helper
+    globals_ = getattr(symbolic_helper, 'GLOBALS', None)
+    if globals_ is not None:
+        return globals_.export_onnx_opset_version
+
+    return symbolic_helper._export_onnx_opset_version  # pylint: disable=protected-access
+
+
+class _ReduceExportToOnnx(CustomExportToOnnx):
+
+    @staticmethod
+    def symbolic(graph: torch_C.Graph, *args) -> torch_C.Value:
+        input_tensor, axes, operation_type, keepdims, noop_with_empty_axes = args
+
+        axes_as_input_since = _AXES_AS_INPUT_SINCE_VERSION.get(operation_type, _DEFAULT_AXES_AS_INPUT_SINCE_VERSION)
+        axes_as_input = _export_onnx_opset_version() >= axes_as_input_since
+
+        inputs, attributes = [input_tensor], {'keepdims_i': keepdims}
+        if axes_as_input:
+            attributes['noop_with_empty_axes_i'] = noop_with_empty_axes
+
+        if isinstance(axes, (list, tuple)):  # Static axes
+            if axes_as_input:
+                inputs.append(graph.op('Constant', value_t=torch.tensor(axes, dtype=torch.int64)))
+            else:
+                attributes['axes_i'] = list(axes)
+        elif axes is not None:  # Dynamic axes
+            if axes_as_input:
+                inputs.append(axes)
+            else:
+                parse_arg = torch.onnx.symbolic_helper._parse_arg  # pylint: disable=protected-access
+                attributes['axes_i'] = parse_arg(axes, 'is')
+
+        return graph.op(operation_type, *inputs, **attributes, outputs=1)
+
+
+def _get_static_axes(node: OnnxNode, graph: OnnxGraph) -> Tuple[Optional[List[int]], bool]:
+    """Returns axes known at conversion time and flag whether axes are passed in forward."""
+    if len(node.input_values) > 1 and node.input_values[1] != '':
+        try:
+            return torch.as_tensor(get_const_value(node.input_values[1], graph)).tolist(), False
+        except KeyError:
+            return None, True
+
+    return node.attributes.get('axes', None), False
+
+
+@add_converter(operation_type='ReduceL1', version=1)
+@add_converter(operation_type='ReduceL1', version=11)
+@add_converter(operation_type='ReduceL1', version=13)
+@add_converter(operation_type='ReduceL1', version=18)
+@add_converter(operation_type='ReduceL2', version=1)
+@add_converter(operation_type='ReduceL2', version=11)
+@add_converter(operation_type='ReduceL2', version=13)
+@add_converter(operation_type='ReduceL2', version=18)
+@add_converter(operation_type='ReduceLogSumExp', version=1)
+@add_converter(operation_type='ReduceLogSumExp', version=11)
+@add_converter(operation_type='ReduceLogSumExp', version=13)
+@add_converter(operation_type='ReduceLogSumExp', version=18)
+@add_converter(operation_type='ReduceMax', version=1)
+@add_converter(operation_type='ReduceMax', version=11)
+@add_converter(operation_type='ReduceMax', version=12)
+@add_converter(operation_type='ReduceMax', version=13)
+@add_converter(operation_type='ReduceMax', version=18)
+@add_converter(operation_type='ReduceMean', version=1)
+@add_converter(operation_type='ReduceMean', version=11)
+@add_converter(operation_type='ReduceMean', version=13)
+@add_converter(operation_type='ReduceMean', version=18)
+@add_converter(operation_type='ReduceMin', version=1)
+@add_converter(operation_type='ReduceMin', version=11)
+@add_converter(operation_type='ReduceMin', version=12)
+@add_converter(operation_type='ReduceMin', version=13)
+@add_converter(operation_type='ReduceMin', version=18)
+@add_converter(operation_type='ReduceProd', version=1)
+@add_converter(operation_type='ReduceProd', version=11)
+@add_converter(operation_type='ReduceProd', version=13)
+@add_converter(operation_type='ReduceProd', version=18)
+@add_converter(operation_type='ReduceSum', version=1)
+@add_converter(operation_type='ReduceSum', version=11)
+@add_converter(operation_type='ReduceSum', version=13)
+@add_converter(operation_type='ReduceSumSquare', version=1)
+@add_converter(operation_type='ReduceSumSquare', version=11)
+@add_converter(operation_type='ReduceSumSquare', version=13)
+@add_converter(operation_type='ReduceSumSquare', version=18)
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
+    node_attributes = node.attributes
+    axes, dynamic_axes = _get_static_axes(node, graph)
+
+    torch_module = OnnxReduce(
+        operation_type=node.operation_type,
+        axes=axes,
+        keepdims=node_attributes.get('keepdims', 1),
+        noop_with_empty_axes=node_attributes.get('noop_with_empty_axes', 0),
+    )
+
+    input_values = (node.input_values[0], node.input_values[1]) if dynamic_axes else (node.input_values[0],)
+
+    return OperationConverterResult(
+        torch_module=torch_module,
+        onnx_mapping=OnnxMapping(
+            inputs=input_values,
+            outputs=node.output_values,
+        ),
+    )
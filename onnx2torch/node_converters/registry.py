@@ -1,3 +1,4 @@
+import importlib
 import logging
 from typing import Callable
 from typing import NamedTuple
@@ -5,6 +6,7 @@ from typing import NamedTuple
 from onnx import defs
 
 from onnx2torch.common import OperationConverterResult
+from onnx2torch.node_converters.converter_index import CONVERTER_MODULES
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
@@ -33,7 +35,7 @@ def add_converter(operation_type: str, version: int, domain: str = defs.ONNX_DOM
             raise ValueError(f'Operation "{description}" already registered')
 
         _CONVERTER_REGISTRY[description] = converter
-        _LOGGER.info(f'Operation converter registered {description}')
+        _LOGGER.info('Operation converter registered %s', description)
 
         return converter
 
@@ -57,6 +59,11 @@ def get_converter(operation_type: str, version: int, domain: str = defs.ONNX_DOM
     )
 
     converter = _CONVERTER_REGISTRY.get(description, None)
+    if converter is None and description in CONVERTER_MODULES:
+        # Converter modules are imported on first use, import registers their converters
+        importlib.import_module(f'onnx2torch.node_converters.{CONVERTER_MODULES[description]}')
+        converter = _CONVERTER_REGISTRY.get(description, None)
+
     if converter is None:
         raise NotImplementedError(f'Converter is not implemented ({description})')
 
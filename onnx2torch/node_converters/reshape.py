@@ -1,35 +1,115 @@
 __all__ = ['OnnxReshape']
 
+from typing import List
+from typing import Optional
+from typing import Sequence
+
 import torch
+import torch._C as torch_C
 from torch import nn
 
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
-from onnx2torch.common import onnx_mapping_from_node
+from onnx2torch.common import get_const_value
+from onnx2torch.common import skip_torch_tracing
+from onnx2torch.common import tensor_to_list
+from onnx2torch.custom_export_to_onnx import CustomExportToOnnx
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxReshape(nn.Module):
+    shape: Optional[List[int]]
+    copy_dims: List[int]
+
+    def __init__(self, shape: Optional[Sequence[int]] = None, allowzero: int = 0):
+        super().__init__()
+        self.allowzero = allowzero == 1
+        self.shape = list(shape) if shape is not None else None
+
+        # Positions of zeros which should be copied from the input shape (only for allowzero == 0)
+        self.copy_dims = []
+        if self.shape is not None and not self.allowzero:
+            self.copy_dims = [i for i, dim_size in enumerate(self.shape) if dim_size == 0]
+
+    @staticmethod
+    def _copy_dims(input_tensor: torch.Tensor, shape: List[int], copy_dims: List[int]) -> List[int]:
+        shape = list(shape)
+        for i in copy_dims:
+            shape[i] = input_tensor.shape[i]
+
+        return shape
+
+    def _do_forward(self, input_tensor: torch.Tensor, shape: Optional[torch.Tensor] = None) -> torch.Tensor:
+        static_shape = self.shape
+        if shape is None:
+            if static_shape is None:
+                raise ValueError('Shape is not specified for Reshape')
+
+            if len(self.copy_dims) > 0:
+                return torch.reshape(input_tensor, self._copy_dims(input_tensor, static_shape, self.copy_dims))
+
+            return torch.reshape(input_tensor, static_shape)
 
-    def forward(self, input_tensor: torch.Tensor, shape: torch.Tensor) -> torch.Tensor:  # pylint: disable=no-self-use
-        if torch.any(shape == 0):
-            shape = [
-                input_tensor.shape[i] if dim_size == 0 else dim_size
-                for i, dim_size in enumerate(shape)
-            ]
+        # Dynamic shape: single device to host transfer instead of per element access
+        dynamic_shape = tensor_to_list(shape)
+        if not self.allowzero:
+            copy_dims: List[int] = []
+            for i, dim_size in enumerate(dynamic_shape):
+                if dim_size == 0:
+                    copy_dims.append(i)
 
-        return torch.reshape(input_tensor, torch.Size(shape))
+            dynamic_shape = self._copy_dims(input_tensor, dynamic_shape, copy_dims)
+
+        return torch.reshape(input_tensor, dynamic_shape)
+
+    def forward(self, input_tensor: torch.Tensor, shape: Optional[torch.Tensor] = None) -> torch.Tensor:
+        # torch.reshape is always exported with allowzero == 0, so allowzero == 1 needs custom export
+        if not torch.jit.is_scripting():
+            if self.allowzero and torch.onnx.is_in_onnx_export():
+                with skip_torch_tracing():
+                    output = self._do_forward(input_tensor, shape)
+                    if shape is None:
+                        shape = torch.tensor(self.shape, dtype=torch.int64)
+
+                    return _ReshapeExportToOnnx.set_output_and_apply(output, input_tensor, shape, 1)
+
+        return self._do_forward(input_tensor, shape)
+
+
+class _ReshapeExportToOnnx(CustomExportToOnnx):
+
+    @staticmethod
+    def symbolic(graph: torch_C.Graph, *args) -> torch_C.Value:
+        input_tensor, shape, allowzero = args
+        return graph.op('Reshape', input_tensor, shape, allowzero_i=allowzero, outputs=1)
 
 
 @add_converter(operation_type='Reshape', version=5)
 @add_converter(operation_type='Reshape', version=13)
 @add_converter(operation_type='Reshape', version=14)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
-    if node.attributes.get('allowzero', 0) == 1:
-        raise NotImplementedError('"allowzero=1" is not implemented')
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
+    allowzero = node.attributes.get('allowzero', 0)
+    input_value_name, shape_value_name = node.input_values[:2]
+
+    try:
+        shape = get_const_value(shape_value_name, graph)
+    except KeyError:
+        # Dynamic shape, will be resolved in forward
+        return OperationConverterResult(
+            torch_module=OnnxReshape(allowzero=allowzero),
+            onnx_mapping=OnnxMapping(
+                inputs=(input_value_name, shape_value_name),
+                outputs=node.output_values,
+            ),
+        )
 
+    # Copy dims (0) and -1 are resolved in forward, so the model works with any input shape
     return OperationConverterResult(
-        torch_module=OnnxReshape(),
-        onnx_mapping=onnx_mapping_from_node(node=node),
+        torch_module=OnnxReshape(shape=torch.as_tensor(shape).tolist(), allowzero=allowzero),
+        onnx_mapping=OnnxMapping(
+            inputs=(input_value_name,),
+            outputs=node.output_values,
+        ),
     )
@@ -2,7 +2,6 @@ __all__ = ['OnnxScatterND']
 
 from typing import Optional
 
-import numpy as np
 import torch
 import torch._C as torch_C
 from torch import nn
@@ -17,6 +16,8 @@ from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxScatterND(nn.Module):
+    reduction: Optional[str]
+
     def __init__(self, reduction: Optional[str] = None):
         super().__init__()
         self.reduction = reduction
@@ -24,31 +25,55 @@ class OnnxScatterND(nn.Module):
     def _do_forward(self, data: torch.Tensor, indices: torch.Tensor, updates: torch.Tensor) -> torch.Tensor:
         # There is no scatter nd for torch, use following formula:
         # https://github.com/onnx/onnx/blob/master/docs/Operators.md#ScatterND
-        output = data.clone()
-
-        update_indices = indices.shape[:-1]
-        for idx in np.ndindex(update_indices):
-            if self.reduction == 'sum':
-                output[indices[idx]] += updates[idx]
-            elif self.reduction == 'mul':
-                output[indices[idx]] *= updates[idx]
-            elif self.reduction is None:
-                output[indices[idx]] = updates[idx]
+        # Index tuples are turned into linear indices over the first indices.shape[-1] dims of data,
+        # so updates are applied by one index_copy_ or index_add_ call over the flattened output.
+        index_depth = indices.shape[-1]
+        data_shape = data.shape
+        slice_shape = list(data_shape[index_depth:])
+
+        linear_indices = torch.zeros(indices.shape[:-1], dtype=torch.int64, device=indices.device)
+        for dim in range(index_depth):
+            dim_indices = indices[..., dim].to(torch.int64)
+            dim_indices = torch.where(dim_indices < 0, dim_indices + data_shape[dim], dim_indices)
+            linear_indices = linear_indices * data_shape[dim] + dim_indices
+
+        linear_indices = linear_indices.reshape(-1)
+        flat_updates = updates.reshape([-1] + slice_shape)
+
+        output = data.clone(memory_format=torch.contiguous_format)
+        flat_output = output.view([-1] + slice_shape)
+        reduction = self.reduction
+        if reduction is None:
+            reduction = 'none'
+
+        if reduction == 'sum':
+            flat_output.index_add_(0, linear_indices, flat_updates)
+        elif reduction == 'mul':
+            for i in range(linear_indices.shape[0]):
+                flat_output[linear_indices[i]] *= flat_updates[i]
+        else:
+            flat_output.index_copy_(0, linear_indices, flat_updates)
 
         return output
 
-    def forward(self, *args) -> torch.Tensor:
-        if torch.onnx.is_in_onnx_export():
-            with skip_torch_tracing():
-                output = self._do_forward(*args)
+    def forward(self, data: torch.Tensor, indices: torch.Tensor, updates: torch.Tensor) -> torch.Tensor:
+        if not torch.jit.is_scripting():
+            if torch.onnx.is_in_onnx_export():
+                with skip_torch_tracing():
+                    output = self._do_forward(data, indices, updates)
 
-                export_kwargs = {}
-                if self.reduction is not None:
-                    export_kwargs['reduction'] = self.reduction
+                    if self.reduction is None:
+                        return _ScatterNDExportToOnnx.set_output_and_apply(output, data, indices, updates)
 
-                return _ScatterNDExportToOnnx.set_output_and_apply(output, *args, **export_kwargs)
+                    return _ScatterNDExportToOnnx.set_output_and_apply(
+                        output,
+                        data,
+                        indices,
+                        updates,
+                        reduction=self.reduction,
+                    )
 
-        return self._do_forward(*args)
+        return self._do_forward(data, indices, updates)
 
 
 class _ScatterNDExportToOnnx(CustomExportToOnnx):
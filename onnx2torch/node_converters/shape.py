@@ -1,39 +1,123 @@
 __all__ = ['OnnxShape']
 
+import functools
+from typing import Dict
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 import torch
 from torch import nn
 
 from onnx2torch.common import OperationConverterResult
+from onnx2torch.common import get_const_value
 from onnx2torch.common import onnx_mapping_from_node
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
+_MAX_CACHE_SIZE = 16
+
+# Inputs which are read on host by converted modules, so cpu tensor is preferable there
+_HOST_INPUTS_FROM_ONNX_TYPE: Dict[str, Tuple[int, ...]] = {
+    'ConstantOfShape': (0,),
+    'Expand': (1,),
+    'Range': (0, 1, 2),
+    'ReduceL1': (1,),
+    'ReduceL2': (1,),
+    'ReduceLogSumExp': (1,),
+    'ReduceMax': (1,),
+    'ReduceMean': (1,),
+    'ReduceMin': (1,),
+    'ReduceProd': (1,),
+    'ReduceSum': (1,),
+    'ReduceSumSquare': (1,),
+    'Reshape': (1,),
+    'Slice': (1, 2, 3, 4),
+    'Squeeze': (1,),
+    'Tile': (1,),
+    'TopK': (1,),
+    'Unsqueeze': (1,),
+}
+# Operations which keep their first input on the same device and do not mix it with other tensors
+_DEVICE_PRESERVING_OPS = ('Cast', 'Identity', 'Slice', 'Squeeze', 'Unsqueeze')
+
+
+@functools.lru_cache(maxsize=_MAX_CACHE_SIZE)
+def _shape_tensor(shape: Tuple[int, ...], device: torch.device) -> torch.Tensor:
+    # Cache is shared by all OnnxShape modules and is not a part of their state, its tensors are never returned
+    return torch.tensor(shape, dtype=torch.int64, device=device)
+
 
 class OnnxShape(nn.Module):
+    """ONNX Shape with memoized output.
+
+    Shape tensor is created once per input shape and device, every call returns its copy, so the output can be
+    modified in place. Copy does not read shape on host, it is a device-side operation.
+    If all consumers read shape on host, output is placed on cpu and shape arithmetic never touches the compute device.
+    """
 
-    def __init__(self, start: Optional[int] = None, end: Optional[int] = None):
+    def __init__(self, start: Optional[int] = None, end: Optional[int] = None, on_host: bool = False):
         super().__init__()
         self.start = start
         self.end = end
+        self.on_host = on_host
 
     def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:
-        return torch.tensor(
-            input_tensor.shape[self.start:self.end],
-            device=input_tensor.device,
+        shape = input_tensor.shape[self.start:self.end]
+        device = torch.device('cpu') if self.on_host else input_tensor.device
+
+        # Memoized constant must not get into traced graph, scripted module has no cache
+        if not torch.jit.is_scripting():
+            if not torch.jit.is_tracing():
+                return _shape_tensor(tuple(shape), device).clone()
+
+        return torch.tensor(shape, dtype=torch.int64, device=device)
+
+
+def _is_scalar_gather(node: OnnxNode, graph: OnnxGraph) -> bool:
+    try:
+        indices = torch.as_tensor(get_const_value(node.input_values[1], graph))
+    except KeyError:
+        return False
+
+    # Scalar constant indices are stored in module (see OnnxGatherSelect), so input is not mixed with other tensors
+    return indices.dim() == 0
+
+
+def _is_read_on_host(value_name: str, graph: OnnxGraph, visited: Set[str]) -> bool:
+    if value_name in graph.output_values:
+        return False
+
+    if value_name in visited:
+        return True
+
+    visited.add(value_name)
+    for node, input_index in graph.value_as_node_inputs(value_name):
+        if input_index in _HOST_INPUTS_FROM_ONNX_TYPE.get(node.operation_type, ()):
+            continue
+
+        is_device_preserving = node.operation_type in _DEVICE_PRESERVING_OPS or (
+            node.operation_type == 'Gather' and _is_scalar_gather(node, graph)
         )
+        if input_index != 0 or not is_device_preserving:
+            return False
+
+        if not all(_is_read_on_host(output_name, graph, visited) for output_name in node.output_values):
+            return False
+
+    return True
 
 
 @add_converter(operation_type='Shape', version=1)
 @add_converter(operation_type='Shape', version=13)
 @add_converter(operation_type='Shape', version=15)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
     return OperationConverterResult(
         torch_module=OnnxShape(
             start=node.attributes.get('start', None),
             end=node.attributes.get('end', None),
+            on_host=_is_read_on_host(node.output_values[0], graph, visited=set()),
         ),
         onnx_mapping=onnx_mapping_from_node(node=node),
     )
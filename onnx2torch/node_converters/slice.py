@@ -2,80 +2,58 @@ __all__ = ['OnnxSlice']
 
 from typing import List
 from typing import Optional
-from typing import Tuple
-from typing import Union
+from typing import Sequence
 
-import numpy as np
 import torch
 from torch import nn
 
 from onnx2torch.common import OperationConverterResult
 from onnx2torch.common import onnx_mapping_from_node
+from onnx2torch.common import tensor_to_list
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
 
-def _get_slices(
-        starts: Union[torch.Tensor, np.ndarray],
-        ends: Union[torch.Tensor, np.ndarray],
-        axes: Optional[Union[torch.Tensor, np.ndarray]],
-        steps: Optional[Union[torch.Tensor, np.ndarray]],
-) -> Tuple[List, List, List]:
-    if axes is None:
-        axes = list(range(len(starts)))
-    else:
-        axes = axes.detach().cpu().numpy()
-
-    if steps is None:
-        steps = [1] * len(starts)
-    else:
-        steps = steps.detach().cpu().numpy()
-
-    slices = {}
-    flip_dims = []
-    for start, end, axis, step in zip(starts, ends, axes, steps):
+def _do_slice(
+        x: torch.Tensor,
+        starts: List[int],
+        ends: List[int],
+        axes: Optional[List[int]],
+        steps: Optional[List[int]],
+) -> torch.Tensor:
+    # Every axis is sliced by aten::slice view, negative steps are computed by flip and positive step slice
+    for i in range(len(starts)):
+        axis = i if axes is None else axes[i]
+        axis = axis + x.dim() if axis < 0 else axis
+        start, end = starts[i], ends[i]
+        step = 1 if steps is None else steps[i]
+
         if step < 0:
-            flip_dims.append(axis)
+            x = torch.flip(x, dims=[axis])
             start, end, step = -start - 1, -end - 1, -step
 
-        slices[axis] = slice(start, end, step)
-
-    pos_axes_slices = list(slices.get(a, slice(None, None)) for a in range(max(axes) + 1))
-    neg_axes_slices = list(slices.get(a, slice(None, None)) for a in range(min(axes), 0))
-
-    if neg_axes_slices:
-        neg_axes_slices = [Ellipsis] + neg_axes_slices
-
-    return flip_dims, pos_axes_slices, neg_axes_slices
-
-
-def _do_slice(x: torch.Tensor, flip_dims: List, pos_axes_slices: List, neg_axes_slices: List):
-    if flip_dims:
-        x = torch.flip(x, dims=flip_dims)
-
-    if pos_axes_slices:
-        x = x[pos_axes_slices]
-
-    if neg_axes_slices:
-        x = x[neg_axes_slices]
+        x = torch.ops.aten.slice(x, axis, start, end, step)
 
     return x
 
 
 class OnnxSliceV9(nn.Module):
+    axes: Optional[List[int]]
 
-    def __init__(self, starts: np.ndarray, ends: np.ndarray, axes: Optional[np.ndarray] = None):
+    def __init__(self, starts: Sequence[int], ends: Sequence[int], axes: Optional[Sequence[int]] = None):
         super().__init__()
-        self._flip_dims, self._pos_axes_slices, self._neg_axes_slices = _get_slices(starts, ends, axes, None)
+        self.starts = list(starts)
+        self.ends = list(ends)
+        self.axes = list(axes) if axes is not None else None
 
     def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:
-        return _do_slice(input_tensor, self.flip_dims, self.pos_axes_slices, self.neg_axes_slices)
+        return _do_slice(input_tensor, self.starts, self.ends, self.axes, None)
 
 
 class OnnxSlice(nn.Module):
 
-    def forward(
+    def forward(  # pylint: disable=no-self-use
             self,
             input_tensor: torch.Tensor,
             starts: torch.Tensor,
@@ -83,8 +61,14 @@ class OnnxSlice(nn.Module):
             axes: Optional[torch.Tensor] = None,
             steps: Optional[torch.Tensor] = None,
     ) -> torch.Tensor:
-        flip_dims, pos_axes_slices, neg_axes_slices = _get_slices(starts, ends, axes, steps)
-        return _do_slice(input_tensor, flip_dims, pos_axes_slices, neg_axes_slices)
+        # Slice parameters are read on host, this is free if they are computed by OnnxShape on cpu
+        return _do_slice(
+            input_tensor,
+            tensor_to_list(starts),
+            tensor_to_list(ends),
+            None if axes is None else tensor_to_list(axes),
+            None if steps is None else tensor_to_list(steps),
+        )
 
 
 @add_converter(operation_type='Slice', version=9)
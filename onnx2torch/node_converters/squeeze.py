@@ -2,48 +2,72 @@ __all__ = ['OnnxSqueeze']
 
 from typing import List
 from typing import Optional
+from typing import Sequence
 
 import torch
 from torch import nn
 
 from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
+from onnx2torch.common import get_const_value
+from onnx2torch.common import get_value_rank
+from onnx2torch.common import tensor_to_list
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxSqueeze(nn.Module):
+    axes: Optional[List[int]]
 
-    def __init__(self, axes: Optional[List[int]] = None):
+    def __init__(self, axes: Optional[Sequence[int]] = None):
         super().__init__()
-        self.axes = axes
+        self.axes = sorted(axes) if axes is not None else None
+
+    @staticmethod
+    def _squeeze(input_tensor: torch.Tensor, axes: List[int]) -> torch.Tensor:
+        rank = input_tensor.dim()
+        squeeze_dims = [axis + rank if axis < 0 else axis for axis in axes]
+        shape: List[int] = []
+        for i, dim_size in enumerate(input_tensor.shape):
+            if i not in squeeze_dims:
+                shape.append(dim_size)
+
+        return torch.reshape(input_tensor, shape)
 
     def forward(self, input_tensor: torch.Tensor, axes: Optional[torch.Tensor] = None) -> torch.Tensor:
-        axes = axes if axes is not None else self.axes
-        if axes is None:
+        squeeze_axes = self.axes if axes is None else tensor_to_list(axes)
+        if squeeze_axes is None:
             return torch.squeeze(input_tensor)
 
-        axes, _ = torch.sort(axes)
-        for axes_id in axes:
-            input_tensor = torch.squeeze(input_tensor, dim=axes_id)
-        return input_tensor
+        return self._squeeze(input_tensor, squeeze_axes)
+
 
+def _normalize_axes(axes: List[int], rank: Optional[int]) -> List[int]:
+    if rank is None:
+        return axes
 
+    return [axis + rank if axis < 0 else axis for axis in axes]
+
+
+@add_converter(operation_type='Squeeze', version=1)
 @add_converter(operation_type='Squeeze', version=11)
 @add_converter(operation_type='Squeeze', version=13)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
     input_values = [node.input_values[0]]
     axes_value_name = node.input_values[1] if len(node.input_values) > 1 else None
 
     if axes_value_name is not None:
-        axes = graph.initializers.get(axes_value_name, None)
-        if axes is not None:
-            axes = axes.to_torch()
-        else:
-            input_values.append(node.input_values[1])
+        try:
+            axes = torch.as_tensor(get_const_value(axes_value_name, graph)).tolist()
+        except KeyError:
+            axes = None
+            input_values.append(axes_value_name)
     else:
-        axes = torch.tensor(node.attributes.get('axes', None), dtype=torch.long)
+        axes = node.attributes.get('axes', None)
+
+    if axes is not None:
+        axes = _normalize_axes(axes, rank=get_value_rank(node.input_values[0], graph))
 
     return OperationConverterResult(
         torch_module=OnnxSqueeze(axes=axes),
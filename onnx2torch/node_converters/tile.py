@@ -1,27 +1,82 @@
 __all__ = ['OnnxTile']
 
+from typing import List
+from typing import Optional
+from typing import Sequence
+
 import torch
 from torch import nn
 
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
-from onnx2torch.common import onnx_mapping_from_node
+from onnx2torch.common import get_const_value
+from onnx2torch.common import tensor_to_list
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxTile(nn.Module):
+    """ONNX Tile.
+
+    If all tiled dims of the input have size 1, the output is an expand view of the input,
+    otherwise the input is copied with torch.repeat.
+    """
+
+    repeats: Optional[List[int]]
+
+    def __init__(self, repeats: Optional[Sequence[int]] = None):
+        super().__init__()
+        self.repeats = list(repeats) if repeats is not None else None
+
+    @staticmethod
+    def _expand_shape(input_tensor: torch.Tensor, repeats: List[int]) -> Optional[List[int]]:
+        if len(repeats) != input_tensor.dim():
+            return None
+
+        shape = list(input_tensor.shape)
+        for i, repeat in enumerate(repeats):
+            if repeat != 1:
+                if shape[i] != 1:
+                    return None
+
+                shape[i] = repeat
+
+        return shape
+
+    def forward(self, input_tensor: torch.Tensor, repeats: Optional[torch.Tensor] = None) -> torch.Tensor:
+        # Dynamic repeats are read on host, this is free if repeats are computed by OnnxShape on cpu
+        repeats_list = self.repeats if repeats is None else tensor_to_list(repeats)
+        if repeats_list is None:
+            raise ValueError('Static repeats or dynamic repeats must be provided')
+
+        expand_shape = self._expand_shape(input_tensor, repeats_list)
+        if expand_shape is not None:
+            return input_tensor.expand(expand_shape)
 
-    def forward(self, input_tensor: torch.Tensor, repeats: torch.Tensor) -> torch.Tensor:
         # torch.tile(input_tensor, repeats) is not supported for exporting
-        return input_tensor.repeat(torch.Size(repeats))
+        return input_tensor.repeat(repeats_list)
 
 
 @add_converter(operation_type='Tile', version=6)
 @add_converter(operation_type='Tile', version=13)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
+    input_value_name, repeats_value_name = node.input_values
+    try:
+        repeats = torch.as_tensor(get_const_value(repeats_value_name, graph)).tolist()
+    except KeyError:
+        return OperationConverterResult(
+            torch_module=OnnxTile(),
+            onnx_mapping=OnnxMapping(
+                inputs=(input_value_name, repeats_value_name),
+                outputs=node.output_values,
+            ),
+        )
 
     return OperationConverterResult(
-        torch_module=OnnxTile(),
-        onnx_mapping=onnx_mapping_from_node(node=node),
+        torch_module=OnnxTile(repeats=repeats),
+        onnx_mapping=OnnxMapping(
+            inputs=(input_value_name,),
+            outputs=node.output_values,
+        ),
     )
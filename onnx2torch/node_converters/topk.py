@@ -1,32 +1,47 @@
 __all__ = ['OnnxTopK']
 
+from typing import Optional
 from typing import Tuple
-from typing import Union
 
 import torch
 from torch import nn
 
+from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
-from onnx2torch.common import onnx_mapping_from_node
+from onnx2torch.common import get_const_value
+from onnx2torch.common import get_value_rank
+from onnx2torch.common import tensor_to_int
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
 
 
 class OnnxTopK(nn.Module):
+    k: Optional[int]
 
-    def __init__(self, dim: int = -1, largest: int = 1, sorted_: int = 1):
+    def __init__(self, dim: int = -1, largest: int = 1, sorted_: int = 1, k: Optional[int] = None):
         super().__init__()
         self.dim = dim
         self.largest = largest == 1
         self.sorted = sorted_ == 1
+        self.k = k
 
-    def forward(self, input_tensor: torch.Tensor, k: Union[torch.Tensor, int]) -> Tuple[torch.Tensor, torch.Tensor]:
-        k = k[0] if isinstance(k, torch.Tensor) else k
+    def forward(
+            self,
+            input_tensor: torch.Tensor,
+            k: Optional[torch.Tensor] = None,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        if k is None:
+            top_k_size = self.k
+            if top_k_size is None:
+                raise ValueError('Static k or dynamic k must be provided')
+        else:
+            # Dynamic k is read on host, this is free if k is computed by OnnxShape on cpu
+            top_k_size = tensor_to_int(k)
 
         top_k = torch.topk(
             input_tensor,
-            k=k,
+            k=top_k_size,
             dim=self.dim,
             largest=self.largest,
             sorted=self.sorted,
@@ -37,13 +52,31 @@ class OnnxTopK(nn.Module):
 @add_converter(operation_type='TopK', version=1)
 @add_converter(operation_type='TopK', version=10)
 @add_converter(operation_type='TopK', version=11)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
     node_attributes = node.attributes
     axis = node_attributes.get('axis', -1)
     largest = node_attributes.get('largest', 1)
     sorted_ = node_attributes.get('sorted', 1)
 
+    input_value_name = node.input_values[0]
+    input_values = [input_value_name]
+    if len(node.input_values) > 1:
+        try:
+            k = int(torch.as_tensor(get_const_value(node.input_values[1], graph)).reshape(-1)[0])
+        except KeyError:
+            k = None
+            input_values.append(node.input_values[1])
+    else:
+        k = node_attributes['k']
+
+    input_rank = get_value_rank(input_value_name, graph)
+    if axis < 0 and input_rank is not None:
+        axis += input_rank
+
     return OperationConverterResult(
-        torch_module=OnnxTopK(dim=axis, largest=largest, sorted_=sorted_),
-        onnx_mapping=onnx_mapping_from_node(node=node),
+        torch_module=OnnxTopK(dim=axis, largest=largest, sorted_=sorted_, k=k),
+        onnx_mapping=OnnxMapping(
+            inputs=tuple(input_values),
+            outputs=node.output_values,
+        ),
     )
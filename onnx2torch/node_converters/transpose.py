@@ -15,14 +15,18 @@ from onnx2torch.onnx_node import OnnxNode
 
 class OnnxTranspose(nn.Module):
 
+    perm: Optional[List[int]]
+
     def __init__(self, perm: Optional[List[int]] = None):
         super().__init__()
         self.perm = perm
 
     def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:
-        if self.perm is None:
-            self.perm = list(range(input_tensor.dim()))[::-1]
-        return input_tensor.permute(self.perm)
+        perm = self.perm
+        if perm is None:
+            perm = list(range(input_tensor.dim()))[::-1]
+
+        return input_tensor.permute(perm)
 
 
 @add_converter(operation_type='Transpose', version=1)
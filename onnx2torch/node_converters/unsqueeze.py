@@ -1,12 +1,17 @@
 __all__ = ['OnnxUnsqueeze']
 
+from typing import List
 from typing import Optional
+from typing import Sequence
 
 import torch
 from torch import nn
 
 from onnx2torch.common import OnnxMapping
 from onnx2torch.common import OperationConverterResult
+from onnx2torch.common import get_const_value
+from onnx2torch.common import get_value_rank
+from onnx2torch.common import tensor_to_list
 from onnx2torch.node_converters.registry import add_converter
 from onnx2torch.onnx_graph import OnnxGraph
 from onnx2torch.onnx_node import OnnxNode
@@ -14,11 +19,25 @@ from onnx2torch.onnx_node import OnnxNode
 
 class OnnxUnsqueeze(nn.Module):
 
-    def __init__(self, axes: Optional[torch.Tensor] = None):
+    axes: Optional[List[int]]
+
+    def __init__(self, axes: Optional[Sequence[int]] = None):
         super().__init__()
-        self.axes = axes
+        self.axes = sorted(axes) if axes is not None else None
+
+    @staticmethod
+    def _unsqueeze(input_tensor: torch.Tensor, axes: List[int]) -> torch.Tensor:
+        # Negative axes are counted from the end of the output tensor
+        output_rank = input_tensor.dim() + len(axes)
+        output_axes = sorted([axis + output_rank if axis < 0 else axis for axis in axes])
+
+        shape = list(input_tensor.shape)
+        for axis in output_axes:
+            shape.insert(axis, 1)
 
-    def forward(self, input_tensor: torch.Tensor, axes: Optional[torch.Tensor] = None):
+        return torch.reshape(input_tensor, shape)
+
+    def forward(self, input_tensor: torch.Tensor, axes: Optional[torch.Tensor] = None) -> torch.Tensor:
         if axes is not None and self.axes is not None:
             raise ValueError(
                 'Static axes are specified for Unsqueeze and dynamic axes are passed in forward. '
@@ -31,32 +50,38 @@ class OnnxUnsqueeze(nn.Module):
                 'If you dont specified static axes during module creation, you must pass it in forward. '
             )
 
-        axes = axes if axes is not None else self.axes
-        axes, _ = torch.sort(axes)
-        for i in axes:
-            input_tensor = torch.unsqueeze(input_tensor, i)
+        if axes is not None:
+            return self._unsqueeze(input_tensor, tensor_to_list(axes))
 
-        return input_tensor
+        static_axes = self.axes
+        assert static_axes is not None
+        return self._unsqueeze(input_tensor, static_axes)
 
 
 @add_converter(operation_type='Unsqueeze', version=1)
 @add_converter(operation_type='Unsqueeze', version=11)
 @add_converter(operation_type='Unsqueeze', version=13)
-def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:  # pylint: disable=unused-argument
+def _(node: OnnxNode, graph: OnnxGraph) -> OperationConverterResult:
     input_values = [node.input_values[0]]
     axes_value_name = node.input_values[1] if len(node.input_values) > 1 else None
 
     if axes_value_name is not None:
-        axes = graph.initializers[axes_value_name].to_torch()
+        try:
+            axes = torch.as_tensor(get_const_value(axes_value_name, graph)).tolist()
+        except KeyError:
+            axes = None
+            input_values.append(axes_value_name)
     else:
-        axes = torch.tensor(node.attributes['axes'], dtype=torch.long)
+        axes = node.attributes['axes']
 
-    torch_module = OnnxUnsqueeze(
-        axes=axes,
-    )
+    if axes is not None:
+        input_rank = get_value_rank(node.input_values[0], graph)
+        if input_rank is not None:
+            output_rank = input_rank + len(axes)
+            axes = [axis + output_rank if axis < 0 else axis for axis in axes]
 
     return OperationConverterResult(
-        torch_module=torch_module,
+        torch_module=OnnxUnsqueeze(axes=axes),
         onnx_mapping=OnnxMapping(
             inputs=tuple(input_values),
             outputs=node.output_values,
@@ -45,6 +45,11 @@ class OnnxGraph:
             for node in self._nodes.values()
             for i, output_name in enumerate(node.output_values)
         }
+        self._node_input_values = {}
+        for node in self._nodes.values():
+            for i, input_name in enumerate(node.input_values):
+                self._node_input_values.setdefault(input_name, []).append((node, i))
+
         self._value_info = {
             value_info.name: value_info
             for value_info in onnx_graph_proto.value_info
@@ -96,3 +101,6 @@ class OnnxGraph:
 
     def value_as_node_output(self, value_name: str) -> Tuple[OnnxNode, int]:
         return self._node_output_values[value_name]
+
+    def value_as_node_inputs(self, value_name: str) -> Tuple[Tuple[OnnxNode, int], ...]:
+        return tuple(self._node_input_values.get(value_name, ()))
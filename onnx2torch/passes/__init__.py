@@ -0,0 +1,23 @@
+from importlib import import_module
+from typing import Any
+
+# Passes import converter modules which they rewrite, so they are imported on first access to keep converter
+# modules imported on demand (see onnx2torch.node_converters.converter_index)
+_PASS_MODULES = {
+    'plan_inplace': 'inplace',
+    'convert_to_channels_last': 'memory_format',
+    'to_channels_last': 'memory_format',
+    'to_contiguous': 'memory_format',
+    'ScheduleResult': 'scheduling',
+    'schedule_for_memory': 'scheduling',
+    'compute_shapes_in_python': 'shape_values',
+}
+
+__all__ = list(_PASS_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _PASS_MODULES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    return getattr(import_module(f'{__name__}.{_PASS_MODULES[name]}'), name)
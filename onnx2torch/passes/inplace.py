@@ -0,0 +1,174 @@
+__all__ = ['plan_inplace']
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+
+import torch
+from torch import fx
+from torch import nn
+
+from onnx2torch.node_converters.activations import OnnxExp
+from onnx2torch.node_converters.activations import OnnxSoftmaxV1V11
+from onnx2torch.node_converters.binary_math_operations import OnnxBinaryMathOperation
+from onnx2torch.node_converters.binary_math_operations import OnnxScalarMathOperation
+from onnx2torch.node_converters.clip import OnnxClip
+from onnx2torch.node_converters.comparisons import OnnxCompare
+from onnx2torch.node_converters.concat import OnnxConcat
+from onnx2torch.node_converters.flatten import OnnxFlatten
+from onnx2torch.node_converters.gather import OnnxGatherEmbedding
+from onnx2torch.node_converters.gemm import OnnxGemm
+from onnx2torch.node_converters.global_average_pool import OnnxGlobalAveragePool
+from onnx2torch.node_converters.identity import OnnxCopyIdentity
+from onnx2torch.node_converters.reshape import OnnxReshape
+from onnx2torch.node_converters.squeeze import OnnxSqueeze
+from onnx2torch.node_converters.transpose import OnnxTranspose
+from onnx2torch.node_converters.unsqueeze import OnnxUnsqueeze
+
+# Modules which always return newly allocated tensor (not a view of inputs, buffers or cached values)
+_FRESH_OUTPUT_MODULES = (
+    nn.modules.conv._ConvNd,  # pylint: disable=protected-access
+    nn.modules.batchnorm._BatchNorm,  # pylint: disable=protected-access
+    nn.modules.pooling._MaxPoolNd,  # pylint: disable=protected-access
+    nn.modules.pooling._AvgPoolNd,  # pylint: disable=protected-access
+    nn.Linear,
+    nn.ReLU,
+    nn.ReLU6,
+    nn.Sigmoid,
+    nn.Softmax,
+    OnnxBinaryMathOperation,
+    OnnxClip,
+    OnnxCompare,
+    OnnxConcat,
+    OnnxCopyIdentity,
+    OnnxExp,
+    OnnxGatherEmbedding,
+    OnnxGemm,
+    OnnxGlobalAveragePool,
+    OnnxScalarMathOperation,
+    OnnxSoftmaxV1V11,
+)
+
+# Modules which return either a view of the first input without overlapping elements or its copy
+_VIEW_OUTPUT_MODULES = (
+    nn.Flatten,
+    OnnxFlatten,
+    OnnxReshape,
+    OnnxSqueeze,
+    OnnxTranspose,
+    OnnxUnsqueeze,
+)
+
+
+class _InplaceSigmoid(nn.Module):
+
+    def forward(self, input_tensor: torch.Tensor) -> torch.Tensor:  # pylint: disable=no-self-use
+        if torch.is_grad_enabled() and input_tensor.requires_grad:
+            return torch.sigmoid(input_tensor)
+
+        return torch.sigmoid_(input_tensor)
+
+
+def _is_fresh_output(module: nn.Module) -> bool:
+    return isinstance(module, _FRESH_OUTPUT_MODULES) and not getattr(module, 'inplace', False)
+
+
+def _get_inplace_module(module: nn.Module) -> Optional[nn.Module]:
+    if type(module) in (nn.ReLU, nn.ReLU6):  # pylint: disable=unidiomatic-typecheck
+        return type(module)(inplace=True)
+
+    if type(module) is nn.Sigmoid:  # pylint: disable=unidiomatic-typecheck
+        return _InplaceSigmoid()
+
+    if isinstance(module, OnnxClip):
+        module.inplace = True
+        return module
+
+    if isinstance(module, (OnnxBinaryMathOperation, OnnxScalarMathOperation)) and module.supports_inplace:
+        module.inplace = True
+        return module
+
+    return None
+
+
+def _set_submodule(graph_module: fx.GraphModule, target: str, module: nn.Module) -> None:
+    parent_name, _, name = target.rpartition('.')
+    parent = graph_module.get_submodule(parent_name) if parent_name else graph_module
+    setattr(parent, name, module)
+
+
+def plan_inplace(graph_module: fx.GraphModule) -> List[str]:
+    """Switch elementwise modules to in-place variants where their first input is dead.
+
+    Liveness analysis runs over the fx graph in execution order. Every value may alias storages of its
+    inputs unless it is produced by a module which always allocates a new tensor; only such storages
+    are overwritten, and only when no alias of them is used after the in-place node.
+    Graph inputs, initializers, constants and graph outputs are never overwritten.
+
+    The plan is intended for inference: under autograd the modules fall back to out-of-place execution
+    for inputs which require grad.
+
+    Parameters
+    ----------
+    graph_module:
+        GraphModule returned by onnx2torch.converter.convert, it is modified in place.
+
+    Returns
+    -------
+    :
+        Names of submodules switched to in-place execution.
+    """
+    nodes = list(graph_module.graph.nodes)
+    position = {node: i for i, node in enumerate(nodes)}
+    last_use = {node: max((position[user] for user in node.users), default=position[node]) for node in nodes}
+
+    roots: Dict[fx.Node, Set[fx.Node]] = {}
+    aliases: Dict[fx.Node, List[fx.Node]] = {}
+    writable: Set[fx.Node] = set()
+
+    def can_overwrite(input_node: fx.Node, node: fx.Node) -> bool:
+        input_roots = roots[input_node]
+        for root in input_roots:
+            if root not in writable:
+                return False
+
+            if any(last_use[alias] > position[node] for alias in aliases[root]):
+                return False
+
+        # Other operands must not partially overlap with the overwritten tensor
+        for other_node in node.all_input_nodes:
+            if other_node is not input_node and roots[other_node] & input_roots:
+                return False
+
+        return True
+
+    inplace_targets = []
+    for node in nodes:
+        node_roots = {node}
+        for input_node in node.all_input_nodes:
+            node_roots |= roots[input_node]
+
+        if node.op == 'call_module':
+            module = graph_module.get_submodule(node.target)
+            first_input = node.args[0] if node.args else None
+
+            inplace_module = None
+            if isinstance(first_input, fx.Node) and can_overwrite(first_input, node):
+                inplace_module = _get_inplace_module(module)
+
+            if inplace_module is not None:
+                _set_submodule(graph_module, node.target, inplace_module)
+                inplace_targets.append(node.target)
+                node_roots = set(roots[first_input])
+            elif _is_fresh_output(module):
+                node_roots = {node}
+                writable.add(node)
+            elif isinstance(module, _VIEW_OUTPUT_MODULES) and isinstance(first_input, fx.Node):
+                node_roots = set(roots[first_input])
+
+        roots[node] = node_roots
+        for root in node_roots:
+            aliases.setdefault(root, []).append(node)
+
+    return inplace_targets
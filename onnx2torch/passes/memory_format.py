@@ -0,0 +1,123 @@
+__all__ = [
+    'convert_to_channels_last',
+    'to_channels_last',
+    'to_contiguous',
+]
+
+from typing import Dict
+from typing import Set
+
+import torch
+from torch import fx
+from torch import nn
+
+from onnx2torch.node_converters.activations import OnnxExp
+from onnx2torch.node_converters.binary_math_operations import OnnxBinaryMathOperation
+from onnx2torch.node_converters.binary_math_operations import OnnxScalarMathOperation
+from onnx2torch.node_converters.binary_math_operations import OnnxVariadicMathOperation
+from onnx2torch.node_converters.cast import OnnxCast
+from onnx2torch.node_converters.clip import OnnxClip
+from onnx2torch.node_converters.concat import OnnxConcat
+from onnx2torch.node_converters.global_average_pool import OnnxGlobalAveragePool
+from onnx2torch.node_converters.identity import OnnxCopyIdentity
+from onnx2torch.passes.precision import cast_tensor
+
+# Modules which do not depend on memory layout and keep channels_last format of their inputs
+_LAYOUT_AGNOSTIC_MODULES = (
+    nn.modules.batchnorm._BatchNorm,  # pylint: disable=protected-access
+    nn.modules.pooling._MaxPoolNd,  # pylint: disable=protected-access
+    nn.modules.pooling._AvgPoolNd,  # pylint: disable=protected-access
+    nn.Identity,
+    nn.ReLU,
+    nn.ReLU6,
+    nn.Sigmoid,
+    OnnxBinaryMathOperation,
+    OnnxCast,
+    OnnxClip,
+    OnnxConcat,
+    OnnxCopyIdentity,
+    OnnxExp,
+    OnnxGlobalAveragePool,
+    OnnxScalarMathOperation,
+    OnnxVariadicMathOperation,
+)
+_LAYOUT_AGNOSTIC_FUNCTIONS = (cast_tensor,)
+
+_CHANNELS_LAST_FORMAT_FROM_RANK = {
+    4: torch.channels_last,
+    5: torch.channels_last_3d,
+}
+
+
+def to_channels_last(value):
+    """Convert 4D and 5D tensors to channels_last format, other values are returned as is."""
+    if isinstance(value, torch.Tensor) and value.dim() in _CHANNELS_LAST_FORMAT_FROM_RANK:
+        return value.contiguous(memory_format=_CHANNELS_LAST_FORMAT_FROM_RANK[value.dim()])
+
+    return value
+
+
+def to_contiguous(value):
+    """Convert tensors to contiguous (NCHW) format, other values are returned as is."""
+    if isinstance(value, torch.Tensor):
+        return value.contiguous()
+
+    return value
+
+
+def _is_channels_last_conv(module: nn.Module) -> bool:
+    is_conv = isinstance(module, nn.modules.conv._ConvNd)  # pylint: disable=protected-access
+    return is_conv and module.weight.dim() in _CHANNELS_LAST_FORMAT_FROM_RANK
+
+
+def convert_to_channels_last(graph_module: fx.GraphModule) -> None:
+    """Run convolutional part of converted graph in channels_last memory format.
+
+    Conv weights are converted to channels_last. The format is propagated from convolutions through
+    layout-agnostic operations (activations, BatchNorm, pooling, elementwise, Concat).
+    Explicit conversions are inserted only on region boundaries: to channels_last on convolution inputs produced
+    outside of the region (graph inputs, for example) and to contiguous format before layout-sensitive
+    operations (Reshape, Flatten, Transpose, ...) and graph outputs.
+
+    Parameters
+    ----------
+    graph_module:
+        GraphModule returned by onnx2torch.converter.convert, it is modified in place.
+    """
+    torch_graph = graph_module.graph
+
+    region: Set[fx.Node] = set()
+    convolutions: Set[fx.Node] = set()
+    for node in torch_graph.nodes:
+        if node.op == 'call_module':
+            module = graph_module.get_submodule(node.target)
+            if _is_channels_last_conv(module):
+                memory_format = _CHANNELS_LAST_FORMAT_FROM_RANK[module.weight.dim()]
+                module.weight.data = module.weight.data.contiguous(memory_format=memory_format)
+                convolutions.add(node)
+                region.add(node)
+            elif isinstance(module, _LAYOUT_AGNOSTIC_MODULES) and any(n in region for n in node.all_input_nodes):
+                region.add(node)
+
+        elif node.op == 'call_function' and node.target in _LAYOUT_AGNOSTIC_FUNCTIONS:
+            if any(input_node in region for input_node in node.all_input_nodes):
+                region.add(node)
+
+    conversions: Dict[fx.Node, fx.Node] = {}
+    for node in list(torch_graph.nodes):
+        for input_node in node.all_input_nodes:
+            if node in convolutions and input_node not in region:
+                conversion_function = to_channels_last
+            elif node not in region and input_node in region:
+                conversion_function = to_contiguous
+            else:
+                continue
+
+            if input_node not in conversions:
+                with torch_graph.inserting_after(input_node):
+                    conversions[input_node] = torch_graph.call_function(conversion_function, args=(input_node,))
+
+            node.replace_input_with(input_node, conversions[input_node])
+
+    torch_graph.lint()
+    graph_module.recompile()
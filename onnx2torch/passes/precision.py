@@ -0,0 +1,114 @@
+__all__ = [
+    'DEFAULT_FP32_OPERATIONS',
+    'PRECISION_DTYPES',
+    'convert_precision',
+]
+
+from typing import Collection
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+import torch
+from torch import fx
+from torch import nn
+
+from onnx2torch.node_converters.cast import OnnxCast
+
+PRECISION_DTYPES = {
+    'bf16': torch.bfloat16,
+    'fp16': torch.float16,
+}
+
+# Onnx operations which are sensitive to precision and run in fp32 in reduced precision mode
+DEFAULT_FP32_OPERATIONS = (
+    'BatchNormalization',
+    'Exp',
+    'ReduceL1',
+    'ReduceL2',
+    'ReduceLogSumExp',
+    'ReduceMax',
+    'ReduceMean',
+    'ReduceMin',
+    'ReduceProd',
+    'ReduceSum',
+    'ReduceSumSquare',
+    'Softmax',
+)
+
+
+def cast_tensor(value: Union[torch.Tensor, int, float], from_dtype: torch.dtype, to_dtype: torch.dtype):
+    """Cast value to to_dtype if it is a tensor of from_dtype, integer tensors (shapes, indices) are kept."""
+    if isinstance(value, torch.Tensor) and value.dtype == from_dtype:
+        return value.to(to_dtype)
+
+    return value
+
+
+def _convert_fp32_tensors(module: nn.Module, dtype: torch.dtype) -> None:
+    module._apply(  # pylint: disable=protected-access
+        lambda tensor: tensor.to(dtype) if tensor.dtype == torch.float32 else tensor,
+    )
+
+
+def convert_precision(graph_module: fx.GraphModule, dtype: torch.dtype, fp32_nodes: Collection[str]) -> None:
+    """Run converted graph in reduced precision.
+
+    Fp32 weights, buffers and initializers of all modules except fp32_nodes are converted to dtype, OnnxCast to
+    float is replaced by cast to dtype. Casts between fp32 and dtype are inserted only on edges between
+    reduced precision nodes and fp32 nodes (fp32_nodes, graph inputs and outputs). Tensors of other dtypes
+    are never cast.
+
+    Parameters
+    ----------
+    graph_module:
+        GraphModule returned by onnx2torch.converter.convert, it is modified in place.
+    dtype:
+        Reduced precision dtype, torch.bfloat16 or torch.float16.
+    fp32_nodes:
+        Names of submodules which have to run in fp32.
+    """
+    torch_graph = graph_module.graph
+    is_fp32: Dict[fx.Node, bool] = {}
+    for node in torch_graph.nodes:
+        if node.op in ('placeholder', 'output'):
+            is_fp32[node] = True
+        elif node.op == 'call_module':
+            is_fp32[node] = node.target in fp32_nodes
+        elif node.op == 'get_attr':
+            # Initializer is converted if any of its consumers runs in reduced precision
+            is_fp32[node] = all(user.op == 'call_module' and user.target in fp32_nodes for user in node.users)
+        else:
+            # Output selection of multi-output nodes
+            is_fp32[node] = all(is_fp32[input_node] for input_node in node.all_input_nodes)
+
+    for node in torch_graph.nodes:
+        if node.op == 'call_module' and not is_fp32[node]:
+            module = graph_module.get_submodule(node.target)
+            _convert_fp32_tensors(module, dtype)
+            if isinstance(module, OnnxCast) and module.torch_dtype == torch.float32:
+                module.torch_dtype = dtype
+
+        elif node.op == 'get_attr' and not is_fp32[node]:
+            container_name, _, buffer_name = node.target.rpartition('.')
+            container = graph_module.get_submodule(container_name)
+            buffer = getattr(container, buffer_name)
+            if buffer.dtype == torch.float32:
+                setattr(container, buffer_name, buffer.to(dtype))
+
+    casts: Dict[Tuple[fx.Node, bool], fx.Node] = {}
+    for node in list(torch_graph.nodes):
+        for input_node in node.all_input_nodes:
+            if is_fp32[input_node] == is_fp32[node]:
+                continue
+
+            key = (input_node, is_fp32[node])
+            if key not in casts:
+                from_dtype, to_dtype = (dtype, torch.float32) if is_fp32[node] else (torch.float32, dtype)
+                with torch_graph.inserting_after(input_node):
+                    casts[key] = torch_graph.call_function(cast_tensor, args=(input_node, from_dtype, to_dtype))
+
+            node.replace_input_with(input_node, casts[key])
+
+    torch_graph.lint()
+    graph_module.recompile()
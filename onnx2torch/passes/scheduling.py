@@ -0,0 +1,171 @@
+__all__ = [
+    'ScheduleResult',
+    'schedule_for_memory',
+]
+
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Union
+
+import onnx
+import torch
+from onnx.onnx_ml_pb2 import ModelProto
+from onnx.onnx_ml_pb2 import ValueInfoProto
+from onnx.shape_inference import infer_shapes
+from torch import fx
+
+from onnx2torch.node_converters.cast import TENSOR_TYPE_TO_TORCH_TYPE
+from onnx2torch.onnx_graph import OnnxGraph
+
+_FIXED_OPS = ('placeholder', 'output')
+
+
+class ScheduleResult(NamedTuple):
+    original_peak_bytes: int
+    peak_bytes: int
+
+
+def _value_bytes(value_info: ValueInfoProto) -> int:
+    tensor_type = value_info.type.tensor_type
+    dtype = TENSOR_TYPE_TO_TORCH_TYPE.get(tensor_type.elem_type, torch.float32)
+
+    # Dynamic dims are unknown at conversion time, so they are counted as 1
+    numel = 1
+    for dim in tensor_type.shape.dim:
+        numel *= dim.dim_value if dim.dim_value > 0 else 1
+
+    return numel * torch.empty(0, dtype=dtype).element_size()
+
+
+def _node_bytes(graph_module: fx.GraphModule, onnx_graph: OnnxGraph) -> Dict[fx.Node, int]:
+    node_bytes = {}
+    for node in graph_module.graph.nodes:
+        onnx_node = onnx_graph.nodes.get(node.target, None) if node.op == 'call_module' else None
+        if onnx_node is None:
+            # Graph inputs, initializers and output selection of multi-output nodes are not new activations
+            node_bytes[node] = 0
+            continue
+
+        node_bytes[node] = sum(
+            _value_bytes(onnx_graph.value_info[output_name])
+            for output_name in onnx_node.output_values
+            if output_name in onnx_graph.value_info
+        )
+
+    return node_bytes
+
+
+def _estimate_peak(order: List[fx.Node], node_bytes: Dict[fx.Node, int]) -> int:
+    position = {node: i for i, node in enumerate(order)}
+    release_after: Dict[fx.Node, List[fx.Node]] = {}
+    for node in order:
+        last_user = max(node.users, key=position.get, default=node)
+        release_after.setdefault(last_user, []).append(node)
+
+    live_bytes, peak_bytes = 0, 0
+    for node in order:
+        live_bytes += node_bytes[node]
+        peak_bytes = max(peak_bytes, live_bytes)
+        live_bytes -= sum(node_bytes[dead_node] for dead_node in release_after.get(node, ()))
+
+    return peak_bytes
+
+
+def _greedy_order(nodes: List[fx.Node], node_bytes: Dict[fx.Node, int]) -> List[fx.Node]:
+    original_position = {node: i for i, node in enumerate(nodes)}
+    num_unscheduled_inputs = {node: len(node.all_input_nodes) for node in nodes}
+    num_unscheduled_users = {node: len(node.users) for node in nodes}
+
+    def memory_delta(node: fx.Node) -> int:
+        freed_bytes = sum(
+            node_bytes[input_node]
+            for input_node in node.all_input_nodes
+            if num_unscheduled_users[input_node] == 1
+        )
+        return node_bytes[node] - freed_bytes
+
+    def schedule(node: fx.Node) -> None:
+        order.append(node)
+        for input_node in node.all_input_nodes:
+            num_unscheduled_users[input_node] -= 1
+
+        for user in node.users:
+            num_unscheduled_inputs[user] -= 1
+            if num_unscheduled_inputs[user] == 0 and user.op not in _FIXED_OPS:
+                ready.append(user)
+
+    order: List[fx.Node] = []
+    ready = [node for node in nodes if num_unscheduled_inputs[node] == 0 and node.op not in _FIXED_OPS]
+    for node in nodes:
+        if node.op == 'placeholder':
+            schedule(node)
+
+    while ready:
+        # Node which frees most memory goes first, ties are resolved by the original order
+        node = min(ready, key=lambda candidate: (memory_delta(candidate), original_position[candidate]))
+        ready.remove(node)
+        schedule(node)
+
+    order.extend(node for node in nodes if node.op == 'output')
+    return order
+
+
+def schedule_for_memory(
+        graph_module: fx.GraphModule,
+        onnx_model_or_path: Union[str, Path, ModelProto],
+) -> ScheduleResult:
+    """Reorder nodes of converted graph to reduce estimated peak activation memory.
+
+    Activation sizes are taken from value_info of the original onnx model (after shape inference).
+    Nodes are scheduled greedily within topological constraints: the ready node which increases live
+    memory the least goes first. The new order is applied only if its estimated peak is lower.
+    The estimate counts every node output as a separate allocation and graph inputs and weights as free.
+
+    Parameters
+    ----------
+    graph_module:
+        GraphModule returned by onnx2torch.converter.convert, it is modified in place.
+    onnx_model_or_path:
+        Onnx ModelProto or model path which was converted.
+
+    Returns
+    -------
+    :
+        Estimated peak activation memory in bytes for the original and the chosen order.
+    """
+    if isinstance(onnx_model_or_path, ModelProto):
+        onnx_model = onnx_model_or_path
+    else:
+        onnx_model = onnx.load(onnx_model_or_path)
+
+    onnx_graph = OnnxGraph(infer_shapes(onnx_model).graph)
+    torch_graph = graph_module.graph
+    node_bytes = _node_bytes(graph_module, onnx_graph)
+
+    nodes = list(torch_graph.nodes)
+    original_peak_bytes = _estimate_peak(nodes, node_bytes)
+
+    order = _greedy_order(nodes, node_bytes)
+    peak_bytes = _estimate_peak(order, node_bytes)
+    if peak_bytes >= original_peak_bytes:
+        return ScheduleResult(original_peak_bytes=original_peak_bytes, peak_bytes=original_peak_bytes)
+
+    # Placeholders are kept at the beginning and output at the end of the graph
+    anchor = None
+    for node in order:
+        if node.op == 'placeholder':
+            anchor = node
+        elif node.op != 'output':
+            if anchor is None:
+                next(iter(torch_graph.nodes)).prepend(node)
+            else:
+                anchor.append(node)
+
+            anchor = node
+
+    torch_graph.lint()
+    graph_module.recompile()
+
+    return ScheduleResult(original_peak_bytes=original_peak_bytes, peak_bytes=peak_bytes)
@@ -0,0 +1,331 @@
+__all__ = [
+    'compute_shapes_in_python',
+]
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import torch
+from torch import fx
+from torch import nn
+
+from onnx2torch.node_converters.binary_math_operations import OnnxBinaryMathOperation
+from onnx2torch.node_converters.binary_math_operations import OnnxScalarMathOperation
+from onnx2torch.node_converters.cast import OnnxCast
+from onnx2torch.node_converters.concat import OnnxConcat
+from onnx2torch.node_converters.constant import OnnxConstant
+from onnx2torch.node_converters.constant_of_shape import OnnxConstantOfShape
+from onnx2torch.node_converters.expand import OnnxExpand
+from onnx2torch.node_converters.gather import OnnxGather
+from onnx2torch.node_converters.gather import OnnxGatherNarrow
+from onnx2torch.node_converters.gather import OnnxGatherSelect
+from onnx2torch.node_converters.range import OnnxRange
+from onnx2torch.node_converters.reduce import OnnxReduce
+from onnx2torch.node_converters.reshape import OnnxReshape
+from onnx2torch.node_converters.shape import OnnxShape
+from onnx2torch.node_converters.slice import OnnxSlice
+from onnx2torch.node_converters.slice import OnnxSliceV9
+from onnx2torch.node_converters.squeeze import OnnxSqueeze
+from onnx2torch.node_converters.tile import OnnxTile
+from onnx2torch.node_converters.topk import OnnxTopK
+from onnx2torch.node_converters.unsqueeze import OnnxUnsqueeze
+from onnx2torch.passes.memory_format import to_channels_last
+from onnx2torch.passes.memory_format import to_contiguous
+from onnx2torch.passes.precision import cast_tensor
+
+ShapeValue = Union[int, List[int]]
+
+# Positions of forward arguments which are read on host, they accept Python ints (see common.tensor_to_list)
+_HOST_ARGS_FROM_MODULE = (
+    (OnnxConstantOfShape, (0,)),
+    (OnnxExpand, (1,)),
+    (OnnxRange, (0, 1, 2)),
+    (OnnxReduce, (1,)),
+    (OnnxReshape, (1,)),
+    (OnnxSlice, (1, 2, 3, 4)),
+    (OnnxSqueeze, (1,)),
+    (OnnxTile, (1,)),
+    (OnnxTopK, (1,)),
+    (OnnxUnsqueeze, (1,)),
+)
+# Integer Div is computed by torch.div as float, so it is not evaluated in Python
+_PYTHON_MATH_OPERATIONS = ('Add', 'Sub', 'Mul')
+# Functions inserted by other passes which return non-tensor values as is
+_PASS_THROUGH_FUNCTIONS = (cast_tensor, to_channels_last, to_contiguous)
+
+
+def _shape(input_tensor: torch.Tensor, start: Optional[int], end: Optional[int]) -> List[int]:
+    return list(input_tensor.shape[start:end])
+
+
+def _gather(value: List[int], indices: ShapeValue) -> ShapeValue:
+    if isinstance(indices, int):
+        return value[indices]
+
+    return [value[index] for index in indices]
+
+
+def _slice(value: List[int], starts: List[int], ends: List[int], steps: Optional[List[int]]) -> List[int]:
+    # Python slicing clamps start and end like onnx Slice
+    return value[starts[0]:ends[0]:1 if steps is None else steps[0]]
+
+
+def _unsqueeze(value: int) -> List[int]:
+    return [value]
+
+
+def _squeeze(value: List[int]) -> int:
+    (output,) = value
+    return output
+
+
+def _concat(values: List[List[int]]) -> List[int]:
+    output = []
+    for value in values:
+        output.extend(value)
+
+    return output
+
+
+def _scalar_math(operation_type: str, first: int, second: int) -> int:
+    if operation_type == 'Add':
+        return first + second
+    if operation_type == 'Sub':
+        return first - second
+
+    return first * second
+
+
+def _math(operation_type: str, first: ShapeValue, second: ShapeValue) -> ShapeValue:
+    if isinstance(first, int) and isinstance(second, int):
+        return _scalar_math(operation_type, first, second)
+
+    first = first if isinstance(first, list) else [first]
+    second = second if isinstance(second, list) else [second]
+    size = max(len(first), len(second))
+    first, second = first * size if len(first) == 1 else first, second * size if len(second) == 1 else second
+
+    return [_scalar_math(operation_type, a, b) for a, b in zip(first, second)]
+
+
+def _to_tensor(value: ShapeValue, like: Optional[torch.Tensor]) -> torch.Tensor:
+    return torch.tensor(value, dtype=torch.int64, device=None if like is None else like.device)
+
+
+def _host_args(module: nn.Module) -> Tuple[int, ...]:
+    for module_type, positions in _HOST_ARGS_FROM_MODULE:
+        if isinstance(module, module_type):
+            return positions
+
+    return ()
+
+
+def _get_attr(graph_module: fx.GraphModule, target: str) -> Any:
+    module_name, _, attr_name = target.rpartition('.')
+    return getattr(graph_module.get_submodule(module_name), attr_name)
+
+
+class _ShapeGraph:
+    """Shape values of the graph: Python ints and lists of ints with known rank (0 or 1)."""
+
+    def __init__(self, graph_module: fx.GraphModule):
+        self.graph_module = graph_module
+        self.ranks: Dict[fx.Node, int] = {}
+        # Tensor which shape value is computed from, materialized shape values are placed on its device
+        self.sources: Dict[fx.Node, Optional[fx.Node]] = {}
+
+    def constant(self, node: Any) -> Optional[ShapeValue]:
+        if not isinstance(node, fx.Node):
+            return None
+
+        if node.op == 'get_attr':
+            tensor = _get_attr(self.graph_module, node.target)
+        elif node.op == 'call_module' and isinstance(self.graph_module.get_submodule(node.target), OnnxConstant):
+            tensor = self.graph_module.get_submodule(node.target).value
+        else:
+            return None
+
+        if not isinstance(tensor, torch.Tensor) or tensor.dtype != torch.int64 or tensor.dim() > 1:
+            return None
+
+        return tensor.tolist()
+
+    def rank(self, arg: Any) -> Optional[int]:
+        """Rank of shape value or constant, None if argument is not available in Python."""
+        if not isinstance(arg, fx.Node):
+            return None
+        if arg in self.ranks:
+            return self.ranks[arg]
+
+        value = self.constant(arg)
+        if value is None:
+            return None
+
+        return 0 if isinstance(value, int) else 1
+
+    def python_arg(self, arg: fx.Node) -> Any:
+        return arg if arg in self.ranks else self.constant(arg)
+
+    def source(self, args: List[fx.Node]) -> Optional[fx.Node]:
+        for arg in args:
+            if arg in self.ranks:
+                return self.sources[arg]
+
+        return None
+
+
+def _python_operation(  # pylint: disable=too-many-return-statements
+        module: nn.Module,
+        args: Tuple[Any, ...],
+        shape_graph: _ShapeGraph,
+) -> Optional[Tuple[Any, Tuple[Any, ...], int]]:
+    """Python function, its arguments and output rank for onnx operation on shape values."""
+    if isinstance(module, OnnxShape):
+        return _shape, (args[0], module.start, module.end), 1
+
+    if not args:
+        return None
+
+    # Concat gets all inputs as one list
+    inputs = args[0] if isinstance(module, OnnxConcat) else args
+    ranks = [shape_graph.rank(arg) for arg in inputs]
+    if not any(arg in shape_graph.ranks for arg in inputs) or any(rank is None for rank in ranks):
+        return None
+
+    python_args = tuple(shape_graph.python_arg(arg) for arg in inputs)
+    if isinstance(module, OnnxGatherSelect) and ranks[0] == 1 and module.axis in (0, -1):
+        return _gather, (python_args[0], module.index), 0
+
+    if isinstance(module, OnnxGatherNarrow) and ranks[0] == 1 and module.axis in (0, -1):
+        return _slice, (python_args[0], [module.start], [module.start + module.length], None), 1
+
+    if isinstance(module, OnnxGather) and ranks[0] == 1 and module.axis in (0, -1):
+        return _gather, python_args, ranks[1]
+
+    if isinstance(module, OnnxSliceV9) and ranks[0] == 1 and len(module.starts) == 1:
+        return _slice, (python_args[0], module.starts, module.ends, None), 1
+
+    if isinstance(module, OnnxSlice) and ranks[0] == 1:
+        # The only axis of shape value is 0, so axes are not used
+        steps = python_args[4] if len(python_args) > 4 else None
+        return _slice, (python_args[0], python_args[1], python_args[2], steps), 1
+
+    if isinstance(module, OnnxUnsqueeze) and ranks == [0] and module.axes in ([0], [-1]):
+        return _unsqueeze, python_args, 1
+
+    if isinstance(module, OnnxSqueeze) and ranks == [1] and module.axes in ([0], [-1]):
+        return _squeeze, python_args, 0
+
+    if isinstance(module, OnnxConcat) and module.axis in (0, -1) and all(rank == 1 for rank in ranks):
+        return _concat, (list(python_args),), 1
+
+    if isinstance(module, OnnxBinaryMathOperation) and module.operation_type in _PYTHON_MATH_OPERATIONS:
+        if module.broadcast_dims is None and not (module.broadcast == 1 and module.axis is not None):
+            return _math, (module.operation_type,) + python_args, max(ranks)
+
+    if isinstance(module, OnnxScalarMathOperation) and module.operation_type in _PYTHON_MATH_OPERATIONS:
+        if isinstance(module.value, int):
+            return _math, (module.operation_type, python_args[0], module.value), ranks[0]
+
+    return None
+
+
+def compute_shapes_in_python(graph_module: fx.GraphModule) -> List[str]:
+    """Compute shape subgraphs of converted graph with Python ints instead of tensors.
+
+    Outputs of Shape and integer operations on them (Gather, Slice, Concat, Unsqueeze, Squeeze, Cast to int64,
+    Add, Sub, Mul with constants) are computed as Python ints and lists. Modules which read shapes on host
+    (Reshape, Expand, Range, Slice, ...) get them without device to host transfer, and torch.compile
+    traces the graph without graph breaks: with static shapes these values are constants of the compiled graph.
+    Shape values are converted to int64 tensors only for other consumers and graph outputs.
+
+    Parameters
+    ----------
+    graph_module:
+        GraphModule returned by onnx2torch.converter.convert, it is modified in place.
+
+    Returns
+    -------
+    :
+        Names of submodules which are replaced by Python computations.
+    """
+    torch_graph = graph_module.graph
+    shape_graph = _ShapeGraph(graph_module)
+    replaced_modules = []
+
+    for node in list(torch_graph.nodes):
+        if node.op == 'call_function' and node.target in _PASS_THROUGH_FUNCTIONS and node.args[0] in shape_graph.ranks:
+            shape_graph.ranks[node] = shape_graph.ranks[node.args[0]]
+            shape_graph.sources[node] = shape_graph.sources[node.args[0]]
+            continue
+
+        if node.op != 'call_module':
+            continue
+
+        module = graph_module.get_submodule(node.target)
+        if isinstance(module, OnnxCast) and module.torch_dtype == torch.int64 and node.args[0] in shape_graph.ranks:
+            # Cast of int64 shape value is no-op
+            node.replace_all_uses_with(node.args[0])
+            torch_graph.erase_node(node)
+            replaced_modules.append(node.target)
+            continue
+
+        operation = _python_operation(module, node.args, shape_graph)
+        if operation is None:
+            continue
+
+        function, args, rank = operation
+        with torch_graph.inserting_before(node):
+            python_node = torch_graph.call_function(function, args=args)
+
+        shape_graph.ranks[python_node] = rank
+        shape_graph.sources[python_node] = args[0] if function is _shape else shape_graph.source(node.all_input_nodes)
+        node.replace_all_uses_with(python_node)
+        torch_graph.erase_node(node)
+        replaced_modules.append(node.target)
+
+    materialized: Dict[fx.Node, fx.Node] = {}
+
+    def materialize(arg: fx.Node) -> fx.Node:
+        if arg not in shape_graph.ranks:
+            return arg
+
+        if arg not in materialized:
+            with torch_graph.inserting_after(arg):
+                materialized[arg] = torch_graph.call_function(_to_tensor, args=(arg, shape_graph.sources[arg]))
+
+        return materialized[arg]
+
+    for node in list(torch_graph.nodes):
+        if node in shape_graph.ranks or node in materialized.values():
+            continue
+
+        host_args = ()
+        if node.op == 'call_module':
+            host_args = tuple(i for i in _host_args(graph_module.get_submodule(node.target)) if i < len(node.args))
+
+        # All host arguments are passed as Python values, otherwise module gets tensors only
+        python_args = any(node.args[i] in shape_graph.ranks for i in host_args) and all(
+            node.args[i] is None or shape_graph.rank(node.args[i]) is not None for i in host_args
+        )
+        node.args = tuple(
+            shape_graph.python_arg(arg) if python_args and i in host_args and arg is not None
+            else fx.node.map_arg(arg, materialize)
+            for i, arg in enumerate(node.args)
+        )
+        node.kwargs = fx.node.map_arg(node.kwargs, materialize)
+
+    for node in list(torch_graph.nodes):
+        if node.op == 'get_attr' and not node.users:
+            torch_graph.erase_node(node)
+
+    for module_name in replaced_modules:
+        graph_module.delete_submodule(module_name)
+
+    torch_graph.lint()
+    graph_module.recompile()
+    return replaced_modules
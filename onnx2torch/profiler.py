@@ -0,0 +1,458 @@
+__all__ = [
+    'LiveTensor',
+    'MemoryProfiler',
+    'NodeMemory',
+    'NodeProfile',
+    'NodeProfiler',
+]
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import torch
+from torch import fx
+
+from onnx2torch.common import OnnxMapping
+
+# Events of the first runs are kept for Chrome trace, so long profiling in production does not grow memory
+_DEFAULT_MAX_TRACE_EVENTS = 100_000
+
+
+class NodeProfile(NamedTuple):
+    name: str  # ONNX unique name (target of converted module) or name of fx node
+    operation_type: str
+    onnx_mapping: Optional[OnnxMapping]
+    calls: int
+    total_time_ns: int
+    output_bytes: int  # Sum over calls
+
+
+class NodeMemory(NamedTuple):
+    name: str
+    operation_type: str
+    allocated_bytes: int  # Storages first seen in outputs of the node
+    live_bytes: int  # All live activations right after the node, before release of values used for the last time
+
+
+class LiveTensor(NamedTuple):
+    name: str  # Name of node which allocated the storage
+    operation_type: str
+    output_name: str  # ONNX output name if onnx_mapping is attached, otherwise fx node name
+    num_bytes: int
+
+
+def _node_name(node: fx.Node) -> str:
+    # Placeholder targets are names of ONNX graph inputs
+    return node.target if node.op in ('call_module', 'placeholder') else node.name
+
+
+def _onnx_mapping(node: fx.Node, graph_module: fx.GraphModule) -> Optional[OnnxMapping]:
+    if node.op != 'call_module':
+        return None
+
+    return getattr(graph_module.get_submodule(node.target), 'onnx_mapping', None)
+
+
+def _operation_type(node: fx.Node) -> str:
+    if node.op == 'placeholder':
+        return 'input'
+    if node.op == 'call_module':
+        # ONNX unique names are "{domain}_{op_type}_{index}", see OnnxGraph
+        return node.target.rpartition('_')[0]
+
+    return getattr(node.target, '__name__', str(node.target))
+
+
+def _output_bytes(value: Any) -> int:
+    """Size in bytes of tensors in value (tensor, list or tuple of tensors)."""
+    if isinstance(value, torch.Tensor):
+        return value.numel() * value.element_size()
+    if isinstance(value, (list, tuple)):
+        return sum(_output_bytes(item) for item in value)
+
+    return 0
+
+
+class _NodeStats:
+    __slots__ = ('name', 'operation_type', 'onnx_mapping', 'calls', 'total_time_ns', 'output_bytes')
+
+    def __init__(self, node: fx.Node, graph_module: fx.GraphModule):
+        self.name = _node_name(node)
+        self.operation_type = _operation_type(node)
+        self.onnx_mapping = _onnx_mapping(node, graph_module)
+
+        self.calls = 0
+        self.total_time_ns = 0
+        self.output_bytes = 0
+
+
+class _ProfilingInterpreter(fx.Interpreter):
+
+    def __init__(self, profiler: 'NodeProfiler'):
+        super().__init__(profiler.graph_module)
+        self._profiler = profiler
+
+    def run_node(self, n: fx.Node) -> Any:
+        stats = self._profiler._stats.get(n)  # pylint: disable=protected-access
+        if stats is None:
+            return super().run_node(n)
+
+        start = time.perf_counter_ns()
+        result = super().run_node(n)
+        if self._profiler.synchronize:
+            torch.cuda.synchronize()
+
+        end = time.perf_counter_ns()
+        self._profiler._record(stats, start, end, _output_bytes(result))  # pylint: disable=protected-access
+        return result
+
+
+class NodeProfiler:
+    """Profiler of converted models, it records wall time, calls and output bytes of every node.
+
+    Model runs node by node in torch.fx.Interpreter, converted modules are keyed by their ONNX unique names
+    (and onnx_mapping if model is converted with attach_onnx_mapping=True), other nodes (functions inserted
+    by passes, getitem of multi-output nodes) are keyed by fx node names. Interpreter adds a few microseconds
+    per node, so calls of the profiler can be mixed with usual calls of the model to sample production traffic.
+
+    Usage example:
+
+        profiler = NodeProfiler(convert(onnx_model, attach_onnx_mapping=True))
+        with torch.no_grad():
+            outputs = profiler(x)
+
+        print(profiler.table())
+        print(profiler.table(group_by_operation_type=True))
+        profiler.export_chrome_trace('trace.json')  # Open in chrome://tracing or Perfetto
+
+    Note that operations on CUDA are asynchronous, set synchronize=True to attribute their time to nodes.
+    """
+
+    def __init__(
+            self,
+            graph_module: fx.GraphModule,
+            synchronize: bool = False,
+            max_trace_events: int = _DEFAULT_MAX_TRACE_EVENTS,
+    ):
+        """
+        Parameters
+        ----------
+        graph_module:
+            GraphModule returned by onnx2torch.converter.convert (not scripted).
+        synchronize:
+            Whether to synchronize CUDA after every node.
+        max_trace_events:
+            Maximal number of events kept for Chrome trace.
+        """
+        if not isinstance(graph_module, fx.GraphModule):
+            raise TypeError(f'Expected fx.GraphModule, got {type(graph_module).__name__}')
+
+        self.graph_module = graph_module
+        self.synchronize = synchronize and torch.cuda.is_available()
+        self._max_trace_events = max_trace_events
+        self._stats: Dict[fx.Node, _NodeStats] = {
+            node: _NodeStats(node, graph_module)
+            for node in graph_module.graph.nodes
+            if node.op in ('call_module', 'call_function', 'call_method')
+        }
+        self._events: List[Tuple[_NodeStats, int, int, int]] = []
+        # Interpreter analyses the graph on creation, so it is created once
+        self._interpreter = _ProfilingInterpreter(self)
+
+    def __call__(self, *args) -> Any:
+        return self._interpreter.run(*args)
+
+    def _record(self, stats: _NodeStats, start: int, end: int, num_bytes: int) -> None:
+        stats.calls += 1
+        stats.total_time_ns += end - start
+        stats.output_bytes += num_bytes
+        if len(self._events) < self._max_trace_events:
+            self._events.append((stats, start, end, num_bytes))
+
+    def reset(self) -> None:
+        for stats in self._stats.values():
+            stats.calls, stats.total_time_ns, stats.output_bytes = 0, 0, 0
+
+        self._events.clear()
+
+    def profiles(self) -> List[NodeProfile]:
+        """Profiles of executed nodes sorted by total time (descending)."""
+        profiles = [
+            NodeProfile(
+                name=stats.name,
+                operation_type=stats.operation_type,
+                onnx_mapping=stats.onnx_mapping,
+                calls=stats.calls,
+                total_time_ns=stats.total_time_ns,
+                output_bytes=stats.output_bytes,
+            )
+            for stats in self._stats.values()
+            if stats.calls > 0
+        ]
+        return sorted(profiles, key=lambda profile: profile.total_time_ns, reverse=True)
+
+    def operation_type_profiles(self) -> List[NodeProfile]:
+        """Profiles aggregated by operation type sorted by total time (descending), name is a number of nodes."""
+        aggregated: Dict[str, NodeProfile] = {}
+        num_nodes: Dict[str, int] = {}
+        for profile in self.profiles():
+            key = profile.operation_type
+            num_nodes[key] = num_nodes.get(key, 0) + 1
+            if key in aggregated:
+                total = aggregated[key]
+                profile = profile._replace(
+                    calls=total.calls + profile.calls,
+                    total_time_ns=total.total_time_ns + profile.total_time_ns,
+                    output_bytes=total.output_bytes + profile.output_bytes,
+                )
+
+            aggregated[key] = profile._replace(name=str(num_nodes[key]), onnx_mapping=None)
+
+        return sorted(aggregated.values(), key=lambda profile: profile.total_time_ns, reverse=True)
+
+    def table(self, group_by_operation_type: bool = False, limit: Optional[int] = None) -> str:
+        """Text table of profiles sorted by total time.
+
+        Parameters
+        ----------
+        group_by_operation_type:
+            Whether to aggregate profiles of nodes by operation type.
+        limit:
+            Maximal number of rows, all rows if None.
+
+        Returns
+        -------
+        :
+            Table with calls, total and mean time, share of total time and output size per call.
+        """
+        profiles = self.operation_type_profiles() if group_by_operation_type else self.profiles()
+        total_time_ns = sum(profile.total_time_ns for profile in profiles) or 1
+
+        first_column = 'nodes' if group_by_operation_type else 'name'
+        lines = [
+            f'{first_column:<32}{"operation type":<24}{"calls":>8}{"total, ms":>12}{"mean, us":>12}'
+            f'{"%":>8}{"output, KiB":>14}'
+        ]
+        for profile in profiles[:limit]:
+            lines.append(
+                f'{profile.name:<32}{profile.operation_type:<24}{profile.calls:>8}'
+                f'{profile.total_time_ns / 1e6:>12.3f}{profile.total_time_ns / profile.calls / 1e3:>12.1f}'
+                f'{profile.total_time_ns / total_time_ns * 100:>8.1f}'
+                f'{profile.output_bytes / profile.calls / 1024:>14.1f}'
+            )
+
+        lines.append(f'{"total":<32}{"":<24}{"":>8}{total_time_ns / 1e6:>12.3f}')
+        return '\n'.join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Recorded node calls in Chrome trace event format."""
+        events = []
+        for stats, start, end, num_bytes in self._events:
+            args: Dict[str, Any] = {'output_bytes': num_bytes}
+            if stats.onnx_mapping is not None:
+                args['onnx_inputs'] = list(stats.onnx_mapping.inputs)
+                args['onnx_outputs'] = list(stats.onnx_mapping.outputs)
+
+            events.append({
+                'name': stats.name,
+                'cat': stats.operation_type,
+                'ph': 'X',
+                'ts': start / 1e3,
+                'dur': (end - start) / 1e3,
+                'pid': 0,
+                'tid': 0,
+                'args': args,
+            })
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: Union[str, Path]) -> None:
+        """Save recorded node calls as Chrome trace (chrome://tracing, Perfetto)."""
+        Path(path).write_text(json.dumps(self.chrome_trace()))
+
+
+_StorageKey = Tuple[torch.device, int]
+
+
+def _storages(value: Any, index: int = 0) -> Iterator[Tuple[int, _StorageKey, int]]:
+    """Output index, key and size in bytes of storages of tensors in value (tensor, list or tuple of tensors)."""
+    if isinstance(value, torch.Tensor):
+        if value.layout == torch.strided:
+            storage = value.untyped_storage()
+            yield index, (value.device, storage.data_ptr()), storage.nbytes()
+    elif isinstance(value, (list, tuple)):
+        for item_index, item in enumerate(value):
+            yield from _storages(item, index=item_index)
+
+
+class _MemoryProfilingInterpreter(fx.Interpreter):
+
+    def __init__(self, profiler: 'MemoryProfiler'):
+        super().__init__(profiler.graph_module)
+        self._profiler = profiler
+
+    def run_node(self, n: fx.Node) -> Any:
+        result = super().run_node(n)
+        self._profiler._record(n, result, self.user_to_last_uses.get(n, []))  # pylint: disable=protected-access
+        return result
+
+
+class MemoryProfiler:
+    """Memory profiler of converted models, it attributes activation memory to nodes which allocated it.
+
+    Model runs node by node in torch.fx.Interpreter, which releases every value after its last use. The profiler
+    follows values of the interpreter and counts live bytes by tensor storages, so views (Reshape, getitem
+    of multi-output nodes) and in-place operations do not allocate memory, and a storage belongs to the first
+    node which returned it. Weights (parameters and buffers) are not counted. Accounting does not depend
+    on allocator statistics, it works on CPU and any other device. Temporary tensors allocated inside a node
+    and released before its end are not visible.
+
+    Usage example:
+
+        profiler = MemoryProfiler(convert(onnx_model, attach_onnx_mapping=True))
+        with torch.no_grad():
+            outputs = profiler(x)
+
+        print(profiler.table())
+        for tensor in profiler.live_tensors_at_peak():
+            print(tensor.name, tensor.output_name, tensor.num_bytes)
+
+    Note that autograd keeps tensors saved for backward alive, profile under torch.no_grad to get inference memory.
+    """
+
+    def __init__(self, graph_module: fx.GraphModule):
+        """
+        Parameters
+        ----------
+        graph_module:
+            GraphModule returned by onnx2torch.converter.convert (not scripted).
+        """
+        if not isinstance(graph_module, fx.GraphModule):
+            raise TypeError(f'Expected fx.GraphModule, got {type(graph_module).__name__}')
+
+        self.graph_module = graph_module
+        self._output_names: Dict[fx.Node, Tuple[str, ...]] = {}
+        for node in graph_module.graph.nodes:
+            onnx_mapping = _onnx_mapping(node, graph_module)
+            if node.op == 'placeholder':
+                self._output_names[node] = (node.target,)
+            elif onnx_mapping is not None:
+                self._output_names[node] = tuple(onnx_mapping.outputs)
+
+        self._nodes: List[NodeMemory] = []
+        self._peak_index = -1
+        self._peak_tensors: List[LiveTensor] = []
+        self._weights: Dict[_StorageKey, int] = {}
+        self._live: Dict[_StorageKey, LiveTensor] = {}
+        self._references: Dict[_StorageKey, int] = {}
+        self._values: Dict[fx.Node, List[_StorageKey]] = {}
+        self._live_bytes = 0
+        # Interpreter analyses the graph on creation, so it is created once
+        self._interpreter = _MemoryProfilingInterpreter(self)
+
+    def __call__(self, *args) -> Any:
+        """Runs the model and replaces results of the previous run."""
+        self._nodes.clear()
+        self._peak_index = -1
+        self._peak_tensors = []
+        self._weights = {
+            key: num_bytes
+            for tensor in list(self.graph_module.parameters()) + list(self.graph_module.buffers())
+            for _, key, num_bytes in _storages(tensor)
+        }
+        try:
+            return self._interpreter.run(*args)
+        finally:
+            self._live.clear()
+            self._references.clear()
+            self._values.clear()
+            self._live_bytes = 0
+
+    def _record(self, node: fx.Node, result: Any, last_uses: List[fx.Node]) -> None:
+        if node.op == 'output':
+            return
+        if node.op == 'get_attr':
+            # Constants of the model are weights too
+            self._weights.update((key, num_bytes) for _, key, num_bytes in _storages(result))
+            return
+
+        allocated_bytes = 0
+        keys = []
+        for index, key, num_bytes in _storages(result):
+            if key in self._weights or key in keys:
+                continue
+
+            keys.append(key)
+            if key not in self._live:
+                output_names = self._output_names.get(node, ())
+                output_name = output_names[index] if index < len(output_names) else node.name
+                self._live[key] = LiveTensor(_node_name(node), _operation_type(node), output_name, num_bytes)
+                self._references[key] = 0
+                allocated_bytes += num_bytes
+
+            self._references[key] += 1
+
+        self._values[node] = keys
+        self._live_bytes += allocated_bytes
+        self._nodes.append(NodeMemory(_node_name(node), _operation_type(node), allocated_bytes, self._live_bytes))
+        if self._peak_index < 0 or self._live_bytes > self._nodes[self._peak_index].live_bytes:
+            self._peak_index = len(self._nodes) - 1
+            self._peak_tensors = list(self._live.values())
+
+        # Interpreter deletes these values right after the node
+        for released_node in last_uses:
+            for key in self._values.pop(released_node, []):
+                self._references[key] -= 1
+                if self._references[key] == 0:
+                    del self._references[key]
+                    self._live_bytes -= self._live.pop(key).num_bytes
+
+    def nodes(self) -> List[NodeMemory]:
+        """Memory after every node of the last run in execution order (placeholders are graph inputs)."""
+        return list(self._nodes)
+
+    def peak(self) -> Optional[NodeMemory]:
+        """Node after which live activation memory of the last run is maximal."""
+        return self._nodes[self._peak_index] if self._peak_index >= 0 else None
+
+    def live_tensors_at_peak(self) -> List[LiveTensor]:
+        """Storages live at the peak sorted by size (descending)."""
+        return sorted(self._peak_tensors, key=lambda tensor: tensor.num_bytes, reverse=True)
+
+    def table(self, limit: Optional[int] = None) -> str:
+        """Text table of the peak and tensors live at the peak.
+
+        Parameters
+        ----------
+        limit:
+            Maximal number of live tensors, all tensors if None.
+
+        Returns
+        -------
+        :
+            Peak live memory and the node where it is reached, live tensors with their nodes and ONNX outputs.
+        """
+        peak = self.peak()
+        if peak is None:
+            return 'no runs'
+
+        lines = [
+            f'peak {peak.live_bytes / 1024:.1f} KiB after {peak.name} ({peak.operation_type})',
+            f'{"name":<32}{"operation type":<24}{"output":<32}{"KiB":>12}{"%":>8}',
+        ]
+        for tensor in self.live_tensors_at_peak()[:limit]:
+            lines.append(
+                f'{tensor.name:<32}{tensor.operation_type:<24}{tensor.output_name:<32}'
+                f'{tensor.num_bytes / 1024:>12.1f}{tensor.num_bytes / max(peak.live_bytes, 1) * 100:>8.1f}'
+            )
+
+        return '\n'.join(lines)
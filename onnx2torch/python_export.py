@@ -0,0 +1,440 @@
+__all__ = [
+    'export_python',
+]
+
+import ast
+import importlib
+import inspect
+import json
+import math
+import sys
+import textwrap
+import types
+import typing
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Union
+
+import torch
+from torch import fx
+from torch import nn
+
+_PACKAGE_NAME = 'onnx2torch'
+_MODEL_CLASS_NAME = 'Model'
+
+_SAFETENSORS_DTYPES = {
+    torch.float64: 'F64',
+    torch.float32: 'F32',
+    torch.float16: 'F16',
+    torch.bfloat16: 'BF16',
+    torch.int64: 'I64',
+    torch.int32: 'I32',
+    torch.int16: 'I16',
+    torch.int8: 'I8',
+    torch.uint8: 'U8',
+    torch.bool: 'BOOL',
+}
+# Memory formats which are restored on loading, tensors are stored in row-major order
+_MEMORY_FORMATS = {
+    'channels_last': torch.channels_last,
+    'channels_last_3d': torch.channels_last_3d,
+}
+# nn.Module internals which are created by nn.Module.__init__ of loaded module, hooks are not exported
+_MODULE_STATE_EXCLUDED = frozenset(nn.Module().__dict__) - {'training', '_non_persistent_buffers_set'}
+
+_ROOT_MODULE_STATE = frozenset(nn.Module().__dict__) - _MODULE_STATE_EXCLUDED
+
+# Header of generated file: safetensors reader and module construction without __init__
+_LOADER_SOURCE = '''
+_DTYPES = {dtypes}
+_MEMORY_FORMATS = {memory_formats}
+
+
+def _load_tensors(path: str) -> Dict[str, torch.Tensor]:
+    with open(path, 'rb') as file:
+        header_size = int.from_bytes(file.read(8), 'little')
+        header = json.loads(file.read(header_size))
+
+    metadata = header.pop('__metadata__', {{}})
+    data_size = max((info['data_offsets'][1] for info in header.values()), default=0)
+    # Copy-on-write memory mapping: weights are read from disk on first access and shared via page cache
+    data = torch.from_file(path, shared=False, size=8 + header_size + data_size, dtype=torch.uint8)
+    data = data[8 + header_size:]
+
+    tensors = {{}}
+    for name, info in header.items():
+        begin, end = info['data_offsets']
+        tensor = data[begin:end].view(_DTYPES[info['dtype']]).reshape(info['shape'])
+        memory_format = metadata.get('memory_format.' + name, None)
+        if memory_format is not None:
+            tensor = tensor.contiguous(memory_format=_MEMORY_FORMATS[memory_format])
+
+        tensors[name] = tensor
+
+    return tensors
+
+
+def _new_module(module_type, attributes, parameters, buffers):
+    # Modules are restored from their state, so __init__ of converted modules is not needed
+    module = module_type.__new__(module_type)
+    nn.Module.__init__(module)
+    module.__dict__.update(attributes)
+    for name, (tensor, requires_grad) in parameters.items():
+        module._parameters[name] = None if tensor is None else nn.Parameter(tensor, requires_grad=requires_grad)
+
+    module._buffers.update(buffers)
+    return module
+'''
+
+
+class _SourceCollector:
+    """Collects definitions of onnx2torch objects used by exported graph and imports of other objects."""
+
+    def __init__(self):
+        self._definitions: Dict[str, Any] = {}
+        self._sources: List[str] = []
+        self._imports: Dict[str, str] = {}
+        self._visited: Set[int] = set()
+
+    @property
+    def imports(self) -> List[str]:
+        lines = sorted(set(self._imports.values()))
+        # Import statements go first, then module level aliases (inf, nan, NoneType)
+        return sorted(lines, key=lambda line: not line.startswith(('import ', 'from ')))
+
+    @property
+    def sources(self) -> List[str]:
+        return self._sources
+
+    def _bind(self, name: str, value: Any) -> bool:
+        """Reserve global name of generated file, returns False if the name is already bound to value."""
+        if name in self._definitions:
+            if self._definitions[name] is not value:
+                raise NotImplementedError(f'Name "{name}" is used by different objects and cannot be exported')
+
+            return False
+
+        self._definitions[name] = value
+        return True
+
+    def add_import(self, name: str, value: Any) -> None:
+        if not self._bind(name, value):
+            return
+
+        if isinstance(value, types.ModuleType):
+            module_name = value.__name__
+            self._imports[name] = f'import {module_name}' if module_name == name else f'import {module_name} as {name}'
+        elif isinstance(value, float):
+            self._imports[name] = f'{name} = float({repr(str(value))})'
+        elif value is type(None):
+            self._imports[name] = f'{name} = type(None)'
+        elif getattr(value, '__module__', None) == 'typing':
+            self._imports[name] = f'from typing import {name}'
+        else:
+            module_name, qualname = value.__module__, value.__qualname__
+            if getattr(importlib.import_module(module_name), qualname, None) is not value:
+                raise NotImplementedError(f'Object "{name}" ({value}) cannot be imported in exported code')
+
+            alias = '' if qualname == name else f' as {name}'
+            self._imports[name] = f'from {module_name} import {qualname}{alias}'
+
+    def add(self, name: str, value: Any) -> None:
+        """Add global name used by exported code: definition of onnx2torch object or import of other object."""
+        module_name = getattr(value, '__module__', None) or ''
+        if not (_is_function(value) or isinstance(value, type)) or module_name.split('.')[0] != _PACKAGE_NAME:
+            self.add_import(name, value)
+            return
+
+        if id(value) in self._visited:
+            if value.__name__ != name:
+                self._sources.append(f'{name} = {value.__name__}\n')
+                self._bind(name, value)
+
+            return
+
+        self._visited.add(id(value))
+        if isinstance(value, type):
+            for base in value.__bases__:
+                if base.__module__ != 'builtins':
+                    self.add(base.__name__, base)
+
+        source = _definition_source(value)
+        self._add_dependencies(source, sys.modules[value.__module__])
+
+        self._bind(value.__name__, value)
+        self._sources.append(source)
+        if value.__name__ != name:
+            self._sources.append(f'{name} = {value.__name__}\n')
+            self._bind(name, value)
+
+    def _add_dependencies(self, source: str, module: types.ModuleType) -> None:
+        names = {node.id for node in ast.walk(ast.parse(source)) if isinstance(node, ast.Name)}
+        for name in sorted(names):
+            if name not in module.__dict__:
+                continue  # Local variables and builtins
+
+            value = module.__dict__[name]
+            if _is_function(value) or isinstance(value, (type, types.ModuleType)) or name.startswith('__'):
+                self.add(name, value)
+            elif getattr(value, '__module__', None) == 'typing' and getattr(typing, name, None) is value:
+                self.add_import(name, value)
+            elif isinstance(value, float):
+                self.add_import(name, value)
+            elif id(value) not in self._visited:
+                # Module constant, its assignment is copied from the module source
+                self._visited.add(id(value))
+                source = _assignment_source(name, module)
+                self._add_dependencies(source, module)
+                self._bind(name, value)
+                self._sources.append(source)
+
+
+def _is_function(value: Any) -> bool:
+    # Source of decorated function (e.g. with functools.lru_cache) contains its decorators
+    return isinstance(inspect.unwrap(value), types.FunctionType)
+
+
+def _definition_source(value: Union[type, types.FunctionType]) -> str:
+    source = textwrap.dedent(inspect.getsource(value))
+    if not isinstance(value, type):
+        return source
+
+    # __init__ is not used by exported modules, it often depends on onnx types
+    lines = source.splitlines(keepends=True)
+    class_node = ast.parse(source).body[0]
+    for node in reversed(class_node.body):
+        if isinstance(node, ast.FunctionDef) and node.name == '__init__':
+            begin = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list]) - 1
+            del lines[begin:node.end_lineno]
+            if len(class_node.body) == 1:
+                lines.insert(begin, '    pass\n')
+
+    return ''.join(lines)
+
+
+def _assignment_source(name: str, module: types.ModuleType) -> str:
+    source = inspect.getsource(module)
+    for node in ast.parse(source).body:
+        targets = node.targets if isinstance(node, ast.Assign) else [getattr(node, 'target', None)]
+        if any(isinstance(target, ast.Name) and target.id == name for target in targets):
+            return ast.get_source_segment(source, node) + '\n'
+
+    raise NotImplementedError(f'Global "{name}" of {module.__name__} cannot be exported')
+
+
+class _StateWriter:
+    """Turns module state into Python literals, tensors are referenced by names in the weights file."""
+
+    def __init__(self, collector: _SourceCollector):
+        self._collector = collector
+        self.tensors: Dict[str, torch.Tensor] = {}
+        self._tensor_names: Dict[int, str] = {}
+
+    def tensor(self, tensor: torch.Tensor, name: str) -> str:
+        if id(tensor) not in self._tensor_names:
+            self._tensor_names[id(tensor)] = name
+            self.tensors[name] = tensor.detach()
+
+        return f'tensors[{repr(self._tensor_names[id(tensor)])}]'
+
+    def literal(self, value: Any, name: str) -> str:  # pylint: disable=too-many-return-statements
+        if value is None or isinstance(value, (bool, int, str)):
+            return repr(value)
+        if isinstance(value, float):
+            return repr(value) if math.isfinite(value) else f'float({repr(str(value))})'
+        if isinstance(value, torch.Tensor):
+            return self.tensor(value, name)
+        if isinstance(value, (torch.dtype, torch.memory_format)):
+            return str(value)
+        if isinstance(value, torch.device):
+            return f'torch.device({repr(str(value))})'
+        if isinstance(value, torch.Size):
+            return f'torch.Size({self.literal(list(value), name)})'
+        if isinstance(value, tuple) and hasattr(type(value), '_fields'):
+            # NamedTuple (e.g. OnnxMapping), its class is exported with the model
+            type_name = type(value).__name__
+            self._collector.add(type_name, type(value))
+            items = [f'{field}={self.literal(item, f"{name}.{field}")}' for field, item in zip(value._fields, value)]
+            return f'{type_name}({", ".join(items)})'
+        if type(value) in (list, tuple, set):
+            items = [self.literal(item, f'{name}.{i}') for i, item in enumerate(value)]
+            if isinstance(value, tuple):
+                return f'({", ".join(items)}{"," if len(items) == 1 else ""})'
+            if isinstance(value, set):
+                return f'{{{", ".join(items)}}}' if items else 'set()'
+
+            return f'[{", ".join(items)}]'
+        if type(value) is dict:
+            items = [
+                f'{self.literal(key, name)}: {self.literal(item, f"{name}.{i}")}'
+                for i, (key, item) in enumerate(value.items())
+            ]
+            return f'{{{", ".join(items)}}}'
+
+        raise NotImplementedError(f'Attribute "{name}" of type {type(value).__name__} cannot be exported')
+
+    def module(self, module: nn.Module, path: str, module_type_name: str) -> str:
+        prefix = f'{path}.' if path else ''
+        # Root GraphModule keeps only nn.Module state, its graph is replaced by generated forward
+        is_root = isinstance(module, fx.GraphModule)
+        # Attributes ignored by TorchScript are runtime state (e.g. caches), they are exported empty
+        transient_names = set(getattr(module, '__jit_ignored_attributes__', ()))
+        attributes = {
+            key: self.literal(type(value)() if key in transient_names else value, prefix + key)
+            for key, value in module.__dict__.items()
+            if key not in _MODULE_STATE_EXCLUDED and (not is_root or key in _ROOT_MODULE_STATE)
+        }
+        parameters = {
+            key: '(None, False)' if value is None else f'({self.tensor(value, prefix + key)}, {value.requires_grad})'
+            for key, value in module._parameters.items()  # pylint: disable=protected-access
+        }
+        buffers = {
+            key: 'None' if value is None else self.tensor(value, prefix + key)
+            for key, value in module._buffers.items()  # pylint: disable=protected-access
+        }
+        dicts = [
+            '{' + ', '.join(f'{repr(key)}: {value}' for key, value in items.items()) + '}'
+            for items in (attributes, parameters, buffers)
+        ]
+        return f'_new_module({module_type_name}, {", ".join(dicts)})'
+
+
+def _save_tensors(tensors: Dict[str, torch.Tensor], path: Path) -> None:
+    header: Dict[str, Any] = {}
+    metadata = {'format': 'pt'}
+    # Tensors with larger elements go first, so every tensor is aligned by its element size without padding
+    names = sorted(tensors, key=lambda name: -tensors[name].element_size())
+    offset = 0
+    for name in names:
+        tensor = tensors[name]
+        if tensor.dtype not in _SAFETENSORS_DTYPES:
+            raise NotImplementedError(f'Tensor "{name}" of type {tensor.dtype} cannot be exported')
+
+        for format_name, memory_format in _MEMORY_FORMATS.items():
+            if tensor.dim() == (4 if format_name == 'channels_last' else 5) and not tensor.is_contiguous():
+                if tensor.is_contiguous(memory_format=memory_format):
+                    metadata[f'memory_format.{name}'] = format_name
+
+        nbytes = tensor.numel() * tensor.element_size()
+        header[name] = {
+            'dtype': _SAFETENSORS_DTYPES[tensor.dtype],
+            'shape': list(tensor.shape),
+            'data_offsets': [offset, offset + nbytes],
+        }
+        offset += nbytes
+
+    header['__metadata__'] = metadata
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    # Data starts at multiple of 8 bytes
+    header_bytes += b' ' * (-len(header_bytes) % 8)
+
+    with path.open('wb') as file:
+        file.write(len(header_bytes).to_bytes(8, 'little'))
+        file.write(header_bytes)
+        for name in names:
+            data = tensors[name].cpu().contiguous().reshape(-1)
+            if data.dtype == torch.bool:
+                data = data.to(torch.uint8)
+
+            # Bytes are taken through uint8 view, it supports all dtypes including bfloat16
+            file.write(data.view(torch.uint8).numpy().tobytes() if data.numel() > 0 else b'')
+
+
+def export_python(graph_module: fx.GraphModule, directory: Union[str, Path], name: str = 'model') -> Path:
+    """Export converted model as standalone Python code and weights file.
+
+    The directory gets two files:
+    - <name>.py: source of the model, it contains forward generated by torch.fx and definitions of onnx2torch
+      modules and functions used by the graph (without their __init__), it imports only torch
+      (and torchvision if the model uses its operations);
+    - <name>.safetensors: weights, buffers and initializers in safetensors format.
+
+    Exported model is loaded without onnx and onnx2torch:
+
+        from model import load_model
+        model = load_model()
+
+    Weights are memory mapped copy-on-write, so loading does not parse or copy them.
+
+    Parameters
+    ----------
+    graph_module:
+        GraphModule returned by onnx2torch.converter.convert.
+    directory:
+        Output directory, it is created if it does not exist.
+    name:
+        Name of the generated files.
+
+    Returns
+    -------
+    :
+        Path of the generated Python file.
+    """
+    if not isinstance(graph_module, fx.GraphModule):
+        raise TypeError(f'Expected fx.GraphModule, got {type(graph_module).__name__}')
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    collector = _SourceCollector()
+    for import_name, value in (('json', json), ('Path', Path), ('Dict', Dict), ('torch', torch), ('nn', nn)):
+        collector.add_import(import_name, value)
+
+    python_code = graph_module.graph.python_code(root_module='self')
+    for global_name, value in python_code.globals.items():
+        collector.add(global_name, value)
+
+    state_writer = _StateWriter(collector)
+    module_paths: Dict[int, str] = {}
+    load_lines = []
+    for path, module in graph_module.named_modules(remove_duplicate=False):
+        if id(module) not in module_paths:
+            module_paths[id(module)] = path
+            if module is graph_module:
+                module_type_name = _MODEL_CLASS_NAME
+            else:
+                module_type_name = type(module).__name__
+                collector.add(module_type_name, type(module))
+
+            load_lines.append(f'modules[{repr(path)}] = {state_writer.module(module, path, module_type_name)}')
+
+        if path:
+            parent_path, _, child_name = path.rpartition('.')
+            load_lines.append(f'modules[{repr(parent_path)}]._modules[{repr(child_name)}] = modules[{repr(path)}]')
+
+    weights_path = directory / f'{name}.safetensors'
+    _save_tensors(state_writer.tensors, weights_path)
+
+    forward_source = textwrap.indent(python_code.src.strip(), '    ')
+    loader_source = _LOADER_SOURCE.format(
+        dtypes='{' + ', '.join(f'{repr(code)}: {dtype}' for dtype, code in _SAFETENSORS_DTYPES.items()) + '}',
+        memory_formats='{' + ', '.join(f'{repr(key)}: {value}' for key, value in _MEMORY_FORMATS.items()) + '}',
+    )
+    load_source = textwrap.indent('\n'.join(load_lines), '    ')
+
+    source = '\n'.join([
+        f'"""Model exported by onnx2torch.python_export.export_python, weights are stored in {name}.safetensors."""',
+        '\n'.join(collector.imports),
+        '',
+        '',
+        '\n\n'.join(source.rstrip() + '\n' for source in collector.sources),
+        loader_source,
+        '',
+        f'class {_MODEL_CLASS_NAME}(nn.Module):',
+        forward_source,
+        '',
+        '',
+        f'def load_model(weights_path: str = str(Path(__file__).with_name({repr(weights_path.name)}))) -> nn.Module:',
+        '    tensors = _load_tensors(weights_path)',
+        '    modules = {}',
+        load_source,
+        "    return modules['']",
+        '',
+    ])
+
+    python_path = directory / f'{name}.py'
+    python_path.write_text(source)
+    return python_path
@@ -0,0 +1,236 @@
+__all__ = [
+    'SharedWeights',
+    'TensorLayout',
+    'attach_shared_weights',
+    'load_shared_model',
+    'save_shared_weights',
+    'share_weights',
+]
+
+import io
+import pickle
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import torch
+from torch import nn
+
+_ALIGNMENT = 64
+
+# Tensors are stored as integer arrays of the same element size and reinterpreted with Tensor.view(dtype)
+_INTEGER_TYPE_FROM_ELEMENT_SIZE = {
+    1: torch.uint8,
+    2: torch.int16,
+    4: torch.int32,
+    8: torch.int64,
+}
+
+
+class TensorLayout(NamedTuple):
+    offset: int
+    shape: Tuple[int, ...]
+    stride: Tuple[int, ...]
+    dtype: torch.dtype
+
+
+class SharedWeights(NamedTuple):
+    path: Path
+    tensors: Dict[str, TensorLayout]
+    module: bytes  # Pickled module which references weights by name
+
+
+class _ModulePickler(pickle.Pickler):
+    """Pickles module structure, parameters and buffers are replaced by their names."""
+
+    def __init__(self, file: io.BytesIO, module: nn.Module):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._tensor_names = {id(tensor): name for name, tensor in _named_tensors(module)}
+
+    def persistent_id(self, obj) -> Optional[Tuple[str, bool, bool]]:
+        if isinstance(obj, torch.Tensor) and id(obj) in self._tensor_names:
+            return self._tensor_names[id(obj)], isinstance(obj, nn.Parameter), obj.requires_grad
+
+        return None
+
+
+class _ModuleUnpickler(pickle.Unpickler):
+
+    def __init__(self, file: io.BytesIO, tensors: Dict[str, torch.Tensor]):
+        super().__init__(file)
+        self._tensors = tensors
+
+    def persistent_load(self, pid: Tuple[str, bool, bool]) -> torch.Tensor:
+        name, is_parameter, requires_grad = pid
+        tensor = self._tensors[name]
+        return nn.Parameter(tensor, requires_grad=requires_grad) if is_parameter else tensor
+
+
+def _named_tensors(module: nn.Module) -> Iterator[Tuple[str, torch.Tensor]]:
+    yield from module.named_parameters()
+    yield from module.named_buffers()
+
+
+def _dense_stride(tensor: torch.Tensor) -> Tuple[int, ...]:
+    # Memory format of tensor (channels_last conv weights, for example) is kept in the file
+    for memory_format in (torch.contiguous_format, torch.channels_last, torch.channels_last_3d):
+        if tensor.is_contiguous(memory_format=memory_format):
+            return tensor.stride()
+
+    return tensor.contiguous().stride()
+
+
+def _integer_type(dtype: torch.dtype) -> torch.dtype:
+    element_size = torch.empty(0, dtype=dtype).element_size()
+    if element_size not in _INTEGER_TYPE_FROM_ELEMENT_SIZE:
+        raise NotImplementedError(f'Tensors of type {dtype} cannot be shared')
+
+    return _INTEGER_TYPE_FROM_ELEMENT_SIZE[element_size]
+
+
+def _map_tensor(buffer: np.memmap, layout: TensorLayout) -> torch.Tensor:
+    numel = int(np.prod(layout.shape, dtype=np.int64))
+    if numel == 0:
+        return torch.empty_strided(layout.shape, layout.stride, dtype=layout.dtype)
+
+    element_size = torch.empty(0, dtype=layout.dtype).element_size()
+    tensor = torch.from_numpy(buffer[layout.offset:layout.offset + numel * element_size])
+    return tensor.view(_integer_type(layout.dtype)).view(layout.dtype).as_strided(layout.shape, layout.stride)
+
+
+def _map_tensors(shared_weights: SharedWeights) -> Dict[str, torch.Tensor]:
+    if shared_weights.path.stat().st_size == 0:
+        buffer = np.empty(0, dtype=np.uint8)
+    else:
+        # Copy-on-write mapping: pages are shared by all processes until one of them writes to the tensor
+        buffer = np.memmap(shared_weights.path, dtype=np.uint8, mode='c')
+
+    return {name: _map_tensor(buffer, layout) for name, layout in shared_weights.tensors.items()}
+
+
+def share_weights(module: nn.Module) -> nn.Module:
+    """Move parameters and buffers of module (including InitializersContainer buffers) to shared memory.
+
+    Module is passed to worker processes started with torch.multiprocessing (spawn or forkserver) as a process
+    argument or through torch.multiprocessing.Queue, workers get tensors which reference the same memory
+    without conversion and copying.
+
+    Parameters
+    ----------
+    module:
+        Module with weights to share, for example GraphModule returned by onnx2torch.converter.convert.
+        It is modified in place.
+
+    Returns
+    -------
+    :
+        The same module.
+    """
+    for _, tensor in _named_tensors(module):
+        tensor.share_memory_()
+
+    return module
+
+
+def save_shared_weights(module: nn.Module, path: Union[str, Path]) -> SharedWeights:
+    """Save parameters and buffers of module to file and replace them by memory mapped views of this file.
+
+    File-backed alternative to share_weights for workers which are not started by the converting process.
+    Workers create the model with load_shared_model (without conversion) or attach the file to the model
+    converted by themselves with attach_shared_weights. Tensors of all processes which map the same file share
+    physical memory (page cache), so N worker processes hold one copy of weights. InitializersContainer buffers of converted
+    models are buffers, so they are shared too. Tensors are mapped copy-on-write: in-place modification
+    of weights in one process is not visible to others.
+
+    Parameters
+    ----------
+    module:
+        Module with weights to share, for example GraphModule returned by onnx2torch.converter.convert.
+        It is modified in place.
+    path:
+        Path of the weights file, it must stay available while models are in use.
+
+    Returns
+    -------
+    :
+        Picklable description of the file which is passed to workers.
+    """
+    path = Path(path)
+    tensors: Dict[str, TensorLayout] = {}
+    offset = 0
+    with path.open('wb') as file:
+        for name, tensor in _named_tensors(module):
+            stride = _dense_stride(tensor)
+            dense = torch.empty_strided(tensor.shape, stride, dtype=tensor.dtype)
+            dense.copy_(tensor.detach())
+
+            offset = (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+            file.seek(offset)
+            data = dense.as_strided((dense.numel(),), (1,)).view(_integer_type(tensor.dtype)).numpy()
+            file.write(data.tobytes())
+
+            tensors[name] = TensorLayout(offset=offset, shape=tuple(tensor.shape), stride=stride, dtype=tensor.dtype)
+            offset += data.nbytes
+
+    shared_weights = SharedWeights(path=path, tensors=tensors, module=b'')
+    attach_shared_weights(module, shared_weights)
+
+    module_file = io.BytesIO()
+    _ModulePickler(module_file, module).dump(module)
+    return shared_weights._replace(module=module_file.getvalue())
+
+
+def load_shared_model(shared_weights: SharedWeights) -> nn.Module:
+    """Create model saved by save_shared_weights, its parameters and buffers are memory mapped views of the file.
+
+    Parameters
+    ----------
+    shared_weights:
+        Value returned by save_shared_weights.
+
+    Returns
+    -------
+    :
+        Copy of the saved module which shares weights with all other copies.
+    """
+    return _ModuleUnpickler(io.BytesIO(shared_weights.module), _map_tensors(shared_weights)).load()
+
+
+def attach_shared_weights(module: nn.Module, shared_weights: SharedWeights) -> None:
+    """Replace parameters and buffers of module by memory mapped views of file saved by save_shared_weights.
+
+    Module is usually converted by the worker from the same onnx model with the same options.
+    Note that memory allocated for weights during conversion can be kept by the allocator of the worker process
+    after attaching, load_shared_model does not allocate weights at all.
+
+    Parameters
+    ----------
+    module:
+        Module with the same parameters and buffers as the saved one, it is modified in place.
+    shared_weights:
+        Value returned by save_shared_weights.
+    """
+    named_tensors = dict(_named_tensors(module))
+    if named_tensors.keys() != shared_weights.tensors.keys():
+        raise ValueError('Module parameters and buffers do not match shared weights')
+
+    for name, layout in shared_weights.tensors.items():
+        tensor = named_tensors[name]
+        if tuple(tensor.shape) != layout.shape or tensor.dtype != layout.dtype:
+            raise ValueError(
+                f'Shared weight "{name}" has shape {layout.shape} and type {layout.dtype}, '
+                f'got {tuple(tensor.shape)} and {tensor.dtype}'
+            )
+
+    for name, mapped_tensor in _map_tensors(shared_weights).items():
+        module_name, _, tensor_name = name.rpartition('.')
+        submodule = module.get_submodule(module_name)
+        if tensor_name in submodule._parameters:  # pylint: disable=protected-access
+            submodule._parameters[tensor_name].data = mapped_tensor  # pylint: disable=protected-access
+        else:
+            submodule._buffers[tensor_name] = mapped_tensor  # pylint: disable=protected-access
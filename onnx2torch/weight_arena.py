@@ -0,0 +1,239 @@
+__all__ = [
+    'load_packed_weights',
+    'move_packed_weights',
+    'pack_weights',
+    'save_packed_weights',
+]
+
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import torch
+from torch import nn
+
+_ALIGNMENT = 64
+
+
+def _module_tensors(module: nn.Module) -> Iterator[Tuple[nn.Module, str, torch.Tensor]]:
+    # All places where tensors are registered, a tensor can be registered in several modules
+    for submodule in module.modules():
+        for tensors in (submodule._parameters, submodule._buffers):  # pylint: disable=protected-access
+            for name, tensor in tensors.items():
+                if tensor is not None:
+                    yield submodule, name, tensor
+
+
+def _set_tensor(module: nn.Module, name: str, tensor: torch.Tensor) -> None:
+    # pylint: disable=protected-access
+    if name in module._parameters:
+        parameter = module._parameters[name]
+        # Parameter object is kept if possible (like nn.Module.to does), so optimizers still reference it
+        if torch._has_compatible_shallow_copy_type(parameter, tensor):
+            parameter.data = tensor
+        else:
+            module._parameters[name] = nn.Parameter(tensor, requires_grad=parameter.requires_grad)
+    else:
+        module._buffers[name] = tensor
+
+
+def _align(size: int, alignment: int) -> int:
+    return (size + alignment - 1) // alignment * alignment
+
+
+def _storage_size(tensor: torch.Tensor) -> int:
+    # Size in bytes of the memory spanned by tensor with its strides
+    if tensor.numel() == 0:
+        return 0
+
+    return (sum((size - 1) * stride for size, stride in zip(tensor.shape, tensor.stride())) + 1) * tensor.element_size()
+
+
+def _view(arena: torch.Tensor, offset: int, tensor: torch.Tensor) -> torch.Tensor:
+    data = arena[offset:offset + _storage_size(tensor)].view(tensor.dtype)
+    return data.as_strided(tensor.shape, tensor.stride())
+
+
+def _packed_arenas(module: nn.Module) -> Optional[List[torch.Tensor]]:
+    """Returns arenas (uint8 tensors over whole storages) if tensors of module are packed, one storage per dtype."""
+    storages: Dict[int, torch.UntypedStorage] = {}
+    storage_dtypes: Dict[int, torch.dtype] = {}
+    for _, _, tensor in _module_tensors(module):
+        storage = tensor.untyped_storage()
+        if storage_dtypes.setdefault(storage.data_ptr(), tensor.dtype) != tensor.dtype:
+            return None
+
+        storages[storage.data_ptr()] = storage
+
+    if len(set(storage_dtypes.values())) != len(storages):
+        return None
+
+    return [torch.empty(0, dtype=torch.uint8, device=storage.device).set_(storage) for storage in storages.values()]
+
+
+def _rebind(module: nn.Module, arenas: List[torch.Tensor], new_arenas: List[torch.Tensor]) -> None:
+    # Tensors of module are replaced by views with the same offsets into the corresponding new arenas
+    arena_indices = {arena.untyped_storage().data_ptr(): index for index, arena in enumerate(arenas)}
+    new_tensors: Dict[int, torch.Tensor] = {}
+    for submodule, name, tensor in list(_module_tensors(module)):
+        if id(tensor) not in new_tensors:
+            new_arena = new_arenas[arena_indices[tensor.untyped_storage().data_ptr()]]
+            offset = tensor.storage_offset() * tensor.element_size()
+            new_tensors[id(tensor)] = _view(new_arena, offset, tensor)
+
+        _set_tensor(submodule, name, new_tensors[id(tensor)])
+
+
+def _get_packed_arenas(module: nn.Module) -> List[torch.Tensor]:
+    arenas = _packed_arenas(module)
+    if arenas is None:
+        raise ValueError('Module weights are not packed, use pack_weights')
+
+    return arenas
+
+
+def pack_weights(module: nn.Module, alignment: int = _ALIGNMENT) -> List[torch.Tensor]:
+    """Pack parameters and buffers of module (including InitializersContainer buffers) into one storage per dtype.
+
+    Every tensor becomes a view into a contiguous uint8 arena of its dtype, tensors start at aligned offsets
+    and keep their strides (memory format). A model with thousands of initializers holds a few allocations
+    (usually float weights and int64 BatchNorm counters or shapes) instead of thousands, save_packed_weights
+    and load_packed_weights read and write them at once, move_packed_weights moves them to another device
+    with a transfer per arena. Views of one storage have the same dtype, so the packed module is still saved
+    with torch.save.
+
+    Note that nn.Module.to moves tensors one by one and the moved module is not packed anymore.
+
+    Parameters
+    ----------
+    module:
+        Module to pack, for example GraphModule returned by onnx2torch.converter.convert.
+        It is modified in place.
+    alignment:
+        Alignment of tensors and arena sizes in bytes.
+
+    Returns
+    -------
+    :
+        Arenas, uint8 tensors which hold all weights, one per dtype.
+    """
+    layouts: Dict[int, Tuple[torch.dtype, int, torch.Tensor]] = {}
+    sizes: Dict[torch.dtype, int] = {}
+    devices = set()
+    for _, _, tensor in _module_tensors(module):
+        if id(tensor) not in layouts:
+            # Dense tensors keep their strides, other tensors become contiguous
+            dense = torch.empty_like(tensor, device='meta')
+            offset = _align(sizes.get(tensor.dtype, 0), alignment)
+            layouts[id(tensor)] = tensor.dtype, offset, dense
+            sizes[tensor.dtype] = offset + _storage_size(dense)
+            devices.add(tensor.device)
+
+    if len(devices) > 1:
+        raise ValueError(f'Module weights are on different devices ({devices}), they cannot be packed')
+
+    device = next(iter(devices), torch.device('cpu'))
+    # Sizes are aligned, so arenas are concatenated in the weights file without padding, zeroed padding keeps
+    # the file reproducible; empty arenas would share null storage
+    arenas = {
+        dtype: torch.zeros(max(_align(size, alignment), alignment), dtype=torch.uint8, device=device)
+        for dtype, size in sizes.items()
+    }
+    new_tensors: Dict[int, torch.Tensor] = {}
+    for submodule, name, tensor in list(_module_tensors(module)):
+        if id(tensor) not in new_tensors:
+            dtype, offset, dense = layouts[id(tensor)]
+            new_tensor = _view(arenas[dtype], offset, dense)
+            new_tensor.copy_(tensor.detach())
+            new_tensors[id(tensor)] = new_tensor
+
+        _set_tensor(submodule, name, new_tensors[id(tensor)])
+
+    return list(arenas.values())
+
+
+def move_packed_weights(module: nn.Module, device: Union[str, torch.device]) -> nn.Module:
+    """Move weights packed by pack_weights to device with a single transfer per arena.
+
+    Parameters
+    ----------
+    module:
+        Module with packed weights, it is modified in place.
+    device:
+        Target device.
+
+    Returns
+    -------
+    :
+        The same module.
+    """
+    arenas = _get_packed_arenas(module)
+    _rebind(module, arenas, [arena.to(device) for arena in arenas])
+    return module
+
+
+def save_packed_weights(module: nn.Module, path: Union[str, Path]) -> None:
+    """Save weights packed by pack_weights to file with a single write per arena.
+
+    File contains raw bytes of the arenas one after another, it is loaded to a module converted with the same
+    options.
+
+    Parameters
+    ----------
+    module:
+        Module with packed weights.
+    path:
+        Path of the weights file.
+    """
+    with Path(path).open('wb') as file:
+        for arena in _get_packed_arenas(module):
+            file.write(memoryview(arena.cpu().numpy()))
+
+
+def load_packed_weights(module: nn.Module, path: Union[str, Path], mmap: bool = False) -> nn.Module:
+    """Load weights saved by save_packed_weights to module with packed weights.
+
+    Parameters
+    ----------
+    module:
+        Module with packed weights of the same layout as the saved one (converted with the same options),
+        it is modified in place.
+    path:
+        Path of the weights file.
+    mmap:
+        Whether to map the file to memory (copy-on-write) instead of reading it.
+
+    Returns
+    -------
+    :
+        The same module.
+    """
+    arenas = _get_packed_arenas(module)
+    path = Path(path)
+    size = path.stat().st_size
+    expected_size = sum(arena.numel() for arena in arenas)
+    if size != expected_size:
+        raise ValueError(f'Weights file has size {size}, expected packed weights of size {expected_size}')
+
+    new_arenas = []
+    offset = 0
+    with path.open('rb') as file:
+        for arena in arenas:
+            if mmap:
+                # Arenas are separate storages, so every arena maps its own part of the file
+                array = np.memmap(path, dtype=np.uint8, mode='c', offset=offset, shape=(arena.numel(),))
+                new_arena = torch.from_numpy(array)
+            else:
+                new_arena = torch.empty(arena.numel(), dtype=torch.uint8)
+                file.readinto(memoryview(new_arena.numpy()))
+
+            new_arenas.append(new_arena.to(arena.device))
+            offset += arena.numel()
+
+    _rebind(module, arenas, new_arenas)
+    return module
@@ -0,0 +1,44 @@
+import importlib
+import subprocess
+import sys
+
+from onnx2torch.node_converters.converter_index import CONVERTER_MODULES
+from onnx2torch.node_converters.converter_index import import_converter_modules
+from onnx2torch.node_converters.registry import _CONVERTER_REGISTRY
+from onnx2torch.passes import _PASS_MODULES
+
+_LAZY_IMPORT_SCRIPT = '''
+import sys
+from onnx2torch.converter import convert
+from onnx2torch.node_converters import get_converter
+
+assert 'torchvision' not in sys.modules
+assert 'onnx2torch.node_converters.nms' not in sys.modules
+# Passes import converter modules which they rewrite, they must not be imported with the converter
+assert 'onnx2torch.node_converters.reshape' not in sys.modules
+assert 'onnx2torch.node_converters.gather' not in sys.modules
+
+get_converter(operation_type='NonMaxSuppression', version=11)
+assert 'onnx2torch.node_converters.nms' in sys.modules
+'''
+
+
+def test_converter_index() -> None:
+    import_converter_modules()
+    converter_modules = {
+        tuple(description): converter.__module__.rpartition('.')[2]
+        for description, converter in _CONVERTER_REGISTRY.items()
+        if converter.__module__.startswith('onnx2torch.node_converters.')
+    }
+    # Run "python -m onnx2torch.node_converters" to update the index
+    assert converter_modules == CONVERTER_MODULES
+
+
+def test_pass_modules() -> None:
+    # Names of onnx2torch.passes are resolved on first access
+    for name, module_name in _PASS_MODULES.items():
+        assert name in importlib.import_module(f'onnx2torch.passes.{module_name}').__all__
+
+
+def test_lazy_import() -> None:
+    subprocess.run([sys.executable, '-c', _LAZY_IMPORT_SCRIPT], check=True)
@@ -1,6 +1,13 @@
+from typing import List
+
 import numpy as np
 import onnx
 import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
 
 from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
@@ -32,3 +39,101 @@ def test_math_binary_operation(op_type) -> None:
 
         model = make_model_from_nodes(nodes=node, initializers=initializers, inputs_example=test_inputs)
         check_model(model, test_inputs)
+
+
+@pytest.mark.parametrize('op_type', ('Add', 'Sub', 'Mul', 'Div', 'Pow', 'Mod'))
+@pytest.mark.parametrize('constant_shape', ([], [1], [1, 1, 1]))
+@pytest.mark.parametrize('constant_first', (False, True))
+def test_math_binary_operation_scalar_constant(op_type: str, constant_shape: List[int], constant_first: bool) -> None:
+    input_shape = [2, 3, 4]
+    if op_type == 'Mod':
+        # x is a divisor if the constant is first, so zero is excluded
+        x = np.random.randint(low=1, high=100, size=input_shape) * np.random.choice([-1, 1], size=input_shape)
+        x = x.astype(np.int64)
+        y = np.full(constant_shape, fill_value=7, dtype=np.int64)
+    else:
+        x = np.random.uniform(low=0.5, high=2.0, size=input_shape).astype(np.float32)
+        y = np.full(constant_shape, fill_value=1.7, dtype=np.float32)
+
+    test_inputs = {'x': x}
+    node = onnx.helper.make_node(
+        op_type=op_type,
+        inputs=['y', 'x'] if constant_first else ['x', 'y'],
+        outputs=['z'],
+    )
+
+    model = make_model_from_nodes(nodes=node, initializers={'y': y}, inputs_example=test_inputs, opset_version=13)
+    check_model(model, test_inputs, atol_onnx_torch=1e-6)
+
+
+@pytest.mark.parametrize('fmod', (0, 1))
+def test_mod(fmod: int) -> None:
+    x = np.random.randint(low=-100, high=100, size=[2, 3, 4]).astype(np.int32)
+    y = np.random.choice([-7, -3, 3, 7], size=[3, 4]).astype(np.int32)
+    test_inputs = {'x': x, 'y': y}
+    node = onnx.helper.make_node(op_type='Mod', inputs=['x', 'y'], outputs=['z'], fmod=fmod)
+
+    model = make_model_from_nodes(nodes=node, initializers={}, inputs_example=test_inputs, opset_version=13)
+    check_model(model, test_inputs)
+
+
+def test_math_binary_operation_legacy_broadcast() -> None:
+    x = np.random.uniform(low=-1.0, high=1.0, size=[2, 3, 4, 5]).astype(np.float32)
+    y = np.random.uniform(low=-1.0, high=1.0, size=[3, 4]).astype(np.float32)
+    test_inputs = {'x': x, 'y': y}
+    node = onnx.helper.make_node(op_type='Add', inputs=['x', 'y'], outputs=['z'], broadcast=1, axis=1)
+
+    model = make_model_from_nodes(
+        nodes=node,
+        initializers={},
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='z', elem_type=TensorProto.FLOAT, shape=x.shape)],
+        opset_version=6,
+    )
+    expected = x + y[np.newaxis, :, :, np.newaxis]
+    torch_output = convert(model)(torch.tensor(x), torch.tensor(y))
+    assert np.allclose(torch_output.numpy(), expected)
+
+
+@pytest.mark.parametrize('op_type', ('Max', 'Min', 'Sum', 'Mean'))
+@pytest.mark.parametrize('with_constants', (False, True))
+def test_variadic_math_operation(op_type: str, with_constants: bool) -> None:
+    test_inputs = {
+        'x_0': np.random.uniform(low=-1.0, high=1.0, size=[2, 3, 4]).astype(np.float32),
+        'x_1': np.random.uniform(low=-1.0, high=1.0, size=[3, 1]).astype(np.float32),
+        'x_2': np.random.uniform(low=-1.0, high=1.0, size=[4]).astype(np.float32),
+    }
+    initializers = {}
+    if with_constants:
+        initializers = {
+            'c_0': np.array(0.1, dtype=np.float32),
+            'c_1': np.array([[-0.2]], dtype=np.float32),
+        }
+
+    node = onnx.helper.make_node(
+        op_type=op_type,
+        inputs=[*test_inputs, *initializers],
+        outputs=['y'],
+    )
+    model = make_model_from_nodes(nodes=node, initializers=initializers, inputs_example=test_inputs, opset_version=13)
+    # Constants are folded into one operand, so sums near zero differ by rounding
+    check_model(model, test_inputs, atol_onnx_torch=1e-6, atol_onnx_torch2onnx=1e-6)
+
+
+@pytest.mark.parametrize('op_type', ('Max', 'Min', 'Sum', 'Mean'))
+def test_variadic_math_operation_constant_rank(op_type: str) -> None:
+    # Constant c_0 has higher rank than the input, it broadcasts output to its rank
+    test_inputs = {'x': np.random.uniform(low=-1.0, high=1.0, size=[3]).astype(np.float32)}
+    constants = {
+        'c_0': np.array([[1.0]], dtype=np.float32),
+        'c_1': np.array(0.5, dtype=np.float32),
+    }
+    nodes = [
+        onnx.helper.make_node(op_type='Constant', inputs=[], outputs=[name], value=onnx.numpy_helper.from_array(value))
+        for name, value in constants.items()
+    ]
+    nodes.append(onnx.helper.make_node(op_type=op_type, inputs=['x', *constants], outputs=['y']))
+    model = make_model_from_nodes(nodes=nodes, initializers={}, inputs_example=test_inputs, opset_version=13)
+    check_model(model, test_inputs, atol_onnx_torch=1e-6, atol_onnx_torch2onnx=1e-6)
+    # check_model compares outputs with broadcasting, so output shape is checked separately
+    assert convert(model)(torch.tensor(test_inputs['x'])).shape == (1, 3)
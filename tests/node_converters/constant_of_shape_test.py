@@ -10,13 +10,18 @@ from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
 
 
-def _test_constant_of_shape(shape: np.ndarray, value: np.ndarray) -> None:
-    test_inputs = {'shape': shape}
+def _test_constant_of_shape(shape: np.ndarray, value: np.ndarray, constant_shape: bool = False) -> None:
+    test_inputs, initializers = {}, {}
+    if constant_shape:
+        initializers['shape'] = shape
+    else:
+        test_inputs['shape'] = shape
+
     onnx_type = NP_TYPE_TO_TENSOR_TYPE[value.dtype]
 
     node = onnx.helper.make_node(
         'ConstantOfShape',
-        inputs=list(test_inputs),
+        inputs=['shape'],
         outputs=['output'],
         value=numpy_helper.from_array(value, name='value'),
     )
@@ -25,7 +30,7 @@ def _test_constant_of_shape(shape: np.ndarray, value: np.ndarray) -> None:
 
     model = make_model_from_nodes(
         nodes=node,
-        initializers={},
+        initializers=initializers,
         inputs_example=test_inputs,
         outputs_info=outputs_info,
     )
@@ -38,3 +43,11 @@ def test_constant_of_shape() -> None:
         shape = np.random.randint(low=1, high=2, size=(size,))
         value = np.random.uniform(low=-10000, high=10000, size=(1,))
         _test_constant_of_shape(shape, value)
+
+
+def test_constant_of_shape_constant_shape() -> None:
+    _test_constant_of_shape(
+        shape=np.array([2, 3, 4], dtype=np.int64),
+        value=np.array([7], dtype=np.int32),
+        constant_shape=True,
+    )
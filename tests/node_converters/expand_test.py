@@ -13,24 +13,27 @@ from tests.utils.common import make_model_from_nodes
 def _test_expand(
         data: np.ndarray,
         shape: List[int],
+        constant_shape: bool = False,
 ) -> None:
-    test_inputs = {
-        'x': data,
-        'shape': np.array(shape, dtype=np.int64),
-    }
+    test_inputs = {'x': data}
+    initializers = {}
+    if constant_shape:
+        initializers['shape'] = np.array(shape, dtype=np.int64)
+    else:
+        test_inputs['shape'] = np.array(shape, dtype=np.int64)
 
-    node = onnx.helper.make_node(op_type='Expand', inputs=list(test_inputs), outputs=['y'])
+    node = onnx.helper.make_node(op_type='Expand', inputs=['x', 'shape'], outputs=['y'])
     outputs_info = [
         make_tensor_value_info(
             name='y',
             elem_type=NP_TYPE_TO_TENSOR_TYPE[data.dtype],
-            shape=[],
+            shape=None,
         ),
     ]
 
     model = make_model_from_nodes(
         nodes=node,
-        initializers={},
+        initializers=initializers,
         inputs_example=test_inputs,
         outputs_info=outputs_info,
     )
@@ -50,3 +53,21 @@ def test_expand(src_shape: List[int], dst_shape: List[int]) -> None:
         data=data,
         shape=dst_shape,
     )
+
+
+@pytest.mark.parametrize(
+    'src_shape,dst_shape',
+    (
+        ([3, 1], [2, 1, 6]),
+        ([3, 1], [3, 4]),
+        ([1, 1, 4], [2, 3, 1]),
+        ([2, 3, 4], [4]),
+    ),
+)
+def test_expand_constant_shape(src_shape: List[int], dst_shape: List[int]) -> None:
+    data = np.reshape(np.arange(1, np.prod(src_shape) + 1, dtype=np.float32), src_shape)
+    _test_expand(
+        data=data,
+        shape=dst_shape,
+        constant_shape=True,
+    )
@@ -1,6 +1,12 @@
 import numpy as np
 import onnx
+import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+from onnx.mapping import NP_TYPE_TO_TENSOR_TYPE
 
+from onnx2torch.converter import convert
 from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
 
@@ -9,24 +15,30 @@ def _test_gather(
         input_array: np.ndarray,
         indices: np.ndarray,
         opset_version: int,
+        constant_input: bool = False,
+        constant_indices: bool = False,
         **kwargs,
 ) -> None:
-    test_inputs = {
-        'x': input_array,
-        'indices': indices,
-    }
+    test_inputs, initializers = {}, {}
+    (initializers if constant_input else test_inputs)['x'] = input_array
+    (initializers if constant_indices else test_inputs)['indices'] = indices
 
     node = onnx.helper.make_node(
         'Gather',
-        inputs=list(test_inputs),
+        inputs=['x', 'indices'],
         outputs=['y'],
         **kwargs,
     )
 
+    outputs_info = [
+        make_tensor_value_info(name='y', elem_type=NP_TYPE_TO_TENSOR_TYPE[input_array.dtype], shape=None),
+    ]
+
     model = make_model_from_nodes(
         nodes=node,
-        initializers={},
+        initializers=initializers,
         inputs_example=test_inputs,
+        outputs_info=outputs_info,
         opset_version=opset_version,
     )
     check_model(model, test_inputs)
@@ -51,3 +63,75 @@ def test_gather() -> None:
     _test_gather(input_array=input_tensor, indices=indices, axis=1, opset_version=9)
     _test_gather(input_array=input_tensor, indices=indices, axis=0, opset_version=13)
     _test_gather(input_array=input_tensor, indices=indices, axis=1, opset_version=13)
+
+
+@pytest.mark.parametrize(
+    'indices,axis',
+    (
+            (np.array(1, dtype=np.int64), 0),
+            (np.array(-1, dtype=np.int64), 1),
+            (np.array([1, 2], dtype=np.int64), 1),
+            (np.array([-3, -2], dtype=np.int64), 2),
+            (np.array([2, 0], dtype=np.int64), 0),
+            (np.array([[0, 1], [1, 2]], dtype=np.int64), -1),
+    ),
+)
+def test_gather_constant_indices(indices: np.ndarray, axis: int) -> None:
+    input_tensor = np.random.randn(3, 4, 5).astype(np.float32)
+    _test_gather(
+        input_array=input_tensor,
+        indices=indices,
+        axis=axis,
+        opset_version=13,
+        constant_indices=True,
+    )
+
+
+@pytest.mark.parametrize(
+    'indices,axis',
+    (
+            (np.array([[1, 0], [-1, 9]], dtype=np.int64), 0),
+            (np.array(3, dtype=np.int64), 0),
+            (np.array([1, 0], dtype=np.int64), 1),
+    ),
+)
+def test_gather_constant_table(indices: np.ndarray, axis: int) -> None:
+    input_tensor = np.random.randn(10, 4, 3).astype(np.float32)
+    _test_gather(
+        input_array=input_tensor,
+        indices=indices,
+        axis=axis,
+        opset_version=13,
+        constant_input=True,
+    )
+
+
+def test_gather_shared_table() -> None:
+    # Tied embeddings: both Gathers read one initializer, the table is stored once
+    nodes = [
+        onnx.helper.make_node('Gather', inputs=['table', 'first_indices'], outputs=['first']),
+        onnx.helper.make_node('Gather', inputs=['table', 'second_indices'], outputs=['second']),
+        onnx.helper.make_node('Add', inputs=['first', 'second'], outputs=['y']),
+    ]
+    table = np.random.randn(1000, 64).astype(np.float32)
+    test_inputs = {
+        'first_indices': np.array([[1, 0], [-1, 9]], dtype=np.int64),
+        'second_indices': np.array([[3, 999], [5, -1000]], dtype=np.int64),
+    }
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers={'table': table},
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=None)],
+        opset_version=13,
+    )
+    check_model(model, test_inputs)
+
+    torch_model = convert(model)
+    storages = {
+        tensor.untyped_storage().data_ptr()
+        for tensor in list(torch_model.parameters()) + list(torch_model.buffers())
+        if tensor.numel() == table.size
+    }
+    assert len(storages) == 1
+    assert torch.equal(torch_model.get_buffer('initializers.table'), torch.from_numpy(table))
@@ -1,3 +1,4 @@
+from typing import Optional
 from typing import Tuple
 
 import numpy as np
@@ -58,3 +59,59 @@ def test_advanced_gemm() -> None:
         alpha=0.25,
         beta=0.5,
     )
+
+
+def _test_dynamic_gemm(
+        a_shape: Tuple[int, int],
+        b_shape: Tuple[int, int],
+        c_shape: Optional[Tuple[int, ...]],
+        constant_c: bool = False,
+        **kwargs,
+) -> None:
+    test_inputs = {
+        'a': np.random.uniform(low=-1.0, high=1.0, size=a_shape).astype(np.float32),
+        'b': np.random.uniform(low=-1.0, high=1.0, size=b_shape).astype(np.float32),
+    }
+    initializers = {}
+    if c_shape is not None:
+        c = np.random.uniform(low=-1.0, high=1.0, size=c_shape).astype(np.float32)
+        if constant_c:
+            initializers['c'] = c
+        else:
+            test_inputs['c'] = c
+
+    node = onnx.helper.make_node(
+        op_type='Gemm',
+        inputs=['a', 'b', 'c'] if c_shape is not None else ['a', 'b'],
+        outputs=['y'],
+        **kwargs,
+    )
+    model = make_model_from_nodes(nodes=node, initializers=initializers, inputs_example=test_inputs)
+    check_model(
+        model,
+        test_inputs,
+        atol_onnx_torch=10**-5,
+        atol_torch_cpu_cuda=10**-5,
+        atol_onnx_torch2onnx=10**-5,
+    )
+
+
+def test_dynamic_gemm() -> None:
+    _test_dynamic_gemm(a_shape=(4, 16), b_shape=(16, 8), c_shape=None)
+    _test_dynamic_gemm(a_shape=(4, 16), b_shape=(16, 8), c_shape=None, alpha=0.5)
+    _test_dynamic_gemm(a_shape=(4, 16), b_shape=(16, 8), c_shape=(4, 8), alpha=0.5, beta=2.0)
+    _test_dynamic_gemm(a_shape=(16, 4), b_shape=(8, 16), c_shape=(8,), transA=1, transB=1)
+    _test_dynamic_gemm(a_shape=(16, 4), b_shape=(16, 8), c_shape=(1, 8), transA=1, beta=0.25)
+    _test_dynamic_gemm(a_shape=(4, 16), b_shape=(16, 8), c_shape=(4, 1), constant_c=True, alpha=0.5)
+
+
+def test_constant_weights_gemm_broadcast_bias() -> None:
+    x = np.random.uniform(low=-1.0, high=1.0, size=(4, 16)).astype(np.float32)
+    for bias_shape in ((1, 8), (4, 8), ()):
+        initializers = {
+            'weights': np.random.uniform(low=-1.0, high=1.0, size=(16, 8)).astype(np.float32),
+            'bias': np.random.uniform(low=-1.0, high=1.0, size=bias_shape).astype(np.float32),
+        }
+        node = onnx.helper.make_node(op_type='Gemm', inputs=['x', 'weights', 'bias'], outputs=['y'], beta=0.5)
+        model = make_model_from_nodes(nodes=node, initializers=initializers, inputs_example={'x': x})
+        check_model(model, {'x': x}, atol_onnx_torch=10**-5, atol_torch_cpu_cuda=10**-5, atol_onnx_torch2onnx=10**-5)
@@ -11,9 +11,15 @@ def _test_range(
         start: np.ndarray,
         limit: np.ndarray,
         delta: np.ndarray,
+        constant_inputs: bool = False,
 ) -> None:
-    test_inputs = dict(start=start, limit=limit, delta=delta)
-    node = onnx.helper.make_node(op_type='Range', inputs=list(test_inputs), outputs=['y'])
+    test_inputs, initializers = {}, {}
+    if constant_inputs:
+        initializers = dict(start=start, limit=limit, delta=delta)
+    else:
+        test_inputs = dict(start=start, limit=limit, delta=delta)
+
+    node = onnx.helper.make_node(op_type='Range', inputs=['start', 'limit', 'delta'], outputs=['y'])
 
     num_elements = int(max(np.ceil((limit - start) / delta), 0))
     outputs_info = [
@@ -25,7 +31,7 @@ def _test_range(
     ]
     model = make_model_from_nodes(
         nodes=node,
-        initializers={},
+        initializers=initializers,
         inputs_example=test_inputs,
         outputs_info=outputs_info,
     )
@@ -48,3 +54,18 @@ def test_range() -> None:
         limit=np.array(60, dtype=np.int64),
         delta=np.array(7, dtype=np.int64),
     )
+
+
+def test_range_constant_inputs() -> None:
+    _test_range(
+        start=np.array(1, dtype=np.int64),
+        limit=np.array(60, dtype=np.int64),
+        delta=np.array(7, dtype=np.int64),
+        constant_inputs=True,
+    )
+    _test_range(
+        start=np.array(10.0, dtype=np.float32),
+        limit=np.array(6.0, dtype=np.float32),
+        delta=np.array(-2.3, dtype=np.float32),
+        constant_inputs=True,
+    )
@@ -0,0 +1,94 @@
+from typing import List
+from typing import Optional
+
+import numpy as np
+import onnx
+import pytest
+
+from tests.utils.common import check_model
+from tests.utils.common import make_model_from_nodes
+
+_REDUCE_OPERATIONS = (
+    'ReduceL1',
+    'ReduceL2',
+    'ReduceLogSumExp',
+    'ReduceMax',
+    'ReduceMean',
+    'ReduceMin',
+    'ReduceProd',
+    'ReduceSum',
+    'ReduceSumSquare',
+)
+
+
+def _test_reduce(
+        operation_type: str,
+        input_tensor: np.ndarray,
+        axes: Optional[List[int]],
+        opset_version: int,
+        axes_as_input: bool,
+        **kwargs,
+) -> None:
+    test_inputs = {'input_tensor': input_tensor}
+    initializers = {}
+
+    if axes is not None:
+        if axes_as_input:
+            initializers['axes'] = np.array(axes, dtype=np.int64)
+        else:
+            kwargs['axes'] = axes
+
+    node = onnx.helper.make_node(
+        op_type=operation_type,
+        inputs=list(test_inputs) + list(initializers),
+        outputs=['y'],
+        **kwargs,
+    )
+    model = make_model_from_nodes(
+        nodes=node,
+        initializers=initializers,
+        inputs_example=test_inputs,
+        opset_version=opset_version,
+    )
+    check_model(model, test_inputs, atol_onnx_torch=1e-5, atol_torch_cpu_cuda=1e-5, atol_onnx_torch2onnx=1e-5)
+
+
+@pytest.mark.parametrize('operation_type', _REDUCE_OPERATIONS)
+@pytest.mark.parametrize(
+    'shape,axes,keepdims',
+    (
+            ((2, 3, 4, 5), None, 0),
+            ((2, 3, 4, 5), None, 1),
+            ((2, 3, 4, 5), [1], 0),
+            ((2, 3, 4, 5), [-2], 1),
+            ((2, 3, 4, 5), [3, 1], 0),
+            ((2, 3, 4, 5), [-1, 0], 1),
+            ((2, 3, 4, 5), [-3, 2], 0),
+    ),
+)
+@pytest.mark.parametrize('opset_version', (11, 18))
+def test_reduce(operation_type: str, shape: List[int], axes: Optional[List[int]], keepdims: int, opset_version: int) -> None:
+    axes_as_input = opset_version >= 18
+    if operation_type == 'ReduceSum' and opset_version >= 13:
+        axes_as_input = True
+
+    _test_reduce(
+        operation_type=operation_type,
+        input_tensor=np.random.uniform(0.5, 1.5, shape).astype(np.float32),
+        axes=axes,
+        opset_version=opset_version,
+        axes_as_input=axes_as_input,
+        keepdims=keepdims,
+    )
+
+
+@pytest.mark.parametrize('operation_type', ('ReduceSum', 'ReduceMean'))
+def test_reduce_noop_with_empty_axes(operation_type: str) -> None:
+    _test_reduce(
+        operation_type=operation_type,
+        input_tensor=np.random.uniform(0.5, 1.5, (2, 3, 4)).astype(np.float32),
+        axes=None,
+        opset_version=18,
+        axes_as_input=True,
+        noop_with_empty_axes=1,
+    )
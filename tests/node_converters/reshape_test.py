@@ -3,7 +3,11 @@ from typing import List
 import numpy as np
 import onnx
 import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
 
+from onnx2torch.converter import convert
 from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
 
@@ -12,10 +16,15 @@ def _test_reshape(
         input_shape: List[int],
         output_shape: List[int],
         opset_version: int,
+        dynamic_shape: bool = False,
         **kwargs,
 ) -> None:
     test_inputs = {'x': np.random.uniform(low=-1.0, high=1.0, size=input_shape).astype(np.float32)}
-    initializers = {'output_shape': np.asarray(output_shape, dtype=np.int64)}
+    initializers = {}
+    if dynamic_shape:
+        test_inputs['output_shape'] = np.asarray(output_shape, dtype=np.int64)
+    else:
+        initializers['output_shape'] = np.asarray(output_shape, dtype=np.int64)
 
     node = onnx.helper.make_node(
         op_type='Reshape',
@@ -23,10 +32,15 @@ def _test_reshape(
         outputs=['y'],
         **kwargs,
     )
+    outputs_info = None
+    if dynamic_shape:
+        outputs_info = [make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[None] * len(output_shape))]
+
     model = make_model_from_nodes(
         nodes=node,
         initializers=initializers,
         inputs_example=test_inputs,
+        outputs_info=outputs_info,
         opset_version=opset_version,
     )
     check_model(model, test_inputs)
@@ -47,3 +61,54 @@ def test_reshape(input_shape: List[int], output_shape: List[int], opset_version:
         output_shape=output_shape,
         opset_version=opset_version,
     )
+
+
+@pytest.mark.parametrize(
+    'input_shape,output_shape,opset_version',
+    (
+            ([2, 3, 16, 16], [2, 0, -1], 9),
+            ([2, 3, 16, 16], [-1, 1, 1, 2, 1, 1, 1, 2, 1, 1], 14),
+    ),
+)
+def test_reshape_dynamic_shape(input_shape: List[int], output_shape: List[int], opset_version: int) -> None:
+    _test_reshape(
+        input_shape=input_shape,
+        output_shape=output_shape,
+        opset_version=opset_version,
+        dynamic_shape=True,
+    )
+
+
+@pytest.mark.parametrize(
+    'input_shape,output_shape,dynamic_shape',
+    (
+            ([2, 0, 4], [0, 8], False),
+            ([2, 0, 4], [4, 0, 2], False),
+            ([2, 0, 4], [0, 8], True),
+            ([2, 3, 4], [3, -1], False),
+    ),
+)
+def test_reshape_allowzero(input_shape: List[int], output_shape: List[int], dynamic_shape: bool) -> None:
+    _test_reshape(
+        input_shape=input_shape,
+        output_shape=output_shape,
+        opset_version=14,
+        dynamic_shape=dynamic_shape,
+        allowzero=1,
+    )
+
+
+def test_reshape_other_batch_size() -> None:
+    # Shape [0, -1] must not be resolved with input shape declared in the model
+    node = onnx.helper.make_node(op_type='Reshape', inputs=['x', 'output_shape'], outputs=['y'])
+    model = make_model_from_nodes(
+        nodes=node,
+        initializers={'output_shape': np.array([0, -1], dtype=np.int64)},
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[1, 4, 6])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[1, 24])],
+        opset_version=14,
+    )
+    torch_model = convert(model)
+    for batch_size in (1, 2):
+        x = torch.rand(batch_size, 4, 6)
+        assert torch.equal(torch_model(x), x.reshape(batch_size, 24))
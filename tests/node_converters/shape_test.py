@@ -2,9 +2,13 @@ from typing import List
 
 import numpy as np
 import onnx
+import torch
 from onnx.helper import make_tensor_value_info
 from onnx.mapping import NP_TYPE_TO_TENSOR_TYPE
 
+from onnx2torch.converter import convert
+from onnx2torch.node_converters import OnnxShape
+
 from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
 
@@ -39,3 +43,61 @@ def test_shape() -> None:
     _test_shape(input_shape=[2, 3, 16, 16, 16], opset_version=9)
     _test_shape(input_shape=[2, 3, 16, 16], opset_version=9)
     _test_shape(input_shape=[2, 3, 16], opset_version=9)
+
+
+def test_shape_read_on_host() -> None:
+    x = np.random.uniform(low=-1.0, high=1.0, size=[2, 3, 4]).astype(np.float32)
+    test_inputs = {'x': x}
+
+    nodes = [
+        onnx.helper.make_node(op_type='Shape', inputs=['x'], outputs=['shape']),
+        onnx.helper.make_node(op_type='Gather', inputs=['shape', 'index'], outputs=['dim']),
+        onnx.helper.make_node(op_type='Unsqueeze', inputs=['dim', 'axes'], outputs=['dim_1d']),
+        onnx.helper.make_node(op_type='Concat', inputs=['minus_one', 'dim_1d'], outputs=['new_shape'], axis=0),
+        onnx.helper.make_node(op_type='Reshape', inputs=['x', 'new_shape'], outputs=['y']),
+    ]
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers={
+            'index': np.array(2, dtype=np.int64),
+            'axes': np.array([0], dtype=np.int64),
+            'minus_one': np.array([-1], dtype=np.int64),
+        },
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=onnx.TensorProto.FLOAT, shape=[6, 4])],
+        opset_version=13,
+    )
+    check_model(model, test_inputs)
+
+    # Concat mixes shape with other tensors, so shape must stay on input device
+    shape_modules = [module for module in convert(model).modules() if isinstance(module, OnnxShape)]
+    assert len(shape_modules) == 1 and not shape_modules[0].on_host
+
+    nodes[3:] = [onnx.helper.make_node(op_type='Range', inputs=['zero', 'dim', 'one'], outputs=['y'])]
+    model = make_model_from_nodes(
+        nodes=nodes[:2] + nodes[3:],
+        initializers={
+            'index': np.array(2, dtype=np.int64),
+            'zero': np.array(0, dtype=np.int64),
+            'one': np.array(1, dtype=np.int64),
+        },
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=NP_TYPE_TO_TENSOR_TYPE[np.dtype('int64')], shape=None)],
+        opset_version=13,
+    )
+    check_model(model, test_inputs)
+
+    shape_modules = [module for module in convert(model).modules() if isinstance(module, OnnxShape)]
+    assert len(shape_modules) == 1 and shape_modules[0].on_host
+
+
+def test_shape_memoized_output() -> None:
+    shape_module = OnnxShape()
+    x = torch.rand(2, 3, 4)
+    output = shape_module(x)
+    output.zero_()
+
+    # Memoized shape is copied, so modifying output does not change next outputs
+    assert torch.equal(shape_module(x), torch.tensor([2, 3, 4]))
+    assert shape_module(x) is not shape_module(x)
+    assert not shape_module.state_dict() and not hasattr(shape_module, '_cache')
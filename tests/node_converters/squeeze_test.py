@@ -3,6 +3,8 @@ from typing import List
 import numpy as np
 import onnx
 import pytest
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
 
 from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
@@ -12,13 +14,19 @@ def _test_squeeze(
         input_tensor: np.ndarray,
         axes: np.ndarray,
         opset_version: int,
+        dynamic_axes: bool = False,
         **kwargs,
 
 ) -> None:
     test_inputs = {'input_tensor': input_tensor}
     initializers = {}
+    outputs_info = None
 
-    if opset_version >= 13:
+    if dynamic_axes:
+        test_inputs['axes'] = np.asarray(axes).astype(np.int64)
+        output_shape = [None] * (input_tensor.ndim - len(axes))
+        outputs_info = [make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=output_shape)]
+    elif opset_version >= 13:
         initializers['axes'] = np.asarray(axes).astype(np.int64)
     else:
         kwargs['axes'] = axes
@@ -34,6 +42,7 @@ def _test_squeeze(
         nodes=node,
         initializers=initializers,
         inputs_example=test_inputs,
+        outputs_info=outputs_info,
         opset_version=opset_version,
     )
     check_model(model, test_inputs)
@@ -46,9 +55,23 @@ def _test_squeeze(
             ([1, 3, 1, 5], [-2], 11),
             ([1, 3, 4, 5], [0], 13),
             ([1, 3, 1, 5], [-2], 13),
+            ([1, 3, 1, 5], [2, -4], 13),
     ),
 )
 def test_squeeze(shape: List[int], axes: List[int], opset_version: int) -> None:
     x = np.random.randn(*shape).astype(np.float32)
     axes = np.array(axes, dtype=np.int64)
     _test_squeeze(input_tensor=x, axes=axes, opset_version=opset_version)
+
+
+@pytest.mark.parametrize(
+    'shape,axes',
+    (
+            ([1, 3, 4, 5], [0]),
+            ([1, 3, 1, 5], [-2, 0]),
+    ),
+)
+def test_squeeze_dynamic_axes(shape: List[int], axes: List[int]) -> None:
+    x = np.random.randn(*shape).astype(np.float32)
+    axes = np.array(axes, dtype=np.int64)
+    _test_squeeze(input_tensor=x, axes=axes, opset_version=13, dynamic_axes=True)
@@ -11,11 +11,18 @@ def _test_tile(
         data: np.ndarray,
         repeats: np.ndarray,
         desire_out: np.ndarray,
+        constant_repeats: bool = False,
 ) -> None:
-    test_inputs = {'input_tensor': data, 'repeats': repeats}
+    test_inputs = {'input_tensor': data}
+    initializers = {}
+    if constant_repeats:
+        initializers['repeats'] = repeats
+    else:
+        test_inputs['repeats'] = repeats
+
     node = onnx.helper.make_node(
         op_type='Tile',
-        inputs=list(test_inputs),
+        inputs=['input_tensor', 'repeats'],
         outputs=['y'],
     )
     outputs_info = [
@@ -27,7 +34,7 @@ def _test_tile(
     ]
     model = make_model_from_nodes(
         nodes=node,
-        initializers={},
+        initializers=initializers,
         inputs_example=test_inputs,
         outputs_info=outputs_info,
     )
@@ -60,3 +67,15 @@ def test_tile() -> None:
                 [2, 3, 2, 3]
             ], dtype=np.float32),
     )
+
+
+def test_tile_constant_repeats() -> None:
+    # Tiled dims are singleton, output is expand view
+    data = np.random.rand(1, 3, 1, 5).astype(np.float32)
+    repeats = np.array([4, 1, 6, 1], dtype=np.int64)
+    _test_tile(data=data, repeats=repeats, desire_out=np.tile(data, repeats), constant_repeats=True)
+    _test_tile(data=data, repeats=repeats, desire_out=np.tile(data, repeats), constant_repeats=False)
+
+    data = np.random.rand(2, 3, 1, 5).astype(np.float32)
+    repeats = np.array([2, 1, 3, 2], dtype=np.int64)
+    _test_tile(data=data, repeats=repeats, desire_out=np.tile(data, repeats), constant_repeats=True)
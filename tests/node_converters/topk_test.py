@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 import onnx
 from onnx.helper import make_tensor_value_info
@@ -7,12 +9,24 @@ from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
 
 
-def _test_topk(data: np.ndarray, k: np.ndarray, **kwargs) -> None:
-    test_inputs = {'input_tensor': data, 'k': k}
+def _test_topk(
+        data: np.ndarray,
+        k_input: Optional[np.ndarray],
+        constant_k: bool = False,
+        opset_version: int = 11,
+        **kwargs,
+) -> None:
+    test_inputs = {'input_tensor': data}
+    initializers = {}
+    if k_input is not None:
+        if constant_k:
+            initializers['k'] = k_input
+        else:
+            test_inputs['k'] = k_input
 
     node = onnx.helper.make_node(
         op_type='TopK',
-        inputs=list(test_inputs),
+        inputs=['input_tensor', 'k'] if k_input is not None else ['input_tensor'],
         outputs=['y_0', 'y_1'],
         **kwargs,
     )
@@ -22,11 +36,13 @@ def _test_topk(data: np.ndarray, k: np.ndarray, **kwargs) -> None:
     ]
     model = make_model_from_nodes(
         nodes=node,
-        initializers={},
+        initializers=initializers,
         inputs_example=test_inputs,
         outputs_info=outputs_info,
+        opset_version=opset_version,
     )
-    check_model(model, test_inputs)
+    # k passed as model input is read on host, it is data-dependent for torch.compile
+    check_model(model, test_inputs, max_graph_breaks=1 if 'k' in test_inputs else 0)
 
 
 def test_topk() -> None:
@@ -36,6 +52,15 @@ def test_topk() -> None:
         [8, 9, 10, 11],
     ], dtype=np.float32)
 
-    _test_topk(data=x, k=np.array([3], dtype=np.int64), axis=1, largest=1)
-    _test_topk(data=x, k=np.array([3], dtype=np.int64), axis=-1, largest=1)
-    _test_topk( data=x, k=np.array([3], dtype=np.int64), axis=1, largest=1, sorted=1)
+    _test_topk(data=x, k_input=np.array([3], dtype=np.int64), axis=1, largest=1)
+    _test_topk(data=x, k_input=np.array([3], dtype=np.int64), axis=-1, largest=1)
+    _test_topk( data=x, k_input=np.array([3], dtype=np.int64), axis=1, largest=1, sorted=1)
+
+
+def test_topk_constant_k() -> None:
+    x = np.random.permutation(60).reshape([3, 4, 5]).astype(np.float32)
+
+    _test_topk(data=x, k_input=np.array([2], dtype=np.int64), constant_k=True, axis=1, largest=1)
+    _test_topk(data=x, k_input=np.array([2], dtype=np.int64), constant_k=True, axis=-1, largest=0)
+    _test_topk(data=x, k_input=np.array([3], dtype=np.int64), constant_k=True, axis=-3, largest=1, sorted=1)
+    _test_topk(data=x, k_input=None, opset_version=9, axis=-1, k=2)
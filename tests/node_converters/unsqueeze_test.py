@@ -3,6 +3,8 @@ from typing import List
 import numpy as np
 import onnx
 import pytest
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
 
 from tests.utils.common import check_model
 from tests.utils.common import make_model_from_nodes
@@ -12,13 +14,19 @@ def _test_unsqueeze(
         input_shape: List[int],
         axes: List[int],
         opset_version: int,
+        dynamic_axes: bool = False,
         **kwargs,
 ) -> None:
     x = np.random.uniform(low=-1.0, high=1.0, size=input_shape).astype(np.float32)
     test_inputs = {'x': x}
     initializers = {}
+    outputs_info = None
 
-    if opset_version >= 13:
+    if dynamic_axes:
+        test_inputs['axes'] = np.array(axes, dtype=np.int64)
+        output_shape = [None] * (len(input_shape) + len(axes))
+        outputs_info = [make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=output_shape)]
+    elif opset_version >= 13:
         initializers['axes'] = np.array(axes, dtype=np.int64)
     else:
         kwargs['axes'] = axes
@@ -33,6 +41,7 @@ def _test_unsqueeze(
         nodes=node,
         initializers=initializers,
         inputs_example=test_inputs,
+        outputs_info=outputs_info,
         opset_version=opset_version,
     )
 
@@ -51,7 +60,19 @@ def _test_unsqueeze(
             ([2, 3, 16, 16], [0, 1], 13),
             ([2, 3, 16, 16], [1, 5], 13),
             ([2, 3, 16, 16], [1, -3], 13),
+            ([2, 3, 16, 16], [-1, 0], 13),
     ),
 )
 def test_unsqueeze(input_shape: List[int], axes: List[int], opset_version: int) -> None:
     _test_unsqueeze(input_shape=input_shape, axes=axes, opset_version=opset_version)
+
+
+@pytest.mark.parametrize(
+    'input_shape,axes',
+    (
+            ([2, 3, 16, 16], [0, 1]),
+            ([2, 3, 16, 16], [-1, 1]),
+    ),
+)
+def test_unsqueeze_dynamic_axes(input_shape: List[int], axes: List[int]) -> None:
+    _test_unsqueeze(input_shape=input_shape, axes=axes, opset_version=13, dynamic_axes=True)
@@ -0,0 +1,111 @@
+import numpy as np
+import onnx
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.passes import plan_inplace
+from tests.utils.common import make_model_from_nodes
+
+
+def _check_plan(model: onnx.ModelProto, test_inputs, expected_inplace_nodes) -> None:
+    reference_model = convert(model)
+    planned_model = convert(model)
+    assert sorted(plan_inplace(planned_model)) == sorted(expected_inplace_nodes)
+
+    with torch.no_grad():
+        torch_inputs = [torch.tensor(value) for value in test_inputs.values()]
+        reference_output = reference_model(*torch_inputs)
+        planned_output = planned_model(*torch_inputs)
+
+    # Graph inputs must not be overwritten
+    for torch_input, value in zip(torch_inputs, test_inputs.values()):
+        assert np.array_equal(torch_input.numpy(), value)
+
+    assert torch.allclose(reference_output, planned_output)
+
+
+def test_inplace_dead_inputs() -> None:
+    x = np.random.uniform(low=-1.0, high=1.0, size=[2, 3, 4]).astype(np.float32)
+    test_inputs = {'x': x}
+    nodes = [
+        onnx.helper.make_node(op_type='Sigmoid', inputs=['x'], outputs=['a']),
+        onnx.helper.make_node(op_type='Relu', inputs=['a'], outputs=['b']),
+        onnx.helper.make_node(op_type='Add', inputs=['b', 'a'], outputs=['c']),
+        onnx.helper.make_node(op_type='Mul', inputs=['c', 'scale'], outputs=['d']),
+        onnx.helper.make_node(op_type='Sigmoid', inputs=['d'], outputs=['y']),
+    ]
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers={'scale': np.array(0.5, dtype=np.float32)},
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=x.shape)],
+        opset_version=13,
+    )
+    # Sigmoid on graph input and Relu on "a" (used by Add later) must keep their inputs
+    _check_plan(model, test_inputs, expected_inplace_nodes=['Add_0', 'Mul_0', 'Sigmoid_1'])
+
+
+def test_inplace_aliased_inputs() -> None:
+    x = np.random.uniform(low=-1.0, high=1.0, size=[2, 3, 4]).astype(np.float32)
+    test_inputs = {'x': x}
+    nodes = [
+        onnx.helper.make_node(op_type='Sigmoid', inputs=['x'], outputs=['a']),
+        onnx.helper.make_node(op_type='Reshape', inputs=['a', 'shape'], outputs=['a_view']),
+        onnx.helper.make_node(op_type='Relu', inputs=['a'], outputs=['b']),
+        onnx.helper.make_node(op_type='Reshape', inputs=['b', 'shape'], outputs=['b_view']),
+        onnx.helper.make_node(op_type='Add', inputs=['b_view', 'a_view'], outputs=['y']),
+    ]
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers={'shape': np.array([6, 4], dtype=np.int64)},
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[6, 4])],
+        opset_version=13,
+    )
+    # Relu input is alive through Reshape view, Add writes into the view of Relu output
+    _check_plan(model, test_inputs, expected_inplace_nodes=['Add_0'])
+
+
+def test_inplace_broadcast_fallback() -> None:
+    test_inputs = {
+        'x': np.random.uniform(low=-1.0, high=1.0, size=[1, 4]).astype(np.float32),
+        'z': np.random.uniform(low=-1.0, high=1.0, size=[3, 4]).astype(np.float32),
+    }
+    nodes = [
+        onnx.helper.make_node(op_type='Relu', inputs=['x'], outputs=['a']),
+        onnx.helper.make_node(op_type='Add', inputs=['a', 'z'], outputs=['y']),
+    ]
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers={},
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[3, 4])],
+        opset_version=13,
+    )
+    # Add is planned in-place, but lhs is broadcast, so result is computed out-of-place
+    _check_plan(model, test_inputs, expected_inplace_nodes=['Add_0'])
+
+
+def test_inplace_integer_div_fallback() -> None:
+    test_inputs = {
+        'x': np.random.randint(low=-100, high=100, size=[2, 3]).astype(np.int64),
+        'z': np.random.randint(low=1, high=10, size=[2, 3]).astype(np.int64),
+    }
+    nodes = [
+        onnx.helper.make_node(op_type='Add', inputs=['x', 'z'], outputs=['a']),
+        onnx.helper.make_node(op_type='Div', inputs=['a', 'two'], outputs=['b']),
+        onnx.helper.make_node(op_type='Add', inputs=['x', 'z'], outputs=['c']),
+        onnx.helper.make_node(op_type='Div', inputs=['c', 'z'], outputs=['d']),
+        onnx.helper.make_node(op_type='Add', inputs=['b', 'd'], outputs=['y']),
+    ]
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers={'two': np.array(2, dtype=np.int64)},
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.INT64, shape=[2, 3])],
+        opset_version=13,
+    )
+    # Div is planned in-place, but div_ cannot write true division result to integer tensors
+    _check_plan(model, test_inputs, expected_inplace_nodes=['Add_2', 'Div_0', 'Div_1'])
@@ -0,0 +1,63 @@
+import numpy as np
+import onnx
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.passes.memory_format import to_channels_last
+from onnx2torch.passes.memory_format import to_contiguous
+from tests.utils.common import make_model_from_nodes
+
+
+def _make_model() -> onnx.ModelProto:
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='Relu', inputs=['conv'], outputs=['relu']),
+        onnx.helper.make_node(op_type='Add', inputs=['relu', 'conv'], outputs=['add']),
+        onnx.helper.make_node(op_type='MaxPool', inputs=['add'], outputs=['pool'], kernel_shape=[2, 2], strides=[2, 2]),
+        onnx.helper.make_node(op_type='Flatten', inputs=['pool'], outputs=['flat'], axis=1),
+        onnx.helper.make_node(op_type='Gemm', inputs=['flat', 'gemm_weight', 'gemm_bias'], outputs=['y']),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'gemm_weight': np.random.uniform(low=-0.1, high=0.1, size=[4 * 4 * 4, 10]).astype(np.float32),
+        'gemm_bias': np.random.uniform(low=-0.1, high=0.1, size=[10]).astype(np.float32),
+    }
+    return make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 10])],
+        opset_version=13,
+    )
+
+
+def test_channels_last() -> None:
+    model = _make_model()
+    x = torch.rand(2, 3, 8, 8)
+
+    reference_output = convert(model)(x)
+    torch_model = convert(model, channels_last=True)
+    output = torch_model(x)
+
+    assert torch.allclose(output, reference_output, atol=1e-5)
+    assert torch_model.get_submodule('Conv_0').weight.is_contiguous(memory_format=torch.channels_last)
+
+    # Format is converted once on graph input and once before Flatten
+    conversions = {
+        node.args[0].target: node.target for node in torch_model.graph.nodes if node.op == 'call_function'
+    }
+    assert conversions == {'x': to_channels_last, 'MaxPool_0': to_contiguous}
+
+
+def test_channels_last_graph_output() -> None:
+    node = onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['y'])
+    model = make_model_from_nodes(
+        nodes=node,
+        initializers={'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32)},
+        inputs_example={'x': np.random.rand(1, 3, 8, 8).astype(np.float32)},
+    )
+
+    output = convert(model, channels_last=True)(torch.rand(1, 3, 8, 8))
+    assert output.is_contiguous()
@@ -0,0 +1,74 @@
+import numpy as np
+import onnx
+import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from tests.utils.common import make_model_from_nodes
+
+
+def _make_model() -> onnx.ModelProto:
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='Relu', inputs=['conv'], outputs=['relu']),
+        onnx.helper.make_node(op_type='Shape', inputs=['relu'], outputs=['shape']),
+        onnx.helper.make_node(op_type='Slice', inputs=['shape', 'starts', 'ends'], outputs=['batch']),
+        onnx.helper.make_node(op_type='Concat', inputs=['batch', 'minus_one'], outputs=['new_shape'], axis=0),
+        onnx.helper.make_node(op_type='Reshape', inputs=['relu', 'new_shape'], outputs=['flat']),
+        onnx.helper.make_node(op_type='Gemm', inputs=['flat', 'gemm_weight', 'gemm_bias'], outputs=['gemm']),
+        onnx.helper.make_node(op_type='Cast', inputs=['gemm'], outputs=['gemm_float'], to=TensorProto.FLOAT),
+        onnx.helper.make_node(op_type='Softmax', inputs=['gemm_float'], outputs=['y'], axis=-1),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'starts': np.array([0], dtype=np.int64),
+        'ends': np.array([1], dtype=np.int64),
+        'minus_one': np.array([-1], dtype=np.int64),
+        'gemm_weight': np.random.uniform(low=-0.1, high=0.1, size=[4 * 8 * 8, 10]).astype(np.float32),
+        'gemm_bias': np.random.uniform(low=-0.1, high=0.1, size=[10]).astype(np.float32),
+    }
+    return make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 10])],
+        opset_version=13,
+    )
+
+
+@pytest.mark.parametrize('precision,dtype', (('bf16', torch.bfloat16), ('fp16', torch.float16)))
+def test_reduced_precision(precision: str, dtype: torch.dtype) -> None:
+    model = _make_model()
+    x = torch.rand(2, 3, 8, 8)
+
+    reference_output = convert(model)(x)
+    torch_model = convert(model, precision=precision)
+    output = torch_model(x)
+
+    assert output.dtype == torch.float32
+    assert torch.allclose(output, reference_output, atol=1e-2)
+
+    assert torch_model.get_submodule('Conv_0').weight.dtype == dtype
+    assert torch_model.get_submodule('Gemm_0').weight.dtype == dtype
+    assert torch_model.get_submodule('Cast_0').torch_dtype == dtype
+    assert torch_model.initializers.minus_one.dtype == torch.int64
+
+
+def test_reduced_precision_fp32_operations() -> None:
+    model = _make_model()
+    torch_model = convert(model, precision='bf16', fp32_operations=('Gemm', 'Cast', 'Softmax'))
+
+    assert torch_model.get_submodule('Conv_0').weight.dtype == torch.bfloat16
+    assert torch_model.get_submodule('Gemm_0').weight.dtype == torch.float32
+
+    # Graph tail runs in fp32, so only graph input and input of Gemm are cast
+    cast_nodes = [node for node in torch_model.graph.nodes if node.op == 'call_function']
+    assert len(cast_nodes) == 2
+    assert torch_model(torch.rand(2, 3, 8, 8)).dtype == torch.float32
+
+
+def test_unexpected_precision() -> None:
+    with pytest.raises(ValueError):
+        convert(_make_model(), precision='int8')
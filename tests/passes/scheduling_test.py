@@ -0,0 +1,46 @@
+import numpy as np
+import onnx
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.passes import schedule_for_memory
+from tests.utils.common import make_model_from_nodes
+
+
+def test_schedule_for_memory() -> None:
+    x = np.random.uniform(low=-1.0, high=1.0, size=[1, 256]).astype(np.float32)
+    test_inputs = {'x': x}
+
+    # Both wide branches are computed before their reductions in the original order
+    nodes = [
+        onnx.helper.make_node(op_type='Concat', inputs=['x'] * 4, outputs=['wide_0'], axis=0),
+        onnx.helper.make_node(op_type='Concat', inputs=['x'] * 4, outputs=['wide_1'], axis=1),
+        onnx.helper.make_node(op_type='ReduceSum', inputs=['wide_0', 'axes'], outputs=['sum_0'], keepdims=0),
+        onnx.helper.make_node(op_type='ReduceSum', inputs=['wide_1', 'axes'], outputs=['sum_1'], keepdims=0),
+        onnx.helper.make_node(op_type='Add', inputs=['sum_0', 'sum_1'], outputs=['y']),
+    ]
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers={'axes': np.array([0, 1], dtype=np.int64)},
+        inputs_example=test_inputs,
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[])],
+        opset_version=13,
+    )
+
+    torch_model = convert(model)
+    reference_output = torch_model(torch.tensor(x))
+
+    result = schedule_for_memory(torch_model, model)
+    wide_bytes = 4 * x.nbytes
+    assert result.original_peak_bytes >= 2 * wide_bytes
+    assert result.peak_bytes < result.original_peak_bytes
+    assert result.peak_bytes < wide_bytes + 16
+
+    call_order = [node.target for node in torch_model.graph.nodes if node.op == 'call_module']
+    assert call_order.index('ReduceSum_0') < call_order.index('Concat_1')
+    assert torch.allclose(torch_model(torch.tensor(x)), reference_output)
+
+    # Already optimal order is kept
+    assert schedule_for_memory(torch_model, model).peak_bytes == result.peak_bytes
@@ -0,0 +1,68 @@
+import numpy as np
+import onnx
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.node_converters.shape import OnnxShape
+from tests.utils.common import make_model_from_nodes
+
+
+def _make_model() -> onnx.ModelProto:
+    # y = x.reshape(-1, x.shape[2]), z = arange(x.shape[2]) * 2, shape of x is also graph output
+    nodes = [
+        onnx.helper.make_node(op_type='Shape', inputs=['x'], outputs=['shape']),
+        onnx.helper.make_node(op_type='Gather', inputs=['shape', 'index'], outputs=['dim']),
+        onnx.helper.make_node(op_type='Unsqueeze', inputs=['dim', 'axes'], outputs=['dim_1d']),
+        onnx.helper.make_node(op_type='Concat', inputs=['minus_one', 'dim_1d'], outputs=['new_shape'], axis=0),
+        onnx.helper.make_node(op_type='Reshape', inputs=['x', 'new_shape'], outputs=['y']),
+        onnx.helper.make_node(op_type='Mul', inputs=['dim', 'two'], outputs=['limit']),
+        onnx.helper.make_node(op_type='Range', inputs=['zero', 'limit', 'two'], outputs=['z']),
+    ]
+    return make_model_from_nodes(
+        nodes=nodes,
+        initializers={
+            'index': np.array(2, dtype=np.int64),
+            'axes': np.array([0], dtype=np.int64),
+            'minus_one': np.array([-1], dtype=np.int64),
+            'zero': np.array(0, dtype=np.int64),
+            'two': np.array(2, dtype=np.int64),
+        },
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 4])],
+        outputs_info=[
+            make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[6, 4]),
+            make_tensor_value_info(name='z', elem_type=TensorProto.INT64, shape=[4]),
+            make_tensor_value_info(name='shape', elem_type=TensorProto.INT64, shape=[3]),
+        ],
+        opset_version=13,
+    )
+
+
+def test_compute_shapes_in_python() -> None:
+    model = _make_model()
+    reference_model = convert(model)
+    torch_model = convert(model, compile_friendly=True)
+
+    # Only Reshape and Range are left as modules, shapes are computed by Python functions
+    assert not any(isinstance(module, OnnxShape) for module in torch_model.modules())
+    assert [node.target for node in torch_model.graph.nodes if node.op == 'call_module'] == ['Reshape_0', 'Range_0']
+
+    # Shapes are not specialized during conversion
+    for x in (torch.rand(2, 3, 4), torch.rand(3, 5, 6)):
+        for output, reference_output in zip(torch_model(x), reference_model(x)):
+            assert output.dtype == reference_output.dtype
+            assert torch.equal(output, reference_output)
+
+
+def test_compute_shapes_in_python_compile() -> None:
+    torch_model = convert(_make_model(), compile_friendly=True)
+    x = torch.rand(2, 3, 4)
+
+    torch._dynamo.reset()  # pylint: disable=protected-access
+    explanation = torch._dynamo.explain(torch_model)(x)  # pylint: disable=protected-access
+    assert explanation.graph_break_count == 0
+
+    compiled_model = torch.compile(torch_model, backend='eager', fullgraph=True)
+    for output, reference_output in zip(compiled_model(x), torch_model(x)):
+        assert torch.equal(output, reference_output)
@@ -0,0 +1,130 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import onnx
+import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.profiler import LiveTensor
+from onnx2torch.profiler import MemoryProfiler
+from onnx2torch.profiler import NodeProfiler
+from tests.utils.common import make_model_from_nodes
+
+
+def _make_model() -> onnx.ModelProto:
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='Relu', inputs=['conv'], outputs=['relu']),
+        onnx.helper.make_node(op_type='TopK', inputs=['relu', 'k'], outputs=['values', 'indices'], axis=1),
+        onnx.helper.make_node(op_type='Add', inputs=['values', 'conv'], outputs=['add']),
+        onnx.helper.make_node(op_type='Relu', inputs=['add'], outputs=['y']),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'k': np.array([4], dtype=np.int64),
+    }
+    return make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 4, 8, 8])],
+        opset_version=13,
+    )
+
+
+def test_node_profiler(tmp_path: Path) -> None:
+    torch_model = convert(_make_model(), attach_onnx_mapping=True)
+    profiler = NodeProfiler(torch_model)
+    x = torch.rand(2, 3, 8, 8)
+    for _ in range(3):
+        assert torch.equal(profiler(x), torch_model(x))
+
+    profiles = {profile.name: profile for profile in profiler.profiles()}
+    assert {'Conv_0', 'Relu_0', 'TopK_0', 'Add_0', 'Relu_1'} <= set(profiles)
+    assert all(profile.calls == 3 for profile in profiles.values())
+
+    conv = profiles['Conv_0']
+    assert conv.operation_type == 'Conv'
+    assert conv.onnx_mapping.inputs == ('x',)
+    assert conv.onnx_mapping.outputs == ('conv',)
+    assert conv.output_bytes == 3 * 2 * 4 * 8 * 8 * 4
+
+    relu = {profile.operation_type: profile for profile in profiler.operation_type_profiles()}['Relu']
+    assert relu.name == '2'
+    assert relu.calls == 6
+    assert relu.total_time_ns == profiles['Relu_0'].total_time_ns + profiles['Relu_1'].total_time_ns
+
+    table = profiler.table(limit=2).splitlines()
+    assert len(table) == 4
+    assert 'Conv' in profiler.table(group_by_operation_type=True)
+
+    profiler.export_chrome_trace(tmp_path / 'trace.json')
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    assert len(events) == 3 * len(profiles)
+    add = next(event for event in events if event['name'] == 'Add_0')
+    assert add['ph'] == 'X'
+    assert add['args']['onnx_inputs'] == ['values', 'conv']
+
+    profiler.reset()
+    assert not profiler.profiles()
+    assert not profiler.chrome_trace()['traceEvents']
+
+
+def test_node_profiler_max_trace_events() -> None:
+    profiler = NodeProfiler(convert(_make_model()), max_trace_events=4)
+    profiler(torch.rand(2, 3, 8, 8))
+    assert len(profiler.chrome_trace()['traceEvents']) == 4
+    assert profiler.profiles()[0].onnx_mapping is None
+
+
+def test_node_profiler_scripted_model() -> None:
+    with pytest.raises(TypeError):
+        NodeProfiler(convert(_make_model(), scriptable=True))
+
+
+def test_memory_profiler() -> None:
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='Reshape', inputs=['conv', 'shape'], outputs=['reshape']),
+        onnx.helper.make_node(op_type='Relu', inputs=['reshape'], outputs=['relu']),
+        onnx.helper.make_node(op_type='TopK', inputs=['relu', 'k'], outputs=['values', 'indices'], axis=1),
+        onnx.helper.make_node(op_type='Add', inputs=['values', 'values'], outputs=['y']),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'shape': np.array([2, -1], dtype=np.int64),
+        'k': np.array([4], dtype=np.int64),
+    }
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 4])],
+        opset_version=13,
+    )
+    torch_model = convert(model, attach_onnx_mapping=True)
+    profiler = MemoryProfiler(torch_model)
+    x = torch.rand(2, 3, 8, 8)
+    with torch.no_grad():
+        assert torch.equal(profiler(x), torch_model(x))
+        profiler(x)  # Results of the previous run are replaced
+
+    nodes_memory = {node.name: node for node in profiler.nodes()}
+    assert nodes_memory['x'].allocated_bytes == 2 * 3 * 8 * 8 * 4
+    assert nodes_memory['Conv_0'].live_bytes == 2 * 3 * 8 * 8 * 4 + 2 * 4 * 8 * 8 * 4
+    assert nodes_memory['Reshape_0'].allocated_bytes == 0  # View of Conv output
+    assert nodes_memory['TopK_0'].allocated_bytes == 2 * 4 * 4 + 2 * 4 * 8
+    assert nodes_memory['Add_0'].live_bytes == 2 * 2 * 4 * 4  # Values of TopK and output
+
+    peak = profiler.peak()
+    assert peak.name == 'Relu_0'
+    assert peak.live_bytes == 2 * 2 * 4 * 8 * 8 * 4
+    assert set(profiler.live_tensors_at_peak()) == {
+        LiveTensor(name='Conv_0', operation_type='Conv', output_name='conv', num_bytes=2 * 4 * 8 * 8 * 4),
+        LiveTensor(name='Relu_0', operation_type='Relu', output_name='relu', num_bytes=2 * 4 * 8 * 8 * 4),
+    }
+    assert 'Relu_0' in profiler.table()
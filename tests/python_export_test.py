@@ -0,0 +1,100 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import onnx
+import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.python_export import export_python
+from tests.utils.common import make_model_from_nodes
+
+# Loads exported model in a new interpreter where onnx and onnx2torch cannot be imported
+_LOAD_SCRIPT = '''
+import sys
+sys.modules['onnx'] = None
+sys.modules['onnx2torch'] = None
+sys.path.insert(0, sys.argv[1])
+
+import torch
+from model import load_model
+
+model = load_model()
+outputs = model(*torch.load(sys.argv[2]))
+torch.save(outputs, sys.argv[3])
+'''
+
+
+def _make_model() -> onnx.ModelProto:
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='Mul', inputs=['conv', 'scale'], outputs=['mul']),
+        onnx.helper.make_node(op_type='Shape', inputs=['mul'], outputs=['shape']),
+        onnx.helper.make_node(op_type='Gather', inputs=['shape', 'index'], outputs=['batch_size']),
+        onnx.helper.make_node(op_type='Unsqueeze', inputs=['batch_size', 'axes'], outputs=['batch_size_1d']),
+        onnx.helper.make_node(op_type='Concat', inputs=['batch_size_1d', 'minus_one'], outputs=['new_shape'], axis=0),
+        onnx.helper.make_node(op_type='Reshape', inputs=['mul', 'new_shape'], outputs=['y']),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'scale': np.random.uniform(low=-0.5, high=0.5, size=[1, 4, 1, 1]).astype(np.float32),
+        'index': np.array(0, dtype=np.int64),
+        'axes': np.array([0], dtype=np.int64),
+        'minus_one': np.array([-1], dtype=np.int64),
+    }
+    return make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[
+            make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 256]),
+            make_tensor_value_info(name='shape', elem_type=TensorProto.INT64, shape=[4]),
+        ],
+        opset_version=13,
+    )
+
+
+@pytest.mark.parametrize(
+    'convert_kwargs',
+    (
+        {},
+        {'compile_friendly': True},
+        {'channels_last': True},
+        {'precision': 'bf16'},
+        {'attach_onnx_mapping': True},
+    ),
+)
+def test_export_python(tmp_path: Path, convert_kwargs: dict) -> None:
+    torch_model = convert(_make_model(), **convert_kwargs)
+    inputs = (torch.rand(2, 3, 8, 8),)
+    # Model is exported after forward, so runtime state of modules (e.g. memoized shapes) is not empty
+    reference_outputs = torch_model(*inputs)
+
+    python_path = export_python(torch_model, tmp_path / 'exported')
+    assert python_path == tmp_path / 'exported' / 'model.py'
+    assert 'import onnx\n' not in python_path.read_text()
+    with python_path.with_suffix('.safetensors').open('rb') as weights_file:
+        header_size = int.from_bytes(weights_file.read(8), 'little')
+        # Memoized tensors are runtime state, they are not saved
+        assert not any('_cache' in name for name in json.loads(weights_file.read(header_size)))
+
+    torch.save(inputs, tmp_path / 'inputs.pt')
+    subprocess.run(
+        [sys.executable, '-c', _LOAD_SCRIPT, str(python_path.parent), tmp_path / 'inputs.pt', tmp_path / 'outputs.pt'],
+        check=True,
+    )
+
+    outputs = torch.load(tmp_path / 'outputs.pt')
+    for output, reference_output in zip(outputs, reference_outputs):
+        assert output.dtype == reference_output.dtype
+        assert torch.equal(output, reference_output)
+
+
+def test_export_python_scripted_model(tmp_path: Path) -> None:
+    with pytest.raises(TypeError):
+        export_python(convert(_make_model(), scriptable=True), tmp_path)
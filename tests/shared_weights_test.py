@@ -0,0 +1,71 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+import onnx
+import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.shared_weights import attach_shared_weights
+from onnx2torch.shared_weights import load_shared_model
+from onnx2torch.shared_weights import save_shared_weights
+from onnx2torch.shared_weights import share_weights
+from tests.utils.common import make_model_from_nodes
+
+
+def _make_model() -> onnx.ModelProto:
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='Mul', inputs=['conv', 'scale'], outputs=['mul']),
+        onnx.helper.make_node(op_type='Reshape', inputs=['mul', 'shape'], outputs=['y']),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'scale': np.random.uniform(low=-0.5, high=0.5, size=[1, 4, 1, 1]).astype(np.float32),
+        'shape': np.array([2, -1], dtype=np.int64),
+    }
+    return make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 256])],
+        opset_version=13,
+    )
+
+
+@pytest.mark.parametrize('channels_last', (False, True))
+def test_shared_weights(tmp_path: Path, channels_last: bool) -> None:
+    model = _make_model()
+    x = torch.rand(2, 3, 8, 8)
+
+    torch_model = convert(model, channels_last=channels_last)
+    reference_output = torch_model(x)
+    shared_weights = pickle.loads(pickle.dumps(save_shared_weights(torch_model, tmp_path / 'weights.bin')))
+    assert set(shared_weights.tensors) == {'Conv_0.weight', 'initializers.scale'}
+
+    attached_model = convert(model, channels_last=channels_last)
+    attach_shared_weights(attached_model, shared_weights)
+    loaded_model = load_shared_model(shared_weights)
+
+    loaded_weight = loaded_model.get_submodule('Conv_0').weight
+    assert isinstance(loaded_weight, torch.nn.Parameter)
+    assert loaded_weight.data_ptr() != torch_model.get_submodule('Conv_0').weight.data_ptr()
+
+    for torch_module in (torch_model, attached_model, loaded_model):
+        assert torch.equal(torch_module(x), reference_output)
+        weight = torch_module.get_submodule('Conv_0').weight
+        assert weight.is_contiguous(memory_format=torch.channels_last if channels_last else torch.contiguous_format)
+
+
+def test_shared_weights_mismatch(tmp_path: Path) -> None:
+    shared_weights = save_shared_weights(convert(_make_model()), tmp_path / 'weights.bin')
+    with pytest.raises(ValueError):
+        attach_shared_weights(convert(_make_model(), precision='fp16'), shared_weights)
+
+
+def test_share_weights() -> None:
+    torch_model = share_weights(convert(_make_model()))
+    assert all(tensor.is_shared() for tensor in torch_model.state_dict().values())
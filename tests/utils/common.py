@@ -1,4 +1,5 @@
 import io
+import time
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -41,6 +42,9 @@ def make_model_from_nodes(
     if inputs_info is None and inputs_example is None:
         raise ValueError('inputs_example or inputs_info must be set')
 
+    if isinstance(nodes, NodeProto):
+        nodes = (nodes,)
+
     if inputs_info is None:
         inputs_info = []
         for name, data in inputs_example.items():
@@ -50,12 +54,12 @@ def make_model_from_nodes(
     if outputs_info is None:
         outputs_info = []
         elem_type = inputs_info[0].type.tensor_type.elem_type
-        for name in tuple(nodes.output):
+        for name in tuple(nodes[-1].output):
             output_proto = make_tensor_value_info(name=name, elem_type=elem_type, shape=None)
             outputs_info.append(output_proto)
 
     graph_proto = make_graph(
-        nodes=(nodes,),
+        nodes=nodes,
         name='test_graph',
         inputs=inputs_info,
         outputs=outputs_info,
@@ -126,9 +130,37 @@ def convert_onnx_inputs_to_torch_inputs(
     ]
 
 
-def calc_ort_outputs(model: ModelProto, inputs: Dict[str, Any], skip_unused_inputs: bool = False) -> List[Any]:
+def _run_repeatedly(function: Callable[[], Any], warmup: int, repeats: int, latencies: Optional[List[float]]) -> Any:
+    """Call function warmup + repeats times, returns the last output and appends latencies (seconds) of repeats."""
+    for _ in range(warmup):
+        function()
+
+    outputs = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        outputs = function()
+        if latencies is not None:
+            latencies.append(time.perf_counter() - start)
+
+    return outputs
+
+
+def calc_ort_outputs(
+        model: ModelProto,
+        inputs: Dict[str, Any],
+        skip_unused_inputs: bool = False,
+        num_threads: Optional[int] = None,
+        warmup: int = 0,
+        repeats: int = 1,
+        latencies: Optional[List[float]] = None,
+) -> List[Any]:
+    session_options = ort.SessionOptions()
+    if num_threads is not None:
+        session_options.intra_op_num_threads = num_threads
+
     ort_session = ort.InferenceSession(
         model.SerializeToString(),
+        sess_options=session_options,
         providers=['CPUExecutionProvider'],
     )
 
@@ -139,22 +171,52 @@ def calc_ort_outputs(model: ModelProto, inputs: Dict[str, Any], skip_unused_inpu
             if k in graph_inputs
         }
 
-    outputs = ort_session.run(
-        output_names=None,
-        input_feed=inputs,
+    outputs = _run_repeatedly(
+        lambda: ort_session.run(output_names=None, input_feed=inputs),
+        warmup=warmup,
+        repeats=repeats,
+        latencies=latencies,
     )
 
     return outputs
 
 
-def calc_torch_outputs(model: ModelProto, inputs: Dict[str, Any], device: str = 'cpu') -> Any:
+def calc_torch_outputs(
+        model: ModelProto,
+        inputs: Dict[str, Any],
+        device: str = 'cpu',
+        scriptable: bool = False,
+        compile_friendly: bool = False,
+        warmup: int = 0,
+        repeats: int = 1,
+        latencies: Optional[List[float]] = None,
+) -> Any:
     inputs = convert_onnx_inputs_to_torch_inputs(onnx_model=model, onnx_inputs=inputs, device=device)
-    model = convert(model).to(device=device)
-    outputs = model(*inputs)
+    model = convert(model, scriptable=scriptable, compile_friendly=compile_friendly).to(device=device)
+
+    def forward():
+        outputs = model(*inputs)
+        if device != 'cpu':
+            torch.cuda.synchronize()
+
+        return outputs
+
+    outputs = _run_repeatedly(forward, warmup=warmup, repeats=repeats, latencies=latencies)
 
     return convert_data_torch2onnx(outputs)
 
 
+def calc_torch_compile_graph_breaks(model: ModelProto, inputs: Dict[str, Any]) -> int:
+    inputs = convert_onnx_inputs_to_torch_inputs(onnx_model=model, onnx_inputs=inputs)
+    model = convert(model, compile_friendly=True)
+
+    torch._dynamo.reset()  # pylint: disable=protected-access
+    explanation = torch._dynamo.explain(model)(*inputs)  # pylint: disable=protected-access
+
+    # Models without inputs are not traced at all
+    return max(explanation.graph_break_count, 0)
+
+
 def calc_torch_and_ort_outputs(
         model: ModelProto,
         test_inputs: Dict[str, np.ndarray],
@@ -195,12 +257,24 @@ def _check_model(
         onnx_torch_check_function: Callable,
         torch_cpu_cuda_check_function: Optional[Callable] = None,
         onnx_torch2onnx_check_function: Optional[Callable] = None,
+        max_graph_breaks: Optional[int] = 0,
 ) -> None:
     ort_outputs = calc_ort_outputs(onnx_model, onnx_inputs)
     torch_outputs = calc_torch_outputs(onnx_model, onnx_inputs, device='cpu')
 
     onnx_torch_check_function(ort_outputs, torch_outputs)
 
+    torch_script_outputs = calc_torch_outputs(onnx_model, onnx_inputs, device='cpu', scriptable=True)
+    onnx_torch_check_function(ort_outputs, torch_script_outputs)
+
+    torch_compile_friendly_outputs = calc_torch_outputs(onnx_model, onnx_inputs, device='cpu', compile_friendly=True)
+    onnx_torch_check_function(ort_outputs, torch_compile_friendly_outputs)
+
+    # torch.compile is available since torch 2.0
+    if max_graph_breaks is not None and hasattr(torch, 'compile'):
+        graph_breaks = calc_torch_compile_graph_breaks(onnx_model, onnx_inputs)
+        assert graph_breaks <= max_graph_breaks, f'torch.compile has {graph_breaks} graph breaks'
+
     if torch_cpu_cuda_check_function is not None:
         torch_cuda_outputs = calc_torch_outputs(onnx_model, onnx_inputs, device='cuda')
         torch_cpu_cuda_check_function(torch_outputs, torch_cuda_outputs)
@@ -217,6 +291,7 @@ def check_model(
         atol_onnx_torch: float = 0.0,
         atol_torch_cpu_cuda: float = 0.0,
         atol_onnx_torch2onnx: float = 0.0,
+        max_graph_breaks: Optional[int] = 0,
 ) -> None:
     def onnx_torch_check_function(onnx_output, torch_output):
         if len(onnx_output) == 1:
@@ -249,4 +324,5 @@ def check_model(
         onnx_torch_check_function=onnx_torch_check_function,
         torch_cpu_cuda_check_function=torch_cpu_cuda_check_function,
         onnx_torch2onnx_check_function=onnx_torch2onnx_check_function,
+        max_graph_breaks=max_graph_breaks,
     )
\ No newline at end of file
@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import numpy as np
+import onnx
+import pytest
+import torch
+from onnx import TensorProto
+from onnx.helper import make_tensor_value_info
+
+from onnx2torch.converter import convert
+from onnx2torch.weight_arena import load_packed_weights
+from onnx2torch.weight_arena import move_packed_weights
+from onnx2torch.weight_arena import pack_weights
+from onnx2torch.weight_arena import save_packed_weights
+from tests.utils.common import make_model_from_nodes
+
+
+def _make_model() -> onnx.ModelProto:
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='Mul', inputs=['conv', 'scale'], outputs=['mul']),
+        onnx.helper.make_node(op_type='Reshape', inputs=['mul', 'shape'], outputs=['y']),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'scale': np.random.uniform(low=-0.5, high=0.5, size=[1, 4, 1, 1]).astype(np.float32),
+        'shape': np.array([2, -1], dtype=np.int64),
+    }
+    return make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 256])],
+        opset_version=13,
+    )
+
+
+def _storages(module: torch.nn.Module) -> set:
+    tensors = list(module.parameters()) + list(module.buffers())
+    return {tensor.untyped_storage().data_ptr() for tensor in tensors}
+
+
+def _dtypes(module: torch.nn.Module) -> set:
+    return {tensor.dtype for tensor in list(module.parameters()) + list(module.buffers())}
+
+
+@pytest.mark.parametrize(
+    'convert_kwargs',
+    (
+        {},
+        {'channels_last': True},
+        {'precision': 'fp16'},
+        {'scriptable': True},
+    ),
+)
+def test_weight_arena(convert_kwargs: dict) -> None:
+    model = _make_model()
+    x = torch.rand(2, 3, 8, 8)
+    torch_model = convert(model, **convert_kwargs)
+    packed_model = convert(model, weight_arena=True, **convert_kwargs)
+
+    assert len(_storages(packed_model)) == len(_dtypes(packed_model))
+    for tensor in list(packed_model.parameters()) + list(packed_model.buffers()):
+        assert tensor.data_ptr() % 64 == 0
+
+    weight = getattr(packed_model, 'Conv_0').weight
+    assert isinstance(weight, torch.nn.Parameter)
+    assert weight.stride() == getattr(torch_model, 'Conv_0').weight.stride()
+    assert torch.equal(packed_model(x), torch_model(x))
+
+
+@pytest.mark.parametrize('mmap', (False, True))
+def test_save_load_packed_weights(tmp_path: Path, mmap: bool) -> None:
+    model = _make_model()
+    x = torch.rand(2, 3, 8, 8)
+    torch_model = convert(model, weight_arena=True)
+    save_packed_weights(torch_model, tmp_path / 'weights.bin')
+
+    # Weights of the model converted from another onnx model with the same structure are replaced
+    loaded_model = load_packed_weights(convert(_make_model(), weight_arena=True), tmp_path / 'weights.bin', mmap=mmap)
+    assert len(_storages(loaded_model)) == len(_dtypes(loaded_model))
+    assert torch.equal(loaded_model(x), torch_model(x))
+
+
+def test_move_packed_weights() -> None:
+    torch_model = convert(_make_model(), weight_arena=True)
+    move_packed_weights(torch_model, 'meta')
+    assert all(tensor.device == torch.device('meta') for tensor in torch_model.parameters())
+    assert len(_storages(torch_model)) == len(_dtypes(torch_model))
+
+
+def test_not_packed_weights(tmp_path: Path) -> None:
+    torch_model = convert(_make_model())
+    with pytest.raises(ValueError):
+        save_packed_weights(torch_model, tmp_path / 'weights.bin')
+
+    arenas = pack_weights(torch_model)
+    assert len(_storages(torch_model)) == len(arenas) == len(_dtypes(torch_model))
+    assert all(arena.dtype == torch.uint8 for arena in arenas)
+
+
+def test_torch_save_packed_weights(tmp_path: Path) -> None:
+    # BatchNormalization has int64 num_batches_tracked buffer, it is packed separately from float weights
+    nodes = [
+        onnx.helper.make_node(op_type='Conv', inputs=['x', 'conv_weight'], outputs=['conv'], pads=[1, 1, 1, 1]),
+        onnx.helper.make_node(op_type='BatchNormalization', inputs=['conv', 'scale', 'bias', 'mean', 'var'],
+                              outputs=['y']),
+    ]
+    initializers = {
+        'conv_weight': np.random.uniform(low=-0.5, high=0.5, size=[4, 3, 3, 3]).astype(np.float32),
+        'scale': np.random.uniform(low=0.5, high=1.5, size=[4]).astype(np.float32),
+        'bias': np.random.uniform(low=-0.5, high=0.5, size=[4]).astype(np.float32),
+        'mean': np.random.uniform(low=-0.5, high=0.5, size=[4]).astype(np.float32),
+        'var': np.random.uniform(low=0.5, high=1.5, size=[4]).astype(np.float32),
+    }
+    model = make_model_from_nodes(
+        nodes=nodes,
+        initializers=initializers,
+        inputs_info=[make_tensor_value_info(name='x', elem_type=TensorProto.FLOAT, shape=[2, 3, 8, 8])],
+        outputs_info=[make_tensor_value_info(name='y', elem_type=TensorProto.FLOAT, shape=[2, 4, 8, 8])],
+        opset_version=13,
+    )
+    x = torch.rand(2, 3, 8, 8)
+    torch_model = convert(model, weight_arena=True).eval()
+    assert _dtypes(torch_model) == {torch.float32, torch.int64}
+
+    torch.save(torch_model.state_dict(), tmp_path / 'state_dict.pt')
+    torch.save(torch_model, tmp_path / 'model.pt')
+    loaded_model = convert(model).eval()
+    loaded_model.load_state_dict(torch.load(tmp_path / 'state_dict.pt'))
+    assert torch.equal(loaded_model(x), torch_model(x))
+    assert torch.equal(torch.load(tmp_path / 'model.pt', weights_only=False)(x), torch_model(x))
+
+    save_packed_weights(torch_model, tmp_path / 'weights.bin')
+    for mmap in (False, True):
+        packed_model = convert(model, weight_arena=True).eval()
+        load_packed_weights(packed_model, tmp_path / 'weights.bin', mmap=mmap)
+        assert len(_storages(packed_model)) == 2
+        assert torch.equal(packed_model(x), torch_model(x))